@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+#
+#  bench_groupby.py
+"""
+Benchmark groupby aggregations on a celsius column against an equivalent float64 column.
+
+The celsius column is aggregated by pandas' Cython routines on pandas 1.2 and on pandas 2.1 and later.
+pandas 1.3 to 2.0 aggregate each group in Python instead, which is several times slower.
+
+Run with ``python benchmarks/bench_groupby.py``.
+"""
+
+# stdlib
+import timeit
+
+# 3rd party
+import numpy  # type: ignore
+import pandas  # type: ignore
+
+# this package
+from si_unit_pandas import TemperatureArray
+
+N_ROWS = 200_000
+N_GROUPS = 1000
+REPEAT = 5
+
+
+def main():
+	rng = numpy.random.default_rng(0)
+	values = rng.normal(20, 5, N_ROWS)
+	values[::97] = numpy.nan
+
+	df = pandas.DataFrame({
+			"key": rng.integers(0, N_GROUPS, N_ROWS),
+			"celsius": TemperatureArray(values),
+			"float64": values,
+			})
+	grouped = df.groupby("key")
+
+	print(f"{N_ROWS} rows, {N_GROUPS} groups, best of {REPEAT}")
+	print(f"{'how':<8} {'celsius':>10} {'float64':>10} {'ratio':>8}")
+
+	for how in ["sum", "mean", "median", "min", "max", "first", "last", "count"]:
+		timings = []
+		for column in ["celsius", "float64"]:
+			func = getattr(grouped[column], how)
+			timings.append(min(timeit.repeat(func, number=1, repeat=REPEAT)))
+
+		print(f"{how:<8} {timings[0]:>9.4f}s {timings[1]:>9.4f}s {timings[0] / timings[1]:>7.1f}x")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+#
+#  bench_io.py
+"""
+Benchmark writing and reading a celsius column to and from Parquet and Feather,
+against an equivalent float64 column.
+
+Run with ``python benchmarks/bench_io.py``. Requires :mod:`pyarrow`.
+"""
+
+# stdlib
+import os
+import tempfile
+import timeit
+
+# 3rd party
+import numpy  # type: ignore
+import pandas  # type: ignore
+
+# this package
+from si_unit_pandas import TemperatureArray
+
+N_ROWS = 5_000_000
+REPEAT = 3
+
+
+def main():
+	rng = numpy.random.default_rng(0)
+	values = rng.normal(20, 5, N_ROWS)
+	values[::97] = numpy.nan
+
+	frames = {
+			"celsius": pandas.DataFrame({"value": TemperatureArray(values)}),
+			"float64": pandas.DataFrame({"value": values}),
+			}
+	megabytes = values.nbytes / 1e6
+
+	print(f"{N_ROWS} rows ({megabytes:.0f} MB), best of {REPEAT}, throughput in MB/s")
+	print(f"{'format':<8} {'dtype':<8} {'write':>8} {'read':>8}")
+
+	with tempfile.TemporaryDirectory() as tmpdir:
+		for fmt in ["parquet", "feather"]:
+			for name, df in frames.items():
+				path = os.path.join(tmpdir, f"{name}.{fmt}")
+				write = getattr(df, f"to_{fmt}")
+				read = getattr(pandas, f"read_{fmt}")
+
+				write_time = min(timeit.repeat(lambda: write(path), number=1, repeat=REPEAT))
+				read_time = min(timeit.repeat(lambda: read(path), number=1, repeat=REPEAT))
+
+				assert read(path)["value"].dtype == df["value"].dtype
+
+				print(f"{fmt:<8} {name:<8} {megabytes / write_time:>8.0f} {megabytes / read_time:>8.0f}")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+#
+#  bench_parse.py
+"""
+Benchmark parsing strings such as ``"21.5 ℃"`` with :func:`~si_unit_pandas.to_temperature`,
+against stripping the suffix from each string and calling :class:`float` on it.
+
+Run with ``python benchmarks/bench_parse.py``.
+"""
+
+# stdlib
+import timeit
+
+# 3rd party
+import numpy  # type: ignore
+import pandas  # type: ignore
+
+# this package
+from si_unit_pandas import to_temperature
+
+N_VALUES = 1_000_000
+REPEAT = 3
+SUFFIXES = "  ℃°C"
+
+
+def main():
+	values = numpy.random.default_rng(0).normal(20, 5, N_VALUES).round(2)
+	strings = numpy.array([f"{value} ℃" for value in values.tolist()], dtype=object)
+
+	cases = [
+			("object array", strings),
+			("unicode array", strings.astype(str)),
+			("Series", pandas.Series(strings)),
+			]
+
+	def baseline():
+		return numpy.array([float(string.rstrip(SUFFIXES)) for string in strings.tolist()])
+
+	baseline_time = min(timeit.repeat(baseline, number=1, repeat=REPEAT))
+
+	print(f"{N_VALUES} values, best of {REPEAT}")
+	print(f"{'input':<14} {'parse':>10} {'float':>10} {'ratio':>8}")
+
+	for name, data in cases:
+		timing = min(timeit.repeat(lambda: to_temperature(data), number=1, repeat=REPEAT))
+		print(f"{name:<14} {timing:>9.4f}s {baseline_time:>9.4f}s {timing / baseline_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+#
+#  bench_scalars.py
+"""
+Benchmark creating Celsius scalars and arithmetic on them against plain floats.
+
+Run with ``python benchmarks/bench_scalars.py``.
+"""
+
+# stdlib
+import timeit
+
+# 3rd party
+import numpy  # type: ignore
+
+# this package
+from si_unit_pandas import Celsius, TemperatureArray
+
+N_VALUES = 100_000
+REPEAT = 5
+
+
+def main():
+	values = numpy.random.default_rng(0).normal(20, 5, N_VALUES)
+	floats = values.tolist()
+	temperatures = TemperatureArray(values)
+	scalar = Celsius(21.5)
+
+	cases = [
+			("create", lambda: [Celsius(value) for value in floats], lambda: [float(value) for value in floats]),
+			(
+					"create (fast)",
+					lambda: [Celsius._from_float(value) for value in floats],
+					lambda: [float(value) for value in floats],
+					),
+			("getitem", lambda: [temperatures[i] for i in range(N_VALUES)], lambda: [values[i] for i in range(N_VALUES)]),
+			("iterate", lambda: list(temperatures), values.tolist),
+			("add", lambda: [scalar + value for value in floats], lambda: [21.5 + value for value in floats]),
+			("compare", lambda: [scalar < value for value in floats], lambda: [21.5 < value for value in floats]),
+			]
+
+	print(f"{N_VALUES} values, best of {REPEAT}")
+	print(f"{'case':<14} {'Celsius':>10} {'float':>10} {'ratio':>8}")
+
+	for name, celsius_func, float_func in cases:
+		timings = [min(timeit.repeat(func, number=1, repeat=REPEAT)) for func in (celsius_func, float_func)]
+		print(f"{name:<14} {timings[0]:>9.4f}s {timings[1]:>9.4f}s {timings[0] / timings[1]:>7.1f}x")
+
+
+if __name__ == "__main__":
+	main()
@@ -38,7 +38,31 @@ Custom Pandas dtypes for values with SI units.
 #
 
 # this package
-from si_unit_pandas.temperature import Celsius, CelsiusType, Fahrenheit, TemperatureArray, to_temperature
+from si_unit_pandas.temperature import (
+		Celsius,
+		CelsiusType,
+		Fahrenheit,
+		TemperatureArray,
+		TemperatureBuffer,
+		TemperatureType,
+		to_temperature
+		)
+from si_unit_pandas.quantities import (
+		KelvinArray,
+		KelvinType,
+		KilogramArray,
+		KilogramType,
+		MetreArray,
+		MetreType,
+		PascalArray,
+		PascalType,
+		SecondArray,
+		SecondType,
+		to_quantity
+		)
+
+# Registers the Arrow extension types, if pyarrow is installed.
+from si_unit_pandas import _arrow_utils  # noqa: F401  # isort: skip
 
 __author__: str = "Dominic Davis-Foster"
 __copyright__: str = "2020 Dominic Davis-Foster"
@@ -50,8 +74,21 @@ __email__: str = "dominic@davis-foster.co.uk"
 __all__ = [
 		"__version__",
 		"TemperatureArray",
+		"TemperatureBuffer",
 		"CelsiusType",
+		"TemperatureType",
 		"to_temperature",
 		"Celsius",
 		"Fahrenheit",
+		"PascalArray",
+		"PascalType",
+		"MetreArray",
+		"MetreType",
+		"KilogramArray",
+		"KilogramType",
+		"SecondArray",
+		"SecondType",
+		"KelvinArray",
+		"KelvinType",
+		"to_quantity",
 		]
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+#
+#  _arrow_utils.py
+"""
+Integration with `Apache Arrow <https://arrow.apache.org/>`_.
+
+The extension types are only defined if :mod:`pyarrow` is installed.
+"""
+#
+#  Copyright (c) 2020 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are met:
+#
+#  * Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+#  * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+#  * Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#  AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+#  IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+#  DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+#  FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+#  DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+#  SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+#  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+#  OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+#  OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+# stdlib
+from typing import Optional
+
+# 3rd party
+import numpy  # type: ignore
+
+try:
+	# 3rd party
+	import pyarrow  # type: ignore
+except ImportError:  # pragma: no cover
+	pyarrow = None
+
+# this package
+from si_unit_pandas.temperature import CelsiusType, TemperatureArray, TemperatureType
+
+__all__ = ["ArrowCelsiusType", "array_from_arrow"]
+
+if pyarrow is not None:
+
+	class ArrowCelsiusType(pyarrow.ExtensionType):
+		"""
+		Arrow extension type for temperatures in degrees Celsius.
+
+		The values are stored as an Arrow floating point array, so they can be shared with NumPy without copying.
+
+		:param storage_type: The Arrow type of the stored values, which reflects the precision of the dtype.
+		:param unit: The unit the temperatures are displayed in. The values are always stored in Celsius.
+		"""
+
+		def __init__(self, storage_type=None, unit: str = 'C'):
+			if storage_type is None:
+				storage_type = pyarrow.float64()
+
+			self.unit = unit
+			super().__init__(storage_type, "si_unit_pandas.celsius")
+
+		def __arrow_ext_serialize__(self) -> bytes:
+			# Celsius is serialized as nothing, as it was before display units were added.
+			return b'' if self.unit == 'C' else self.unit.encode()
+
+		@classmethod
+		def __arrow_ext_deserialize__(cls, storage_type, serialized: bytes) -> "ArrowCelsiusType":
+			return cls(storage_type, serialized.decode() or 'C')
+
+		def __reduce__(self):
+			return type(self), (self.storage_type, self.unit)
+
+		def __eq__(self, other) -> bool:
+			# pyarrow only compares the storage type of extension types.
+			result = super().__eq__(other)
+			if result is True:
+				return self.unit == other.unit
+			return result
+
+		def __ne__(self, other) -> bool:
+			result = self.__eq__(other)
+			return result if result is NotImplemented else not result
+
+		def __hash__(self) -> int:
+			return hash((self.extension_name, str(self.storage_type), self.unit))
+
+		def __repr__(self) -> str:
+			if self.unit == 'C':
+				return super().__repr__()
+			return f"{type(self).__name__}({self.storage_type!r}, unit={self.unit!r})"
+
+		def to_pandas_dtype(self) -> CelsiusType:
+			"""
+			Returns the pandas dtype corresponding to this Arrow type.
+			"""
+
+			return TemperatureType(self.unit, self.storage_type.to_pandas_dtype())
+
+	# Register the type so it is recognised when reading files and IPC streams.
+	pyarrow.register_extension_type(ArrowCelsiusType())
+
+
+def array_from_arrow(array, dtype: Optional[CelsiusType] = None) -> TemperatureArray:
+	"""
+	Construct a :class:`~.TemperatureArray` from a :class:`pyarrow.Array` or :class:`pyarrow.ChunkedArray`.
+
+	Chunks without missing values are wrapped without copying, and so are read-only.
+	Missing values are converted to NaN. If the array also contains NaN values which are not null,
+	the returned array is given a mask of the null values, so that the NaN values are not treated as missing.
+
+	:param array:
+	:param dtype: The dtype of the returned array. Defaults to ``'celsius'``.
+	"""
+
+	dtype = TemperatureArray._validate_dtype(dtype)
+	storage_type = pyarrow.from_numpy_dtype(numpy.dtype(dtype._record_type))
+
+	if isinstance(array, pyarrow.Array):
+		chunks = [array]
+	else:
+		chunks = array.chunks
+
+	results = []
+
+	for chunk in chunks:
+		if isinstance(chunk, pyarrow.ExtensionArray):
+			chunk = chunk.storage
+		if chunk.type != storage_type:
+			chunk = chunk.cast(storage_type)
+
+		values = chunk.to_numpy(zero_copy_only=False)
+		mask = None
+
+		if chunk.null_count:
+			nulls = chunk.is_null().to_numpy(zero_copy_only=False)
+			if (numpy.isnan(values) & ~nulls).any():
+				mask = nulls
+		elif numpy.isnan(values).any():
+			mask = numpy.zeros(len(values), dtype=bool)
+
+		results.append(TemperatureArray._from_ndarray(values, mask=mask, dtype=dtype))
+
+	if not results:
+		return TemperatureArray._from_ndarray(numpy.empty(0, dtype=storage_type.to_pandas_dtype()), dtype=dtype)
+	elif len(results) == 1:
+		return results[0]
+	else:
+		return TemperatureArray._concat_same_type(results)
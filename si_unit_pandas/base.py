@@ -43,19 +43,42 @@ Base functionality.
 #
 
 # stdlib
+import operator
+import os
 from abc import abstractmethod
 from numbers import Real
-from typing import Dict, Iterable, List, Optional, Sequence, SupportsFloat, Tuple, Type, TypeVar, Union, overload
+from typing import (
+		Any,
+		Dict,
+		Generic,
+		Iterable,
+		Iterator,
+		List,
+		Optional,
+		Sequence,
+		SupportsFloat,
+		Tuple,
+		Type,
+		TypeVar,
+		Union,
+		overload
+		)
 
 # 3rd party
 import numpy  # type: ignore
+import pandas  # type: ignore
 from domdf_python_tools.doctools import prettify_docstrings
+from domdf_python_tools.typing import PathLike
+from pandas._libs import lib  # type: ignore
 from pandas.core.arrays import ExtensionArray  # type: ignore
 from pandas.core.dtypes.base import ExtensionDtype  # type: ignore
 from pandas.core.dtypes.generic import ABCExtensionArray  # type: ignore
 from typing_extensions import Literal, Protocol
 
-__all__ = ["NumPyBackedExtensionArrayMixin"]
+# this package
+from si_unit_pandas.units import AffineTransform
+
+__all__ = ["NumPyBackedExtensionArrayMixin", "BaseArray", "BaseArrayBuffer", "unique_nbytes"]
 
 
 class NumPyBackedExtensionArrayMixin(ExtensionArray):
@@ -68,10 +91,19 @@ class NumPyBackedExtensionArrayMixin(ExtensionArray):
 	@property
 	def dtype(self):
 		"""
-		The dtype for this extension array, :class:`~.CelsiusType`.
+		The dtype for this extension array, such as :class:`~.CelsiusType`.
+
+		The dtype reflects the precision of the underlying buffer.
 		"""
 
-		return self._dtype
+		dtype = self._dtype
+
+		if self.data.dtype == dtype._record_type:
+			return dtype
+		else:
+			metadata = {attr: getattr(dtype, attr) for attr in dtype._metadata}
+			metadata["precision"] = self.data.dtype.name
+			return type(dtype)(**metadata)
 
 	@classmethod
 	def _from_sequence(cls, scalars: Iterable, dtype=None, copy: bool = False):
@@ -86,14 +118,14 @@ class NumPyBackedExtensionArrayMixin(ExtensionArray):
 		:param copy: If True, copy the underlying data.
 		"""
 
-		return cls(scalars, dtype=dtype)
+		return cls(scalars, dtype=dtype, copy=copy)
 
 	@classmethod
 	def _from_factorized(cls, values: numpy.ndarray, original: ExtensionArray):
 		"""
 		Reconstruct an ExtensionArray after factorization.
 
-		:param values: An integer ndarray with the factorized values.
+		:param values: An ndarray of the unique values, as returned by :meth:`~._values_for_factorize`.
 		:param original: The original ExtensionArray that factorize was called on.
 
 		.. seealso::
@@ -101,7 +133,8 @@ class NumPyBackedExtensionArrayMixin(ExtensionArray):
 			:meth:`pandas.pandas.api.extensions.ExtensionArray.factorize`
 		"""
 
-		return cls(values)
+		dtype = cls._dtype if original is None else original.dtype  # type: ignore
+		return cls._from_ndarray(numpy.asarray(values, dtype=dtype._record_type), dtype=dtype)  # type: ignore
 
 	@property
 	def shape(self) -> Tuple[int]:
@@ -133,9 +166,16 @@ class NumPyBackedExtensionArrayMixin(ExtensionArray):
 	def nbytes(self) -> int:
 		"""
 		The number of bytes needed to store this object in memory.
+
+		This is the size of the values (and the mask, if any) the array refers to.
+		Arrays which are views of another array's buffer report only the part they refer to,
+		so use :func:`~.unique_nbytes` to total arrays which may share buffers.
 		"""
 
-		return self._itemsize * len(self)
+		if self._mask is None:
+			return self.data.nbytes
+		else:
+			return self.data.nbytes + self._mask.nbytes
 
 	def _formatting_values(self):
 		return numpy.array(self._format_values(), dtype="object")
@@ -150,7 +190,7 @@ class NumPyBackedExtensionArrayMixin(ExtensionArray):
 		:rtype:
 		"""
 
-		return type(self)(self.data.copy())
+		return self._from_backing_data(self.data.copy(), None if self._mask is None else self._mask.copy())
 
 	@classmethod
 	def _concat_same_type(cls, to_concat: Sequence[ABCExtensionArray]) -> ABCExtensionArray:
@@ -160,19 +200,29 @@ class NumPyBackedExtensionArrayMixin(ExtensionArray):
 		:param to_concat: sequence of this type
 		"""
 
-		return cls(numpy.concatenate([array.data for array in to_concat]))
+		data = numpy.concatenate([array.data for array in to_concat])
+
+		# The arrays all have the same dtype.
+		dtype = to_concat[0].dtype if len(to_concat) else None
+
+		if any(array._mask is not None for array in to_concat):
+			mask = numpy.concatenate([array.isna() for array in to_concat])
+			return cls._from_ndarray(data, mask=mask, dtype=dtype)
+		else:
+			return cls._from_ndarray(data, dtype=dtype)
 
 	def tolist(self) -> List:
 		"""
-		Convert the array to a Python list.
+		Convert the array to a Python list, in the units the values are displayed in.
 		"""
 
-		return self.data.tolist()
+		return self._to_display(self.data).tolist()
 
 	def argsort(
 			self,
 			ascending: bool = True,
-			kind: Union[Literal["quicksort"], Literal["mergesort"], Literal["heapsort"]] = "quicksort",
+			kind: Union[Literal["quicksort"], Literal["mergesort"], Literal["heapsort"], Literal["stable"]] = "quicksort",
+			na_position: Literal["first", "last"] = "last",
 			*args,
 			**kwargs,
 			) -> numpy.ndarray:
@@ -181,42 +231,271 @@ class NumPyBackedExtensionArrayMixin(ExtensionArray):
 
 		:param ascending: Whether the indices should result in an ascending
 			or descending sort.
-		:param kind: {'quicksort', 'mergesort', 'heapsort'}, optional
-			Sorting algorithm.
+		:param kind: {'quicksort', 'mergesort', 'heapsort', 'stable'}, optional
+			Sorting algorithm. With a stable algorithm, equal values keep their
+			original order for both ascending and descending sorts.
+		:param na_position: Whether missing values should be placed ``'first'`` or ``'last'``.
 
-		\*args and \*\*kwargs are passed through to :func:`numpy.argsort`.
+		\*args and \*\*kwargs are accepted for compatibility with :meth:`pandas.api.extensions.ExtensionArray.argsort`.
 
-		:return: Array of indices that sort ``self``. If NaN values are contained,
-			NaN values are placed at the end.
+		:return: Array of indices that sort ``self``.
 
 		.. seealso::
 
 			:class:`numpy.argsort`: Sorting implementation used internally.
 		"""
 
-		return self.data.argsort()
+		if na_position not in {"first", "last"}:
+			raise ValueError(f"'na_position' must be either 'first' or 'last', not {na_position!r}")
+
+		values = self._values_for_argsort()
+
+		# Missing values are always stored as NaN, so this also sorts NaN readings in masked arrays last.
+		missing = numpy.isnan(values)
+
+		if not missing.any():
+			return _argsort(values, ascending, kind)
+
+		valid = numpy.flatnonzero(~missing)
+		indexer = valid[_argsort(values[valid], ascending, kind)]
+
+		if na_position == "first":
+			return numpy.concatenate([numpy.flatnonzero(missing), indexer])
+		else:
+			return numpy.concatenate([indexer, numpy.flatnonzero(missing)])
+
+	def _values_for_argsort(self) -> numpy.ndarray:
+		"""
+		Return the values used for sorting, which is the underlying buffer.
+		"""
+
+		return self.data
+
+	def _values_for_factorize(self) -> Tuple[numpy.ndarray, float]:
+		"""
+		Return the values used for factorizing, which is the underlying buffer, and the missing value.
+		"""
+
+		return self.data, self.dtype.na_value
+
+	def factorize(
+			self,
+			na_sentinel: Optional[int] = -1,
+			use_na_sentinel: bool = True,
+			) -> Tuple[numpy.ndarray, ExtensionArray]:
+		"""
+		Encode the array as an enumerated type.
+
+		The values are hashed in a single ``O(n)`` pass over the underlying buffer.
+		The unique values are returned in the order in which they first appear,
+		and all missing values share the code ``na_sentinel``.
+		If the array has a mask, NaN values which are not missing are given a code of their own.
+
+		:param na_sentinel: The code to use for missing values.
+			If :py:obj:`None` missing values are treated as for ``use_na_sentinel=False``.
+		:param use_na_sentinel: If :py:obj:`False` missing values are given a code of their own,
+			and the missing value appears once in the unique values. Used by pandas 1.5 and later.
+
+		:return: An integer ndarray of codes, and an array of the unique values.
+		"""
+
+		dropna = use_na_sentinel and na_sentinel is not None
+		codes, uniques, unique_mask = self._factorize(dropna=dropna)
 
-	def unique(self) -> ExtensionArray:  # noqa: D102
-		# https://github.com/pandas-dev/pandas/pull/19869
-		_, indices = numpy.unique(self.data, return_index=True)
-		data = self.data.take(numpy.sort(indices))
-		return self._from_ndarray(data)
+		if dropna and na_sentinel != -1:
+			codes[codes == -1] = na_sentinel
+
+		return codes, self._from_backing_data(uniques, unique_mask)
+
+	def unique(self) -> ExtensionArray:
+		"""
+		Returns the unique values in the array, in the order in which they first appear.
+
+		The values are hashed in a single ``O(n)`` pass over the underlying buffer,
+		and all missing values are collapsed into one.
+		If the array has a mask, NaN values which are not missing are kept apart from the missing value.
+		"""
+
+		if self._mask is None:
+			return self._from_backing_data(pandas.unique(self.data).astype(self.data.dtype, copy=False))
+
+		_, uniques, unique_mask = self._factorize(dropna=False)
+		return self._from_backing_data(uniques, unique_mask)
+
+	def _factorize(self, dropna: bool = True) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+		"""
+		Encode the array as an enumerated type, keeping NaN values which are not missing apart from missing values.
+
+		:param dropna: If :py:obj:`True` missing values have the code ``-1``.
+			Otherwise they share a code, and appear once in the unique values.
+
+		:return: An integer ndarray of codes, the unique values, and a boolean mask of which unique value is missing.
+		"""
+
+		codes, uniques = pandas.factorize(self.data, sort=False)
+		uniques = numpy.asarray(uniques, dtype=self.data.dtype)
+		unique_mask = numpy.zeros(len(uniques), dtype=bool)
+
+		# pandas gives every NaN the code -1, so add codes for the NaN values which aren't missing,
+		# and for the missing values if they are kept.
+		groups = []
+
+		if self._mask is not None:
+			groups.append((numpy.isnan(self.data) & ~self._mask, False))
+		if not dropna:
+			groups.append((self.isna(), True))
+
+		for positions, missing in groups:
+			if not positions.any():
+				continue
+
+			# The codes are numbered in order of appearance,
+			# so the new code follows the codes which appear before it.
+			code = codes[:positions.argmax()].max(initial=-1) + 1
+			codes[codes >= code] += 1
+			codes[positions] = code
+			uniques = numpy.insert(uniques, code, numpy.nan)
+			unique_mask = numpy.insert(unique_mask, code, missing)
+
+		return codes, uniques, unique_mask
+
+
+def _argsort(values: numpy.ndarray, ascending: bool = True, kind: str = "quicksort") -> numpy.ndarray:
+	"""
+	Return the indices that would sort ``values``, which must not contain NaN.
+
+	:param values:
+	:param ascending:
+	:param kind: The sorting algorithm to use.
+	"""
+
+	if ascending:
+		return values.argsort(kind=kind)
+
+	# Sort the reversed values and map the indices back,
+	# so that stable sorts keep equal values in their original order.
+	return len(values) - 1 - values[::-1].argsort(kind=kind)[::-1]
 
 
 _A = TypeVar("_A")
 
 
+#: Reductions supported by :meth:`BaseArray._reduce`, and whether their result is in the units of the array.
+_reductions: Dict[str, bool] = {
+		"sum": True,
+		"mean": True,
+		"median": True,
+		"min": True,
+		"max": True,
+		"std": False,
+		"var": False,
+		"sem": False,
+		}
+
+#: Groupby operations supported by :meth:`BaseArray._groupby_op`, and whether their result is in the units of the array.
+_groupby_ops: Dict[str, bool] = {
+		"sum": True,
+		"mean": True,
+		"median": True,
+		"min": True,
+		"max": True,
+		"first": True,
+		"last": True,
+		"cumsum": True,
+		"cummin": True,
+		"cummax": True,
+		"std": False,
+		"var": False,
+		"sem": False,
+		"skew": False,
+		"rank": False,
+		"any": False,
+		"all": False,
+		}
+
+#: Ufuncs whose result is in the units of their operands.
+_unit_preserving_ufuncs = {
+		numpy.add,
+		numpy.subtract,
+		numpy.negative,
+		numpy.positive,
+		numpy.absolute,
+		numpy.fabs,
+		numpy.rint,
+		numpy.floor,
+		numpy.ceil,
+		numpy.trunc,
+		numpy.maximum,
+		numpy.minimum,
+		numpy.fmax,
+		numpy.fmin,
+		}
+
+#: Ufuncs which scale a quantity by a plain number.
+_scaling_ufuncs = {numpy.multiply, numpy.true_divide, numpy.floor_divide}
+
+#: Ufuncs whose result is not a quantity, such as comparisons.
+_unitless_ufuncs = {
+		numpy.equal,
+		numpy.not_equal,
+		numpy.less,
+		numpy.less_equal,
+		numpy.greater,
+		numpy.greater_equal,
+		numpy.isnan,
+		numpy.isinf,
+		numpy.isfinite,
+		numpy.signbit,
+		}
+
+#: The symbols of the comparison operators, for error messages.
+_comparison_symbols = {
+		operator.eq: "==",
+		operator.ne: "!=",
+		operator.lt: '<',
+		operator.le: "<=",
+		operator.gt: '>',
+		operator.ge: ">=",
+		}
+
+#: Ufuncs which may be used to reduce or accumulate an array.
+_reducing_ufuncs = {numpy.add, numpy.maximum, numpy.minimum, numpy.fmax, numpy.fmin}
+
+#: The conversion for arrays which are displayed in the units they are stored in.
+_identity = AffineTransform(1.0)
+
+#: The number of values converted to Python objects at a time when iterating over an array.
+_iter_chunk_size = 10_000
+
+
 class BaseArray(numpy.lib.mixins.NDArrayOperatorsMixin, NumPyBackedExtensionArrayMixin):
 	ndim: int = 1
 	data: numpy.ndarray
 
+	#: The type of scalar values in the array.
+	_scalar_type: Type["UserFloat"]
+
+	#: Optional boolean mask of the missing values, which are also stored as NaN in :attr:`~.data`.
+	#: If :py:obj:`None`, all NaN values are missing.
+	_mask: Optional[numpy.ndarray] = None
+
 	@classmethod
-	def _from_ndarray(cls: _A, data: numpy.ndarray, copy: bool = False) -> _A:
+	def _from_ndarray(
+			cls: _A,
+			data: numpy.ndarray,
+			copy: bool = False,
+			mask: Optional[numpy.ndarray] = None,
+			dtype: Optional[ExtensionDtype] = None,
+			) -> _A:
 		"""
 		Zero-copy construction of a BaseArray from an ndarray.
 
 		:param data: This should have CelsiusType._record_type dtype
 		:param copy: Whether to copy the data.
+		:param mask: Optional boolean mask of the missing values.
+			The corresponding elements of ``data`` must already be NaN.
+		:param dtype: The dtype of the array, if not the default for the class.
+			Only metadata such as the display unit is taken from the dtype, as the precision is that of ``data``.
 
 		:return:
 		"""
@@ -224,11 +503,206 @@ class BaseArray(numpy.lib.mixins.NDArrayOperatorsMixin, NumPyBackedExtensionArra
 		if copy:
 			data = data.copy()
 
-		new = cls([])  # type: ignore
+			if mask is not None:
+				mask = mask.copy()
+
+		new = cls.__new__(cls)  # type: ignore
 		new.data = data
 
+		if mask is not None:
+			new._mask = mask
+
+		if dtype is not None:
+			new._dtype = dtype
+
 		return new
 
+	def _from_backing_data(self: _A, data: numpy.ndarray, mask: Optional[numpy.ndarray] = None) -> _A:
+		"""
+		Construct a new array with the same layout and dtype metadata as this one from an ndarray.
+
+		:param data:
+		:param mask: The mask of the missing values, if this array has a mask.
+			If :py:obj:`None` the NaN values in ``data`` are taken to be missing.
+		"""
+
+		dtype = self._custom_dtype  # type: ignore
+
+		if self._mask is None:  # type: ignore
+			return self._from_ndarray(data, dtype=dtype)  # type: ignore
+		elif mask is None:
+			mask = numpy.isnan(data)
+
+		return self._from_ndarray(data, mask=mask, dtype=dtype)  # type: ignore
+
+	@property
+	def _custom_dtype(self) -> Optional[ExtensionDtype]:
+		"""
+		The dtype of this array if it differs from the default for the class, otherwise :py:obj:`None`.
+		"""
+
+		if self._dtype is type(self)._dtype:
+			return None
+		else:
+			return self._dtype
+
+	def __reduce__(self):
+		"""
+		Pickle the array as its underlying buffer.
+
+		With pickle protocol 5 the buffer can be transferred out-of-band, without being copied.
+		"""
+
+		return type(self)._from_ndarray, (self.data, False, self._mask, self._custom_dtype)
+
+	@classmethod
+	def _storage_type(cls, dtype: Any = None) -> numpy.dtype:
+		"""
+		Returns the NumPy dtype of the underlying buffer for arrays of the given dtype.
+
+		:param dtype: An instance of the array's dtype, or its name, such as ``'celsius[float32]'``.
+			If :py:obj:`None` the default precision is used.
+		"""
+
+		return numpy.dtype(cls._validate_dtype(dtype)._record_type)
+
+	@classmethod
+	def _validate_dtype(cls, dtype: Any = None) -> ExtensionDtype:
+		"""
+		Returns ``dtype`` as an instance of the array's dtype.
+
+		:param dtype: An instance of the array's dtype, or its name, such as ``'celsius[float32]'``.
+			If :py:obj:`None` the default dtype for the class is returned.
+
+		:raises TypeError: If ``dtype`` is not a dtype for this array.
+		"""
+
+		if dtype is None:
+			return cls._dtype  # type: ignore
+		elif isinstance(dtype, str):
+			dtype = cls._dtype.construct_from_string(dtype)  # type: ignore
+
+		if not isinstance(dtype, type(cls._dtype)):  # type: ignore
+			raise TypeError(f"Cannot store values with dtype {dtype} in a {cls.__name__}")  # type: ignore
+
+		return dtype
+
+	@classmethod
+	def from_buffer(cls: _A, buffer: Any, copy: Optional[bool] = None, dtype: Any = None) -> _A:
+		"""
+		Construct an array which wraps ``buffer`` without copying it.
+
+		``buffer`` may be a one-dimensional :class:`numpy.ndarray`, a :class:`memoryview`,
+		or any other object supporting the buffer protocol. Untyped byte buffers
+		(such as :class:`bytes` and :class:`bytearray`) are interpreted as packed native-endian values.
+
+		:param buffer:
+		:param copy: If :py:obj:`True` the data is always copied.
+			If :py:obj:`False` a :exc:`ValueError` is raised if the data cannot be wrapped without copying it.
+			If :py:obj:`None` the data is only copied when necessary.
+		:param dtype: The dtype of the array, which determines the precision of the values in the buffer.
+			If :py:obj:`None` the values are 64-bit floats.
+			Metadata such as the display unit is kept, but the buffer must hold the values in the units they are stored in.
+
+		.. note:: Read-only buffers, such as :class:`bytes`, produce a read-only array.
+		"""
+
+		dtype = cls._validate_dtype(dtype)  # type: ignore
+		record_type = numpy.dtype(dtype._record_type)
+
+		if isinstance(buffer, numpy.ndarray):
+			data = buffer
+		else:
+			view = memoryview(buffer)
+
+			if view.format in {'B', 'b', 'c'}:
+				data = numpy.frombuffer(view, dtype=record_type)
+			else:
+				data = numpy.asarray(view)
+
+		if data.dtype != record_type or (data.ndim != 1 and not data.flags.c_contiguous):
+			if copy is False:
+				raise ValueError(
+						f"Unable to avoid copying data with dtype {data.dtype} and shape {data.shape}. "
+						f"Expected a one-dimensional or contiguous array with dtype {record_type}."
+						)
+
+			data = data.astype(record_type)
+
+		elif copy:
+			data = data.copy()
+
+		if data.ndim != 1:
+			data = data.reshape(-1)
+
+		return cls._from_ndarray(data, dtype=dtype)  # type: ignore
+
+	@classmethod
+	def from_memmap(
+			cls: _A,
+			path: PathLike,
+			offset: int = 0,
+			length: Optional[int] = None,
+			mode: Literal["r", "r+", "c"] = 'r',
+			dtype: Any = None,
+			) -> _A:
+		"""
+		Construct an array backed by a memory-mapped file.
+
+		The file should contain packed native-endian floats, such as one written by :meth:`~.BaseArray.to_file`.
+		It is paged in by the operating system as the values are accessed,
+		so arrays larger than the available memory can be sliced and indexed.
+
+		:param path: The file to map.
+		:param offset: The position in the file, in bytes, of the first value.
+		:param length: The number of values to map. If :py:obj:`None` the values run to the end of the file.
+		:param mode: ``'r'`` to map the file read-only, ``'r+'`` to write changes back to the file,
+			or ``'c'`` for copy-on-write, where changes are kept in memory only.
+		:param dtype: The dtype of the array, which determines the precision of the values in the file.
+			If :py:obj:`None` the values are 64-bit floats.
+			Metadata such as the display unit is kept, but the file must hold the values in the units they are stored in.
+		"""
+
+		if mode not in {'r', "r+", 'c'}:
+			raise ValueError(f"'mode' must be one of 'r', 'r+' or 'c', not {mode!r}")
+
+		dtype = cls._validate_dtype(dtype)  # type: ignore
+		mapped = numpy.memmap(
+				path,
+				dtype=numpy.dtype(dtype._record_type),
+				mode=mode,
+				offset=offset,
+				shape=None if length is None else (length, ),
+				)
+
+		# A plain ndarray view keeps the mapping open, but stops the memmap subclass
+		# leaking into the results of slicing and arithmetic.
+		return cls._from_ndarray(mapped.view(numpy.ndarray), dtype=dtype)  # type: ignore
+
+	def to_file(self, path: PathLike) -> None:
+		"""
+		Write the values to a file as packed native-endian values.
+
+		The file can be read back with :meth:`~.BaseArray.from_memmap`.
+
+		:param path:
+		"""
+
+		self.data.tofile(os.fspath(path))
+
+	def owns_buffer(self) -> bool:
+		"""
+		Returns whether the array owns the memory holding its values.
+
+		Arrays which are views of another array, memory-mapped files, or buffers
+		from other libraries (see :meth:`~.BaseArray.from_buffer`) do not own their memory.
+		"""
+
+		if self._mask is not None and self._mask.base is not None:
+			return False
+
+		return self.data.base is None
+
 	@property
 	def na_value(self):
 		"""
@@ -244,58 +718,605 @@ class BaseArray(numpy.lib.mixins.NDArrayOperatorsMixin, NumPyBackedExtensionArra
 
 		return self.dtype.na_value
 
-	def take(self, indices, allow_fill: bool = False, fill_value=None):
-		# Can't use pandas' take yet
-		# 1. axis
-		# 2. I don't know how to do the reshaping correctly.
+	def take(
+			self: _A,
+			indices: Sequence[int],
+			allow_fill: bool = False,
+			fill_value: Any = None,
+			out: Optional[numpy.ndarray] = None,
+			) -> _A:
+		"""
+		Take elements from the array.
+
+		The indices are validated with a single minimum and maximum, and the values are gathered
+		straight into the result buffer without any intermediate masks or copies.
+
+		:param indices: The indices of the elements to take.
+		:param allow_fill: If :py:obj:`True`, an index of ``-1`` marks a missing value, which is replaced by ``fill_value``,
+			and other negative indices raise a :exc:`ValueError`.
+			If :py:obj:`False`, negative indices count from the end of the array, as in :func:`numpy.take`.
+		:param fill_value: The value to use for missing values when ``allow_fill`` is :py:obj:`True`.
+			Defaults to :attr:`~.na_value`.
+		:param out: An optional ndarray to place the result in, with the same dtype as the underlying buffer
+			and the same length as ``indices``. The returned array wraps this buffer.
 
-		indices = numpy.asarray(indices, dtype="int")
+		:raises IndexError: If any of the indices are out of bounds.
+		"""
 
-		if allow_fill and fill_value is None:
-			fill_value = self.na_value
-		elif allow_fill and not isinstance(fill_value, tuple):
-			if not numpy.isnan(fill_value):
-				fill_value = int(fill_value)
+		indices = numpy.asarray(indices, dtype=numpy.intp)
+		size = len(self)
+
+		if indices.size:
+			lowest, highest = indices.min(), indices.max()
+		else:
+			lowest, highest = 0, -1
 
 		if allow_fill:
-			mask = (indices == -1)
-			if not len(self):
-				if not (indices == -1).all():
-					msg = "Invalid take for empty array. Must be all -1."
-					raise IndexError(msg)
-				else:
-					# all NA take from and empty array
-					took = (
-							numpy.full(
-									(len(indices), 2),
-									fill_value,
-									dtype=">u8",
-									).reshape(-1).astype(self.dtype._record_type)
-							)
-					return self._from_ndarray(took)
-			if (indices < -1).any():
-				msg = "Invalid value in 'indicies'. Must be all >= -1 for 'allow_fill=True'"
-				raise ValueError(msg)
-
-		took = self.data.take(indices)
-		if allow_fill:
-			took[mask] = fill_value
+			if lowest < -1:
+				raise ValueError("Invalid value in 'indices'. Must be all >= -1 for 'allow_fill=True'")
+
+			if fill_value is None or (numpy.ndim(fill_value) == 0 and pandas.isna(fill_value)):
+				fill_value = self.na_value
+			else:
+				fill_value = float(self._unwrap_value(fill_value))
+
+		elif lowest < -size:
+			raise IndexError(f"index {lowest} is out of bounds for size {size}")
 
-		return self._from_ndarray(took)
+		if highest >= size:
+			raise IndexError(f"index {highest} is out of bounds for size {size}")
+
+		if not size:
+			# Only possible when there are no indices, or every index is -1.
+			if out is None:
+				out = numpy.empty(len(indices), dtype=self.data.dtype)
+			if allow_fill:
+				out.fill(fill_value)
+			return self._from_backing_data(out)
+
+		# The indices have already been checked, and "wrap" lets numpy write straight into ``out``.
+		result = numpy.take(self.data, indices, mode="wrap", out=out)
+
+		if self._mask is None:
+			mask = None
+		else:
+			mask = self._mask.take(indices, mode="wrap")
+
+		if allow_fill and lowest == -1:
+			filled = indices == -1
+			numpy.putmask(result, filled, fill_value)
+
+			if mask is not None:
+				numpy.putmask(mask, filled, numpy.isnan(fill_value))
+
+		return self._from_backing_data(result, mask)
 
 	def __repr__(self) -> str:
-		formatted = self._format_values()
-		return f"{self.__class__.__name__}({formatted!r})"
+		max_items = pandas.get_option("display.max_seq_items") or len(self)
+
+		if len(self) > max_items:
+			# Only format the values which are actually shown.
+			n_items = max_items // 2
+			head = self[:n_items]._format_values()
+			tail = self[len(self) - n_items:]._format_values()
+			formatted = [*head, "...", *tail]
+		else:
+			formatted = self._format_values()
+
+		return f"{self.__class__.__name__}([{', '.join(formatted)}])"
+
+	@abstractmethod
+	def _format_values(self) -> numpy.ndarray:
+		"""
+		Returns an array of strings representing the values in the array.
+		"""
+
+		raise NotImplementedError
 
 	def isna(self):
 		"""
 		Indicator for whether each element is missing.
+
+		For arrays with a mask this returns a copy of the mask, without scanning the data.
 		"""
 
-		if numpy.isnan(self.na_value):
+		if self._mask is not None:
+			return self._mask.copy()
+		else:
 			return numpy.isnan(self.data)
+
+	def _reduce(self, name: str, skipna: bool = True, **kwargs):
+		"""
+		Return a scalar result of performing the reduction operation.
+
+		The reduction is performed directly on the underlying buffer.
+
+		:param name: The name of the reduction. One of
+			``'sum'``, ``'mean'``, ``'median'``, ``'min'``, ``'max'``, ``'std'``, ``'var'`` or ``'sem'``.
+		:param skipna: If :py:obj:`True`, skip missing values.
+		:param kwargs: Additional keyword arguments passed by pandas, such as ``min_count`` and ``ddof``.
+
+		:return: An instance of the array's scalar type, except for ``'std'``, ``'var'`` and ``'sem'``
+			which describe the spread of the values and so return a :class:`float`.
+			The results are in the units the values are displayed in.
+			If the result is missing the array's :attr:`~.na_value` is returned.
+		"""
+
+		if name not in _reductions:
+			raise TypeError(f"cannot perform {name} with type {self.dtype}")
+
+		data = self.data
+		missing = self.isna()
+
+		if missing.any():
+			if not skipna:
+				return self.na_value
+
+			data = data[~missing]
+
+		n_values = len(data)
+		ddof = kwargs.get("ddof", 1)
+
+		if name == "sum":
+			if n_values < kwargs.get("min_count", 0):
+				return self.na_value
+		elif n_values == 0 or (name in {"std", "var", "sem"} and n_values <= ddof):
+			return self.na_value
+
+		# Accumulate in float64, as the sum of a lower precision buffer can easily overflow.
+		if name == "median":
+			result = numpy.median(data)
+		elif name in {"std", "var"}:
+			result = getattr(data, name)(ddof=ddof, dtype=numpy.float64)
+		elif name == "sem":
+			result = data.std(ddof=ddof, dtype=numpy.float64) / numpy.sqrt(n_values)
+		elif name in {"sum", "mean"}:
+			result = getattr(data, name)(dtype=numpy.float64)
+		else:
+			result = getattr(data, name)()
+
+		transform = self._display_transform
+
+		if name == "sum":
+			# Each displayed value is offset as well as scaled.
+			return self._display_type._from_float(float(result) * transform.scale + n_values * transform.offset)
+		elif name == "var":
+			return float(result) * transform.scale**2
+		elif _reductions[name]:
+			return self._box_scalar(float(result))
+		else:
+			return float(result) * abs(transform.scale)
+
+	def __iter__(self) -> Iterator[Any]:
+		"""
+		Iterate over the values in the array, as instances of the array's scalar type.
+		"""
+
+		return self.iter_values()
+
+	def iter_values(self, raw: bool = False) -> Iterator[Any]:
+		"""
+		Iterate over the values in the array.
+
+		The values are converted to Python floats a chunk at a time,
+		rather than indexing the array once for each element.
+
+		:param raw: If :py:obj:`True`, yields plain :class:`float` values, with NaN for missing values.
+			Otherwise yields instances of the array's scalar type, and :attr:`~.na_value` for missing values.
+		"""
+
+		from_float = self._display_type._from_float
+		na_value = self.na_value
+
+		for start in range(0, len(self), _iter_chunk_size):
+			chunk = self._to_display(self.data[start:start + _iter_chunk_size]).tolist()
+
+			if raw:
+				yield from chunk
+			elif self._mask is None:
+				yield from map(from_float, chunk)
+			else:
+				mask = self._mask[start:start + _iter_chunk_size].tolist()
+				for value, missing in zip(chunk, mask):
+					yield na_value if missing else from_float(value)
+
+	def __array__(self, dtype=None) -> numpy.ndarray:
+		"""
+		Convert the array to a NumPy ndarray.
+
+		By default the array contains instances of the array's scalar type.
+		Numeric dtypes are produced directly from the underlying buffer.
+
+		:param dtype: The dtype of the returned array.
+		"""
+
+		if dtype is not None and pandas.api.types.is_numeric_dtype(dtype):
+			return self.to_numpy(dtype)
+
+		result = numpy.empty(len(self), dtype=object)
+		result[:] = list(self.iter_values())
+
+		if dtype is None:
+			return result
+		else:
+			return result.astype(dtype)
+
+	def to_numpy(self, dtype=None, copy: bool = False, na_value=lib.no_default) -> numpy.ndarray:
+		"""
+		Convert the array to a NumPy ndarray.
+
+		Numeric dtypes are produced directly from the underlying buffer,
+		rather than by boxing each element into the array's scalar type.
+		pandas 1.2 hands the values to its Cython groupby routines this way.
+
+		:param dtype: The dtype of the returned array.
+		:param copy: If :py:obj:`True`, the returned array is never a view on the underlying buffer.
+		:param na_value: The value to use for missing values.
+		"""
+
+		if (
+				dtype is None or not pandas.api.types.is_numeric_dtype(dtype)
+				or pandas.api.types.is_extension_array_dtype(dtype)
+				):
+			return super().to_numpy(dtype=dtype, copy=copy, na_value=na_value)
+
+		dtype = numpy.dtype(dtype)
+		result = self._to_display(self.data)
+
+		if result is not self.data:
+			copy = False
+		missing = self.isna()
+
+		if missing.any():
+			if na_value is not lib.no_default:
+				result = result.copy()
+				result[missing] = na_value
+				copy = False
+			elif dtype.kind != 'f':
+				raise ValueError(
+						f"cannot convert to '{dtype}'-dtype NumPy array with missing values. "
+						"Specify an appropriate 'na_value' for this dtype."
+						)
+
+		return result.astype(dtype, copy=copy)
+
+	def _groupby_op(
+			self,
+			*,
+			how: str,
+			has_dropped_na: bool,
+			min_count: int,
+			ngroups: int,
+			ids: numpy.ndarray,
+			**kwargs,
+			):
+		"""
+		Perform a groupby aggregation or transformation directly on the underlying buffer.
+
+		This hook is used by pandas 2.1 and later, and relies on pandas' private Cython wrappers.
+		If those aren't available pandas' own fallback, which aggregates each group in Python, is used instead.
+
+		:param how: The name of the operation, e.g. ``'sum'`` or ``'cummax'``.
+		:param has_dropped_na:
+		:param min_count:
+		:param ngroups: The number of groups.
+		:param ids: The group each element of the array belongs to.
+		:param kwargs: Additional keyword arguments for the operation, such as ``ddof``.
+
+		:return: An array of the same type as this one, except for operations such as ``'std'`` and ``'rank'``
+			whose results are not in the units of the array, which return an ndarray.
+		"""
+
+		if how not in _groupby_ops:
+			raise TypeError(f"cannot perform {how} with type {self.dtype}")
+
+		try:
+			# 3rd party
+			from pandas.core.groupby.ops import WrappedCythonOp  # type: ignore
+
+			op = WrappedCythonOp(how=how, kind=WrappedCythonOp.get_kind_from_how(how), has_dropped_na=has_dropped_na)
+			cython_op = op._cython_op_ndim_compat
+		except (ImportError, AttributeError, TypeError):  # pragma: no cover
+			# pandas catches this and aggregates each group in Python.
+			raise NotImplementedError(f"{how} isn't supported with this version of pandas") from None
+
+		# Sums and spreads of the displayed values can't be found from those of the stored values
+		# with a single conversion, so operate on the displayed values instead.
+		result = cython_op(
+				self._to_display(self.data),
+				min_count=min_count,
+				ngroups=ngroups,
+				comp_ids=ids,
+				mask=None,
+				**kwargs,
+				)
+
+		if _groupby_ops[how]:
+			return self._from_backing_data(self._from_display(result))
+		else:
+			return result
+
+	#: Types other than quantities which may be combined with the array in ufuncs.
+	_HANDLED_TYPES: Tuple[Type, ...] = (numpy.ndarray, Real)
+
+	def __array_ufunc__(self, ufunc: numpy.ufunc, method: str, *inputs, **kwargs):
+		"""
+		Apply a NumPy ufunc to the underlying buffer.
+
+		The ufunc is called once on the unwrapped data, and results which are in the units
+		of the array are wrapped again without copying. In-place operations, such as ``arr += 1``,
+		write straight into the buffer given by ``out``.
+
+		:param ufunc:
+		:param method:
+		:param inputs:
+		:param kwargs:
+		"""
+
+		if method not in {"__call__", "reduce", "accumulate"}:
+			return NotImplemented
+		elif method != "__call__" and ufunc not in _reducing_ufuncs:
+			raise TypeError(f"cannot perform {ufunc.__name__}.{method} with type {self.dtype}")
+
+		out = kwargs.get("out", ())
+
+		for value in inputs + out:
+			if self._is_quantity(value):
+				continue
+			elif isinstance(value, (UserFloat, BaseArray)) or not isinstance(value, self._HANDLED_TYPES):
+				# Quantities of a different kind are not plain numbers.
+				return NotImplemented
+
+		in_units = self._ufunc_result_in_units(ufunc, tuple(map(self._is_quantity, inputs)))
+
+		if out and not in_units and any(isinstance(value, BaseArray) for value in out):
+			raise TypeError(f"cannot store the result of {ufunc.__name__} in an array with type {self.dtype}")
+
+		if self._display_transform.is_identity:
+			if out:
+				kwargs["out"] = tuple(map(self._unwrap_operand, out))
+
+			result = getattr(ufunc, method)(*map(self._unwrap_operand, inputs), **kwargs)
+
+		else:
+			# The array behaves as if it held the values it displays, so e.g. adding 1 to a temperature
+			# displayed in Fahrenheit adds 1 ℉, and the difference between two temperatures is in ℉.
+			kwargs.pop("out", None)
+			to_display = self._to_display
+			operands = (to_display(self._unwrap_operand(value)) if self._is_quantity(value) else value for value in inputs)
+			result = getattr(ufunc, method)(*operands, **kwargs)
+
+			if in_units:
+				result = self._from_display(result)
+
+			for value in out:
+				numpy.copyto(self._unwrap_operand(value), result, casting="same_kind")
+
+		if in_units and method == "__call__" and any(getattr(value, "_mask", None) is not None for value in inputs + out):
+			# Elements which are missing in any input are missing in the result,
+			# even where the ufunc (e.g. fmax) would have replaced the NaN.
+			mask = numpy.logical_or.reduce([value.isna() for value in inputs if isinstance(value, BaseArray)])
+
+			for value in (out or (result, )):
+				numpy.putmask(self._unwrap_operand(value), mask, numpy.nan)
+				if isinstance(value, BaseArray) and value._mask is not None:
+					value._mask[...] = mask
+		else:
+			mask = None
+
+		if out:
+			return out[0] if len(out) == 1 else out
+		elif not in_units:
+			return result
+		elif numpy.ndim(result) == 0:
+			return self._box_scalar(float(result))
+		else:
+			return self._from_backing_data(result, mask)
+
+	def _is_quantity(self, value: Any) -> bool:
+		"""
+		Returns whether ``value`` is an array or scalar in the same kind of units as this array.
+
+		:param value:
+		"""
+
+		return isinstance(value, (type(self), self._scalar_type))
+
+	@property
+	def _display_type(self) -> Type["UserFloat"]:
+		"""
+		The type of scalars returned from the array, which may differ from the units the values are stored in.
+		"""
+
+		return self._scalar_type
+
+	@property
+	def _display_transform(self) -> AffineTransform:
+		"""
+		The conversion from the units the values are stored in to the units they are displayed in.
+		"""
+
+		return _identity
+
+	def _to_display(self, values: Any) -> Any:
+		"""
+		Convert values from the units they are stored in to the units they are displayed in.
+
+		:param values: A float, or an ndarray such as :attr:`~.data`. Arrays are not modified.
+		"""
+
+		transform = self._display_transform
+
+		if transform.is_identity:
+			return values
+		else:
+			return transform(values)
+
+	def _from_display(self, values: Any) -> Any:
+		"""
+		Convert plain numbers in the units the values are displayed in to the units they are stored in.
+
+		:param values: A float or an ndarray. Arrays are not modified.
+		"""
+
+		transform = self._display_transform
+
+		if transform.is_identity:
+			return values
+		else:
+			return transform.inverse()(values)
+
+	def _box_scalar(self, value: float) -> "UserFloat":
+		"""
+		Returns a value from the underlying buffer as a scalar in the units the values are displayed in.
+
+		:param value:
+		"""
+
+		return self._display_type._from_float(float(self._to_display(value)))
+
+	def _unwrap_value(self, value: Any) -> Any:
+		"""
+		Returns the raw value of a quantity, or of a plain number in the units the values are displayed in.
+
+		Unlike :meth:`~._unwrap_operand`, plain numbers are taken to be values rather than differences or factors.
+
+		:param value:
+		"""
+
+		if value is None or self._is_quantity(value):
+			return self._unwrap_operand(value)
+		elif isinstance(value, Real) or (isinstance(value, numpy.ndarray) and value.dtype.kind in "biuf"):
+			return self._from_display(value)
+		else:
+			return value
+
+	def _unwrap_operand(self, value: Any) -> Any:
+		"""
+		Returns the raw value of a quantity in the units of this array.
+
+		Other values are returned unchanged.
+
+		:param value:
+		"""
+
+		if isinstance(value, BaseArray) and self._is_quantity(value):
+			return value.data
+		elif self._is_quantity(value):
+			# A Python float doesn't widen the result of operations on lower precision arrays.
+			return float(self._parser(value).data[0])
+		else:
+			return value
+
+	def _ufunc_result_in_units(self, ufunc: numpy.ufunc, quantities: Tuple[bool, ...]) -> bool:
+		"""
+		Returns whether the result of ``ufunc`` is in the units of this array.
+
+		:param ufunc:
+		:param quantities: For each input to the ufunc, whether it is a quantity.
+
+		:raises TypeError: If the operation is not meaningful for quantities.
+		"""
+
+		if ufunc in _unitless_ufuncs:
+			return False
+		elif ufunc in _unit_preserving_ufuncs:
+			return True
+		elif ufunc in _scaling_ufuncs:
+			# A quantity may be multiplied or divided by a plain number, but not the other way round.
+			if quantities == (True, False) or (ufunc is numpy.multiply and quantities == (False, True)):
+				return True
+
+		raise TypeError(f"cannot perform {ufunc.__name__} with type {self.dtype}")
+
+	def clip(self, lower=None, upper=None, out=None):
+		"""
+		Limit the values in the array to the interval ``[lower, upper]``.
+
+		:param lower: The lower bound. If :py:obj:`None` the values are not clipped from below.
+		:param upper: The upper bound. If :py:obj:`None` the values are not clipped from above.
+		:param out: An array to place the result in. May be this array.
+		"""
+
+		result = numpy.clip(
+				self.data,
+				self._unwrap_value(lower),
+				self._unwrap_value(upper),
+				out=self._unwrap_operand(out),
+				)
+
+		if out is None:
+			return self._from_backing_data(result, None if self._mask is None else self._mask.copy())
+		else:
+			return out
+
+	def _cmp_method(self, other: Any, op) -> numpy.ndarray:
+		"""
+		Compare the array with ``other`` directly on the underlying buffer.
+
+		:param other: A number, a scalar or array in the units of this array, or a sequence of values
+			which can be parsed into such an array.
+		:param op: The comparison operator, e.g. :func:`operator.lt`.
+
+		:return: A boolean ndarray with the same length as the array.
+			If ``other`` cannot be compared with the array, ``==`` is :py:obj:`False`
+			and ``!=`` is :py:obj:`True` for every element, while ordering comparisons raise a :exc:`TypeError`.
+		"""
+
+		if isinstance(other, (pandas.DataFrame, pandas.Series, pandas.Index)):
+			# Let pandas unbox the values and align the indices.
+			return NotImplemented
+
+		if self._is_quantity(other):
+			other = self._unwrap_operand(other)
+		elif isinstance(other, (UserFloat, BaseArray)):
+			# A quantity of a different kind, e.g. a length compared with a pressure.
+			return self._invalid_comparison(other, op)
+		elif isinstance(other, numpy.ndarray) and other.dtype.kind in "biuf":
+			other = self._from_display(other)
+		elif isinstance(other, (numpy.ndarray, list, tuple)):
+			try:
+				other = self._parser(other).data.astype(self.data.dtype, copy=False)
+			except (TypeError, ValueError):
+				return self._invalid_comparison(other, op)
+		elif isinstance(other, Real):
+			other = self._from_display(other)
+		else:
+			return self._invalid_comparison(other, op)
+
+		if numpy.ndim(other) and len(other) != len(self):
+			raise ValueError("Lengths must match to compare")
+
+		return op(self.data, other)
+
+	def _invalid_comparison(self, other: Any, op) -> numpy.ndarray:
+		if op is operator.eq:
+			return numpy.zeros(len(self), dtype=bool)
+		elif op is operator.ne:
+			return numpy.ones(len(self), dtype=bool)
 		else:
-			return self.data == self.na_value
+			raise TypeError(
+					f"'{_comparison_symbols[op]}' not supported between instances of "
+					f"{type(self).__name__!r} and {type(other).__name__!r}"
+					)
+
+	def __eq__(self, other):  # type: ignore
+		return self._cmp_method(other, operator.eq)
+
+	def __ne__(self, other):  # type: ignore
+		return self._cmp_method(other, operator.ne)
+
+	def __lt__(self, other):
+		return self._cmp_method(other, operator.lt)
+
+	def __le__(self, other):
+		return self._cmp_method(other, operator.le)
+
+	def __gt__(self, other):
+		return self._cmp_method(other, operator.gt)
+
+	def __ge__(self, other):
+		return self._cmp_method(other, operator.ge)
 
 	# From https://github.com/scikit-hep/awkward-array/blob/2bbdb68d7a4fff2eeaed81eb76195e59232e8c13/awkward/array/base.py#L611
 	def _isstringslice(self, where):
@@ -342,16 +1363,372 @@ class BaseArray(numpy.lib.mixins.NDArrayOperatorsMixin, NumPyBackedExtensionArra
 		"""
 		Append a value to this BaseArray.
 
+		This reallocates the whole array, so to build an array one value at a time
+		use a :class:`~.BaseArrayBuffer` instead.
+
 		:param value:
 		"""
 
-		self.data = numpy.append(self.data, self._parser(value).data)
+		values = self._parser(value).data.astype(self.data.dtype, copy=False)
+		self.data = numpy.append(self.data, values)
+
+		if self._mask is not None:
+			self._mask = numpy.append(self._mask, numpy.isnan(values))
+
+	def isin(self, values, tolerance: Optional[float] = None) -> numpy.ndarray:
+		"""
+		Check whether elements of `self` are in ``values``.
+
+		The candidate values are sorted once, and each element is then located with a binary search,
+		so the comparison takes ``O(n log m)`` time rather than ``O(n * m)``.
+		Missing values in ``self`` only match if ``values`` also contains a missing value.
+
+		:param values: The values to look for.
+		:param tolerance: If given, elements match any value within this absolute distance of them.
+
+		:return: A 1-D boolean ndarray with the same length as self.
+		"""
+
+		if tolerance is not None and not tolerance >= 0:
+			raise ValueError(f"'tolerance' must be a non-negative number, not {tolerance!r}")
+
+		values = self._parser(values).data.astype(self.data.dtype, copy=False)
+
+		if tolerance is not None:
+			# The tolerance is a distance in the units the values are displayed in.
+			tolerance = tolerance / abs(self._display_transform.scale)
+
+		return _isin_sorted(self.data, values, tolerance)
 
 	def __setitem__(self, key, value):
 
+		if value is None or value is pandas.NA:
+			value = self.na_value
+
 		value = self._parser(value).data
 		self.data[key] = value
 
+		if self._mask is not None:
+			# Missing values, including NaN, are masked.
+			self._mask[key] = numpy.isnan(value)
+
+
+def _parse_float_strings(
+		values: Union[numpy.ndarray, Sequence[str]],
+		suffixes: str,
+		errors: Literal["raise", "coerce"] = "raise",
+		) -> Tuple[numpy.ndarray, numpy.ndarray]:
+	"""
+	Parse an array of strings into a float64 array.
+
+	Any trailing characters in ``suffixes`` (e.g. unit symbols) are stripped before parsing.
+
+	:param values: An object or unicode array of strings.
+	:param suffixes: The characters to strip from the end of each string.
+	:param errors: If ``'raise'``, a :exc:`ValueError` is raised if any value cannot be parsed.
+		If ``'coerce'``, such values are set to NaN.
+
+	:return: The parsed values, and a boolean mask of the values which could not be parsed.
+	"""
+
+	if errors not in {"raise", "coerce"}:
+		raise ValueError(f"'errors' must be either 'raise' or 'coerce', not {errors!r}")
+
+	values = numpy.asarray(values).reshape(-1).tolist()
+
+	# Python's float() is quicker than pandas.to_numeric for strings, and unlike a fixed-width unicode array
+	# needs no more memory for a long string than for a short one.
+	try:
+		parsed = numpy.array([float(value.rstrip(suffixes)) for value in values], dtype=numpy.float64)
+		return parsed, numpy.zeros(len(parsed), dtype=bool)
+	except (AttributeError, TypeError, ValueError):
+		# There are values which aren't strings, or can't be parsed.
+		pass
+
+	parsed = numpy.empty(len(values), dtype=numpy.float64)
+	failed = numpy.zeros(len(values), dtype=bool)
+
+	for idx, value in enumerate(values):
+		try:
+			parsed[idx] = float(value.rstrip(suffixes) if isinstance(value, str) else value)
+			continue
+		except (TypeError, ValueError):
+			parsed[idx] = numpy.nan
+
+		if value is None or value is pandas.NA:
+			continue
+		elif errors == "raise":
+			raise ValueError(f"could not convert string to float: {value!r}")
+		else:
+			failed[idx] = True
+
+	return parsed, failed
+
+
+_B = TypeVar("_B", bound=BaseArray)
+
+
+class BaseArrayBuffer(Generic[_B]):
+	"""
+	Growable buffer for building a :class:`~.BaseArray` one value at a time.
+
+	The capacity of the buffer grows geometrically, so appending ``n`` values takes amortised
+	``O(n)`` time rather than the ``O(n²)`` of repeatedly calling :meth:`BaseArray.append`.
+
+	:param capacity: The number of values the buffer can hold before it is first reallocated.
+	:param dtype: The dtype of the arrays built by the buffer. If :py:obj:`None` the values are 64-bit floats.
+		Plain numbers appended to the buffer are in the units this dtype displays values in.
+	"""
+
+	_array_type: Type[_B]
+
+	def __init__(self, capacity: int = 1024, dtype: Any = None):
+		if capacity < 1:
+			raise ValueError("'capacity' must be at least 1.")
+
+		self._dtype = self._array_type._validate_dtype(dtype)
+		self._record_type = numpy.dtype(self._dtype._record_type)
+		self._initial_capacity = int(capacity)
+		self._data = self._empty(self._initial_capacity)
+		self._size = 0
+
+		transform = self._array_type._from_ndarray(self._data[:0], dtype=self._dtype)._display_transform
+		self._from_display = None if transform.is_identity else transform.inverse()
+
+	def _empty(self, capacity: int) -> numpy.ndarray:
+		return numpy.empty(capacity, dtype=self._record_type)
+
+	@property
+	@abstractmethod
+	def _parser(self):
+		raise NotImplementedError
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of values in the buffer.
+		"""
+
+		return self._size
+
+	@property
+	def capacity(self) -> int:
+		"""
+		The number of values the buffer can hold before it is reallocated.
+		"""
+
+		return len(self._data)
+
+	def _reserve(self, n_values: int) -> None:
+		"""
+		Ensure there is room for another ``n_values`` values, growing the buffer if necessary.
+
+		:param n_values:
+		"""
+
+		required = self._size + n_values
+
+		if required > len(self._data):
+			data = self._empty(max(required, 2 * len(self._data)))
+			data[:self._size] = self._data[:self._size]
+			self._data = data
+
+	def append(self, value) -> None:
+		"""
+		Append a value to the buffer.
+
+		:param value:
+		"""
+
+		if isinstance(value, (float, int, numpy.number)):
+			if self._size == len(self._data):
+				self._reserve(1)
+
+			if self._from_display is None:
+				self._data[self._size] = value
+			else:
+				self._data[self._size] = self._from_display(value)
+
+			self._size += 1
+		else:
+			self.extend(self._parser(value))
+
+	def extend(self, values) -> None:
+		"""
+		Append several values to the buffer.
+
+		:param values:
+		"""
+
+		if isinstance(values, BaseArray):
+			data = values.data
+		else:
+			data = self._parser(values).data
+
+		n_values = len(data)
+		self._reserve(n_values)
+		self._data[self._size:self._size + n_values] = data
+		self._size += n_values
+
+	def view(self) -> _B:
+		"""
+		Returns an array which views the values in the buffer without copying them.
+
+		The view reflects later changes to existing values, but not values appended afterwards.
+		"""
+
+		return self._array_type._from_ndarray(self._data[:self._size], dtype=self._dtype)
+
+	def freeze(self) -> _B:
+		"""
+		Returns an array of the values in the buffer without copying them, and empties the buffer.
+
+		The buffer no longer refers to the returned array, and so may be reused.
+
+		.. note::
+
+			The returned array keeps the buffer's whole allocation alive, which may be up to twice
+			the size of the data. Use :meth:`~.BaseArray.copy` to release the unused capacity.
+		"""
+
+		array = self.view()
+
+		self._data = self._empty(self._initial_capacity)
+		self._size = 0
+
+		return array
+
+
+def _buffer_root(array: numpy.ndarray) -> Any:
+	"""
+	Returns the object which owns the memory of ``array``.
+
+	:param array:
+	"""
+
+	while isinstance(array.base, numpy.ndarray):
+		array = array.base
+
+	if array.base is None:
+		return array
+	else:
+		return array.base
+
+
+def unique_nbytes(arrays: Iterable[Any]) -> int:
+	"""
+	Returns the number of bytes used by the given arrays, counting memory shared between them only once.
+
+	Unlike summing :attr:`~.NumPyBackedExtensionArrayMixin.nbytes`, or
+	:meth:`pandas.DataFrame.memory_usage`, columns which are views of the same buffer
+	are not counted twice. For each buffer the bytes spanned by the arrays which refer to it are counted.
+
+	:param arrays: The arrays, which may be instances of :class:`~.BaseArray`,
+		:class:`pandas.Series` or :class:`numpy.ndarray`.
+
+	.. code-block:: python
+
+		unique_nbytes(df[column] for column in df.columns)
+	"""
+
+	extents: Dict[int, List[Tuple[int, int]]] = {}
+	roots = []
+
+	for array in arrays:
+		array = getattr(array, "array", array)
+
+		if isinstance(array, BaseArray):
+			buffers = [array.data] if array._mask is None else [array.data, array._mask]
+		else:
+			buffers = [numpy.asarray(array)]
+
+		for buffer in buffers:
+			if not buffer.size:
+				continue
+
+			root = _buffer_root(buffer)
+			# Keep the roots alive so their ids are not reused.
+			roots.append(root)
+			extents.setdefault(id(root), []).append(numpy.byte_bounds(buffer))
+
+	total = 0
+
+	for bounds in extents.values():
+		bounds.sort()
+		start, end = bounds[0]
+
+		for low, high in bounds[1:]:
+			if low > end:
+				total += end - start
+				start = low
+			end = max(end, high)
+
+		total += end - start
+
+	return total
+
+
+def _isin_sorted(data: numpy.ndarray, values: numpy.ndarray, tolerance: Optional[float] = None) -> numpy.ndarray:
+	"""
+	Returns a boolean mask of the elements of ``data`` which are in ``values``.
+
+	:param data:
+	:param values:
+	:param tolerance: If given, elements match any value within this absolute distance of them.
+	"""
+
+	missing = numpy.isnan(values)
+	candidates = numpy.unique(values[~missing])
+
+	if len(candidates):
+		# NaNs in data sort after all the candidates, so never match.
+		index = numpy.searchsorted(candidates, data)
+		right = candidates[numpy.minimum(index, len(candidates) - 1)]
+		mask = right == data
+
+		if tolerance:
+			left = candidates[numpy.maximum(index - 1, 0)]
+			mask |= numpy.abs(right - data) <= tolerance
+			mask |= numpy.abs(data - left) <= tolerance
+	else:
+		mask = numpy.zeros(len(data), dtype=bool)
+
+	if missing.any():
+		mask |= numpy.isnan(data)
+
+	return mask
+
+
+def _format_with_suffix(data: numpy.ndarray, suffix: str) -> numpy.ndarray:
+	"""
+	Format an array of floats as strings, each followed by ``suffix``.
+
+	The numbers are formatted in the same way as :func:`str`, and the suffix is appended
+	by writing directly into the array's UCS4 code points rather than concatenating one string at a time.
+
+	:param data:
+	:param suffix: The string to append to each value, e.g. a unit symbol.
+	"""
+
+	text = numpy.asarray(data, dtype=numpy.float64).reshape(-1).astype(str)
+
+	n_values = len(text)
+	width = text.dtype.itemsize // 4
+
+	formatted = numpy.zeros(n_values, dtype=f"<U{width + len(suffix)}")
+
+	if n_values:
+		codes = formatted.view(numpy.uint32).reshape(n_values, -1)
+		codes[:, :width] = text.view(numpy.uint32).reshape(n_values, width)
+
+		# Strings are left-aligned and NUL-padded, so the length is the number of non-NUL code points.
+		lengths = numpy.count_nonzero(codes, axis=1)
+		rows = numpy.arange(n_values)
+
+		for offset, char in enumerate(suffix):
+			codes[rows, lengths + offset] = ord(char)
+
+	return formatted
+
 
 class _SupportsIndex(Protocol):
 
@@ -372,8 +1749,36 @@ class UserFloat(Real):
 	.. versionadded:: 1.6.0
 	"""
 
+	# The value is stored as a plain float, without a per-instance ``__dict__``.
+	__slots__ = ("_value", )
+
 	def __init__(self, value: Union[SupportsFloat, _SupportsIndex, str, bytes, bytearray] = 0.0):
-		self._value = (float(value), )
+		self._value = float(value)
+
+	@classmethod
+	def _from_float(cls: Type[_F], value: float) -> _F:
+		"""
+		Construct a new instance from a :class:`float`, without calling :meth:`__init__`.
+
+		:param value: Must already be a :class:`float`. It is not converted or parsed.
+		"""
+
+		new = cls.__new__(cls)
+		new._value = value
+		return new
+
+	def _wrap(self: _F, value: float) -> _F:
+		"""
+		Returns ``value``, the result of a :class:`float` operation, as an instance of this class.
+
+		:py:obj:`NotImplemented` is passed through so Python can try the other operand.
+
+		:param value:
+		"""
+
+		if value is NotImplemented:
+			return value
+		return self._from_float(value)
 
 	def as_integer_ratio(self) -> Tuple[int, int]:
 		return float(self).as_integer_ratio()
@@ -389,55 +1794,65 @@ class UserFloat(Real):
 		return cls(float.fromhex(__s))
 
 	def __add__(self: _F, other: float) -> _F:
-		return self.__class__(float(self).__add__(other))
+		return self._wrap(self._value.__add__(other))
 
 	def __sub__(self: _F, other: float) -> _F:
-		return self.__class__(float(self).__sub__(other))
+		return self._wrap(self._value.__sub__(other))
 
 	def __mul__(self: _F, other: float) -> _F:
-		return self.__class__(float(self).__mul__(other))
+		return self._wrap(self._value.__mul__(other))
 
 	def __floordiv__(self: _F, other: float) -> _F:  # type: ignore
-		return self.__class__(float(self).__floordiv__(other))
+		return self._wrap(self._value.__floordiv__(other))
 
 	def __truediv__(self: _F, other: float) -> _F:
-		return self.__class__(float(self).__truediv__(other))
+		return self._wrap(self._value.__truediv__(other))
 
 	def __mod__(self: _F, other: float) -> _F:
-		return self.__class__(float(self).__mod__(other))
+		return self._wrap(self._value.__mod__(other))
 
 	def __divmod__(self: _F, other: float) -> Tuple[_F, _F]:
-		return tuple(self.__class__(x) for x in float(self).__divmod__(other))  # type: ignore
+		result = self._value.__divmod__(other)
+		if result is NotImplemented:
+			return result
+		return tuple(map(self._from_float, result))  # type: ignore
 
 	def __pow__(self: _F, other: float, mod=None) -> _F:
-		return self.__class__(float(self).__pow__(other, mod))
+		return self._wrap(self._value.__pow__(other, mod))
 
 	def __radd__(self: _F, other: float) -> _F:
-		return self.__class__(float(self).__radd__(other))
+		return self._wrap(self._value.__radd__(other))
 
 	def __rsub__(self: _F, other: float) -> _F:
-		return self.__class__(float(self).__rsub__(other))
+		return self._wrap(self._value.__rsub__(other))
 
 	def __rmul__(self: _F, other: float) -> _F:
-		return self.__class__(float(self).__rmul__(other))
+		return self._wrap(self._value.__rmul__(other))
 
 	def __rfloordiv__(self: _F, other: float) -> _F:  # type: ignore
-		return self.__class__(float(self).__rfloordiv__(other))
+		return self._wrap(self._value.__rfloordiv__(other))
 
 	def __rtruediv__(self: _F, other: float) -> _F:
-		return self.__class__(float(self).__rtruediv__(other))
+		return self._wrap(self._value.__rtruediv__(other))
 
 	def __rmod__(self: _F, other: float) -> _F:
-		return self.__class__(float(self).__rmod__(other))
+		return self._wrap(self._value.__rmod__(other))
 
 	def __rdivmod__(self: _F, other: float) -> Tuple[_F, _F]:
-		return tuple(self.__class__(x) for x in float(self).__rdivmod__(other))  # type: ignore
+		result = self._value.__rdivmod__(other)
+		if result is NotImplemented:
+			return result
+		return tuple(map(self._from_float, result))  # type: ignore
 
 	def __rpow__(self: _F, other: float, mod=None) -> _F:
-		return self.__class__(float(self).__rpow__(other, mod))
+		return self._wrap(self._value.__rpow__(other, mod))
 
 	def __getnewargs__(self) -> Tuple[float]:
-		return self._value
+		return (self._value, )
+
+	def __reduce__(self):
+		# Pickle as the class and a single float, rather than the instance dict.
+		return self.__class__, (self._value, )
 
 	def __trunc__(self) -> int:
 		return float(self).__trunc__()
@@ -454,46 +1869,46 @@ class UserFloat(Real):
 		return float(self).__round__(ndigits)
 
 	def __eq__(self, other: object) -> bool:
-		if isinstance(other, UserFloat):
+		result = self._value.__eq__(other)
+		if result is NotImplemented and isinstance(other, UserFloat):
 			return self._value == other._value
-		else:
-			return float(self).__eq__(other)
+		return result
 
 	def __ne__(self, other: object) -> bool:
-		if isinstance(other, UserFloat):
+		result = self._value.__ne__(other)
+		if result is NotImplemented and isinstance(other, UserFloat):
 			return self._value != other._value
-		else:
-			return float(self).__ne__(other)
+		return result
 
 	def __lt__(self, other: float) -> bool:
-		if isinstance(other, UserFloat):
+		result = self._value.__lt__(other)
+		if result is NotImplemented and isinstance(other, UserFloat):
 			return self._value < other._value
-		else:
-			return float(self).__lt__(other)
+		return result
 
 	def __le__(self, other: float) -> bool:
-		if isinstance(other, UserFloat):
+		result = self._value.__le__(other)
+		if result is NotImplemented and isinstance(other, UserFloat):
 			return self._value <= other._value
-		else:
-			return float(self).__le__(other)
+		return result
 
 	def __gt__(self, other: float) -> bool:
-		if isinstance(other, UserFloat):
+		result = self._value.__gt__(other)
+		if result is NotImplemented and isinstance(other, UserFloat):
 			return self._value > other._value
-		else:
-			return float(self).__gt__(other)
+		return result
 
 	def __ge__(self, other: float) -> bool:
-		if isinstance(other, UserFloat):
+		result = self._value.__ge__(other)
+		if result is NotImplemented and isinstance(other, UserFloat):
 			return self._value >= other._value
-		else:
-			return float(self).__ge__(other)
+		return result
 
 	def __neg__(self: _F) -> _F:
-		return self.__class__(float(self).__neg__())
+		return self._from_float(self._value.__neg__())
 
 	def __pos__(self: _F) -> _F:
-		return self.__class__(float(self).__pos__())
+		return self._from_float(self._value.__pos__())
 
 	def __str__(self) -> str:
 		return str(float(self))
@@ -502,13 +1917,13 @@ class UserFloat(Real):
 		return int(float(self))
 
 	def __float__(self) -> float:
-		return self._value[0]
+		return self._value
 
 	def __abs__(self: _F) -> _F:
-		return self.__class__(float(self).__abs__())
+		return self._from_float(self._value.__abs__())
 
 	def __hash__(self) -> int:
-		return float(self).__hash__()
+		return self._value.__hash__()
 
 	def __repr__(self) -> str:
 		return str(self)
@@ -0,0 +1,667 @@
+#!/usr/bin/env python3
+#
+#  quantities.py
+"""
+Extension dtypes for quantities in SI units, such as pressure, length and mass.
+"""
+#
+#  Copyright (c) 2020 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are met:
+#
+#  * Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+#  * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+#  * Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#  AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+#  IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+#  DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+#  FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+#  DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+#  SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+#  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+#  OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+#  OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+# stdlib
+import operator
+import re
+from typing import Any, Dict, Optional, Sequence, Tuple, Type, Union
+
+# 3rd party
+import numpy  # type: ignore
+import pandas  # type: ignore
+from pandas.api.extensions import ExtensionDtype  # type: ignore
+from pandas.api.types import infer_dtype  # type: ignore
+from pandas.core.dtypes.inference import is_list_like  # type: ignore
+from typing_extensions import Literal
+
+# this package
+from si_unit_pandas.base import BaseArray, UserFloat, _format_with_suffix, _parse_float_strings
+
+__all__ = [
+		"Kelvin",
+		"KelvinArray",
+		"KelvinType",
+		"Kilogram",
+		"KilogramArray",
+		"KilogramType",
+		"Metre",
+		"MetreArray",
+		"MetreType",
+		"Pascal",
+		"PascalArray",
+		"PascalType",
+		"Quantity",
+		"QuantityArray",
+		"QuantityType",
+		"Second",
+		"SecondArray",
+		"SecondType",
+		"parse_quantity_strings",
+		"to_quantity",
+		]
+
+_to_quantity_types = Union[float, str, Sequence[Union[float, str]]]
+
+_precisions = Literal["float16", "float32", "float64"]
+
+#: The SI prefixes, and the power of ten each represents.
+_si_prefixes = {
+		'Y': 24,
+		'Z': 21,
+		'E': 18,
+		'P': 15,
+		'T': 12,
+		'G': 9,
+		'M': 6,
+		'k': 3,
+		'h': 2,
+		"da": 1,
+		'': 0,
+		'd': -1,
+		'c': -2,
+		'm': -3,
+		'µ': -6,  # micro sign
+		'μ': -6,  # Greek small letter mu
+		'u': -6,
+		'n': -9,
+		'p': -12,
+		'f': -15,
+		'a': -18,
+		'z': -21,
+		'y': -24,
+		}
+
+#: Matches a number, optionally followed by a unit symbol, e.g. ``101.3 kPa``.
+_quantity_pattern = re.compile(
+		r"^\s*(?P<number>.*?[\d.]|[-+]?(?:[nN][aA][nN]|[iI][nN][fF](?:[iI][nN][iI][tT][yY])?))"
+		r"\s*(?P<unit>[^\d\s.+-]*)\s*$"
+		)
+
+# -----------------------------------------------------------------------------
+# Scalars
+# -----------------------------------------------------------------------------
+
+
+class Quantity(UserFloat):
+	"""
+	Base class for quantities in SI units.
+
+	Strings may include the symbol of the unit, with an SI prefix, e.g. ``Pascal("101.3 kPa")``.
+	"""
+
+	__slots__ = ()
+
+	#: The symbol of the unit, e.g. ``'Pa'``.
+	symbol: str
+
+	def __init__(self, value=0.0):
+		if isinstance(value, str):
+			value = parse_quantity_strings([value], unit=self.symbol)[0][0]
+
+		super().__init__(value)
+
+	def __str__(self) -> str:
+		"""
+		Return the quantity as a string.
+		"""
+
+		return f"{float(self)} {self.symbol}"
+
+	def __repr__(self) -> str:
+		"""
+		Return a string representation of the quantity.
+		"""
+
+		return str(self)
+
+
+class Pascal(Quantity):
+	"""
+	:class:`float` subclass representing a pressure in pascals.
+	"""
+
+	__slots__ = ()
+	symbol = "Pa"
+
+
+class Metre(Quantity):
+	"""
+	:class:`float` subclass representing a length in metres.
+	"""
+
+	__slots__ = ()
+	symbol = 'm'
+
+
+class Kilogram(Quantity):
+	"""
+	:class:`float` subclass representing a mass in kilograms.
+	"""
+
+	__slots__ = ()
+	symbol = "kg"
+
+
+class Second(Quantity):
+	"""
+	:class:`float` subclass representing a duration in seconds.
+	"""
+
+	__slots__ = ()
+	symbol = 's'
+
+
+class Kelvin(Quantity):
+	"""
+	:class:`float` subclass representing a thermodynamic temperature in kelvin.
+	"""
+
+	__slots__ = ()
+	symbol = 'K'
+
+
+# -----------------------------------------------------------------------------
+# Extension Types
+# -----------------------------------------------------------------------------
+
+
+class QuantityType(ExtensionDtype):
+	"""
+	Base class for the dtypes of quantities in SI units.
+
+	The values are stored in the SI unit of the quantity, e.g. pascals for pressures.
+
+	:param precision: The precision of the floats used to store the values.
+	"""
+
+	name: str
+	type: Type[Quantity]  # noqa: A003  # pylint: disable=redefined-builtin
+	kind: str = 'O'
+	_record_type: Type = numpy.float64
+	_metadata = ("precision", )
+
+	#: The symbol SI prefixes are attached to, e.g. ``'g'`` for kilograms.
+	_prefix_symbol: str
+
+	#: The prefix of the SI unit, e.g. ``'k'`` for kilograms.
+	_unit_prefix: str = ''
+
+	def __init__(self, precision: _precisions = "float64"):
+		try:
+			precision = numpy.dtype(precision).name
+		except TypeError:
+			pass
+
+		if precision not in {"float16", "float32", "float64"}:
+			raise ValueError(f"Unsupported precision {precision!r}. Expected one of float16, float32, float64.")
+
+		self.precision: str = precision
+		self._record_type = numpy.dtype(precision)
+
+		if precision != "float64":
+			self.name = f"{type(self).name}[{precision}]"
+
+	def __repr__(self) -> str:
+		return f"{type(self).__name__}(precision={self.precision!r})"
+
+	@classmethod
+	def construct_from_string(cls, string):
+		"""
+		Construct the dtype from a string.
+
+		:param string: Either the name of the dtype, e.g. ``'pascal'``,
+			or the name with a precision, e.g. ``'pascal[float32]'``.
+		"""
+
+		if isinstance(string, str):
+			match = re.fullmatch(rf"{re.escape(cls.name)}(?:\[(float16|float32|float64)\])?", string)
+			if match:
+				return cls(match.group(1) or "float64")
+
+		raise TypeError(f"Cannot construct a '{cls.__name__}' from '{string}'")
+
+	@property
+	def _is_numeric(self) -> bool:
+		"""
+		Whether columns with this dtype should be considered numeric.
+		"""
+
+		return True
+
+	@property
+	def _is_boolean(self) -> bool:
+		"""
+		Whether this dtype should be considered boolean.
+		"""
+
+		return False
+
+	def _get_common_dtype(self, dtypes):
+		"""
+		Returns the dtype to use when concatenating arrays with the given dtypes.
+
+		Arrays of the same quantity with different precisions are combined using the highest precision.
+
+		:param dtypes:
+		"""
+
+		if all(isinstance(dtype, type(self)) for dtype in dtypes):
+			return type(self)(numpy.result_type(*(dtype._record_type for dtype in dtypes)).name)
+		else:
+			return None
+
+
+@pandas.api.extensions.register_extension_dtype
+class PascalType(QuantityType):
+	"""
+	Numpy dtype representing a pressure in pascals.
+	"""
+
+	name: str = "pascal"
+	type = Pascal  # noqa: A003  # pylint: disable=redefined-builtin
+	_prefix_symbol = "Pa"
+
+	@classmethod
+	def construct_array_type(cls) -> Type["PascalArray"]:  # noqa: D102
+		return PascalArray
+
+
+@pandas.api.extensions.register_extension_dtype
+class MetreType(QuantityType):
+	"""
+	Numpy dtype representing a length in metres.
+	"""
+
+	name: str = "metre"
+	type = Metre  # noqa: A003  # pylint: disable=redefined-builtin
+	_prefix_symbol = 'm'
+
+	@classmethod
+	def construct_array_type(cls) -> Type["MetreArray"]:  # noqa: D102
+		return MetreArray
+
+
+@pandas.api.extensions.register_extension_dtype
+class KilogramType(QuantityType):
+	"""
+	Numpy dtype representing a mass in kilograms.
+	"""
+
+	name: str = "kilogram"
+	type = Kilogram  # noqa: A003  # pylint: disable=redefined-builtin
+	_prefix_symbol = 'g'
+	_unit_prefix = 'k'
+
+	@classmethod
+	def construct_array_type(cls) -> Type["KilogramArray"]:  # noqa: D102
+		return KilogramArray
+
+
+@pandas.api.extensions.register_extension_dtype
+class SecondType(QuantityType):
+	"""
+	Numpy dtype representing a duration in seconds.
+	"""
+
+	name: str = "second"
+	type = Second  # noqa: A003  # pylint: disable=redefined-builtin
+	_prefix_symbol = 's'
+
+	@classmethod
+	def construct_array_type(cls) -> Type["SecondArray"]:  # noqa: D102
+		return SecondArray
+
+
+@pandas.api.extensions.register_extension_dtype
+class KelvinType(QuantityType):
+	"""
+	Numpy dtype representing a thermodynamic temperature in kelvin.
+	"""
+
+	name: str = "kelvin"
+	type = Kelvin  # noqa: A003  # pylint: disable=redefined-builtin
+	_prefix_symbol = 'K'
+
+	@classmethod
+	def construct_array_type(cls) -> Type["KelvinArray"]:  # noqa: D102
+		return KelvinArray
+
+
+#: Mapping of unit symbols, with each SI prefix, to the dtype of the quantity
+#: and the power of ten of the unit relative to the SI unit. For example, ``'kPa'`` maps to ``(PascalType, 3)``.
+_units: Dict[str, Tuple[Type[QuantityType], int]] = {}
+
+for _dtype in (PascalType, MetreType, KilogramType, SecondType, KelvinType):
+	for _prefix, _power in _si_prefixes.items():
+		_units[_prefix + _dtype._prefix_symbol] = (_dtype, _power - _si_prefixes[_dtype._unit_prefix])
+
+del _dtype, _prefix, _power
+
+# -----------------------------------------------------------------------------
+# Extension Containers
+# -----------------------------------------------------------------------------
+
+
+class QuantityArray(BaseArray):
+	"""
+	Base class for arrays of quantities in SI units.
+
+	Numbers are taken to be in ``unit``, and strings may give their own unit with an SI prefix,
+	e.g. ``'101.3 kPa'``. The values are converted to the SI unit when the array is created.
+
+	:param data: The values.
+	:param dtype: The dtype of the array. Used to choose the precision.
+	:param copy: Whether to copy the data.
+	:param unit: The unit of numbers, and of strings without a unit, e.g. ``'kPa'``.
+		Defaults to the SI unit of the quantity.
+	"""
+
+	__array_priority__: int = 1000
+	_dtype: QuantityType
+	_scalar_type: Type[Quantity]
+	can_hold_na: bool = True
+
+	def __init__(self, data, dtype=None, copy: bool = False, unit: Optional[str] = None):
+
+		if isinstance(data, type(self)) and unit is None:
+			data = data.data
+		else:
+			original = data.data if isinstance(data, QuantityArray) else data
+			data = _to_quantity_array(data, type(self._dtype), unit=unit)
+
+			if data is not original and data.base is None:
+				# The values were converted into a new buffer, which needn't be copied again.
+				copy = False
+
+		if dtype is not None:
+			record_type = self._storage_type(dtype)
+
+			if data.dtype != record_type:
+				data = data.astype(record_type)
+				copy = False
+
+		if copy:
+			data = data.copy()
+
+		self.data = data
+
+	def __getitem__(self, item: Union[int, slice, numpy.ndarray]) -> Any:
+		"""
+		Select a subset of self.
+
+		:param item:
+			* int: The position in 'self' to get.
+
+			* slice: A slice object, where 'start', 'stop', and 'step' are integers or None.
+
+			* ndarray: A 1-d boolean NumPy ndarray the same length as 'self'
+
+		:rtype: scalar or ExtensionArray
+		"""
+
+		result = operator.getitem(self.data, item)
+
+		if result.ndim == 0:
+			return self._scalar_type._from_float(result.item())
+		else:
+			return self._from_ndarray(result)
+
+	def _format_values(self) -> numpy.ndarray:
+		"""
+		Returns an array of strings representing the values in the array.
+		"""
+
+		return _format_with_suffix(self.data, f" {self._scalar_type.symbol}")
+
+	@property
+	def _parser(self):
+		return type(self)
+
+	def astype(self, dtype, copy=True):
+		"""
+		Returns the array with its values as the given dtype.
+
+		:param dtype:
+		:param copy: If :py:obj:`True`, returns a copy of the array.
+		"""
+
+		dtype_type = type(self._dtype)
+
+		if isinstance(dtype, str) and dtype.startswith(dtype_type.name):
+			dtype = dtype_type.construct_from_string(dtype)
+
+		if isinstance(dtype, dtype_type):
+			if self.data.dtype != dtype._record_type:
+				return self._from_ndarray(self.data.astype(dtype._record_type))
+			elif copy:
+				return self.copy()
+			else:
+				return self
+
+		return super().astype(dtype)
+
+
+class PascalArray(QuantityArray):
+	"""
+	Holder for pressures in pascals.
+	"""
+
+	_dtype = PascalType()
+	_scalar_type = Pascal
+
+
+class MetreArray(QuantityArray):
+	"""
+	Holder for lengths in metres.
+	"""
+
+	_dtype = MetreType()
+	_scalar_type = Metre
+
+
+class KilogramArray(QuantityArray):
+	"""
+	Holder for masses in kilograms.
+	"""
+
+	_dtype = KilogramType()
+	_scalar_type = Kilogram
+
+
+class SecondArray(QuantityArray):
+	"""
+	Holder for durations in seconds.
+	"""
+
+	_dtype = SecondType()
+	_scalar_type = Second
+
+
+class KelvinArray(QuantityArray):
+	"""
+	Holder for thermodynamic temperatures in kelvin.
+	"""
+
+	_dtype = KelvinType()
+	_scalar_type = Kelvin
+
+
+def to_quantity(
+		values: _to_quantity_types,
+		unit: str,
+		errors: Literal["raise", "coerce"] = "raise",
+		) -> QuantityArray:
+	"""
+	Convert values to an array of the quantity measured in ``unit``.
+
+	.. code-block:: python
+
+		to_quantity(["101.3 kPa", "950 hPa", 100000], unit="Pa")  # PascalArray
+
+	:param values:
+	:param unit: The unit of numbers, and of strings without a unit, e.g. ``'kPa'`` or ``'mm'``.
+	:param errors: If ``'raise'``, a :exc:`ValueError` is raised if any string cannot be parsed.
+		If ``'coerce'``, such values are set to NaN.
+	"""
+
+	dtype, _ = _lookup_unit(unit)
+	array_type = dtype.construct_array_type()
+	return array_type._from_ndarray(_to_quantity_array(values, dtype, unit=unit, errors=errors))
+
+
+def parse_quantity_strings(
+		values: Union[numpy.ndarray, Sequence[str]],
+		unit: str,
+		errors: Literal["raise", "coerce"] = "raise",
+		) -> Tuple[numpy.ndarray, numpy.ndarray]:
+	"""
+	Parse strings such as ``"101.3 kPa"`` into a float64 array in the SI unit of the quantity.
+
+	Each value may have its own SI prefix. The conversion factors are looked up once for each distinct unit,
+	and applied to all values at once.
+
+	:param values: An object or unicode :class:`numpy.ndarray`, or a sequence of strings.
+	:param unit: The unit of strings without a unit, e.g. ``'kPa'``. This also determines the quantity,
+		and strings in units of other quantities cannot be parsed.
+	:param errors: If ``'raise'``, a :exc:`ValueError` is raised if any value cannot be parsed.
+		If ``'coerce'``, such values are set to NaN.
+
+	:return: The parsed values, and a boolean mask of the values which could not be parsed.
+	"""
+
+	if errors not in {"raise", "coerce"}:
+		raise ValueError(f"'errors' must be either 'raise' or 'coerce', not {errors!r}")
+
+	dtype, default_power = _lookup_unit(unit)
+
+	values = numpy.asarray(values).reshape(-1)
+	text = values.astype(str).astype(object)
+
+	if values.dtype.kind == 'O':
+		text[pandas.isna(values)] = "nan"
+
+	parts = pandas.Series(text, dtype=object).str.extract(_quantity_pattern)
+	numbers = parts["number"].fillna('').to_numpy(dtype=object)
+	parsed, failed = _parse_float_strings(numbers, '', errors="coerce")
+
+	codes, symbols = pandas.factorize(parts["unit"].fillna('').to_numpy(dtype=object))
+	powers = numpy.zeros(len(symbols), dtype=numpy.int64)
+	unknown = numpy.zeros(len(symbols), dtype=bool)
+
+	for idx, symbol in enumerate(symbols):
+		if symbol == '':
+			powers[idx] = default_power
+		elif _units.get(symbol, (None, ))[0] is dtype:
+			powers[idx] = _units[symbol][1]
+		else:
+			unknown[idx] = True
+
+	if len(codes):
+		powers = powers[codes]
+		failed |= unknown[codes]
+
+		# Scale by dividing for negative powers, as e.g. 0.001 is not exactly representable.
+		numpy.multiply(parsed, 10.0**numpy.maximum(powers, 0), out=parsed)
+		numpy.divide(parsed, 10.0**numpy.maximum(-powers, 0), out=parsed)
+
+	if failed.any():
+		if errors == "raise":
+			raise ValueError(f"could not convert string to {dtype.name}: {text[failed.argmax()]!r}")
+
+		parsed[failed] = numpy.nan
+
+	return parsed, failed
+
+
+def _lookup_unit(unit: str) -> Tuple[Type[QuantityType], int]:
+	"""
+	Returns the dtype of the quantity measured in ``unit``,
+	and the power of ten of ``unit`` relative to the SI unit.
+
+	:param unit: The symbol of the unit, with an optional SI prefix, e.g. ``'kPa'``.
+	"""
+
+	try:
+		return _units[unit]
+	except KeyError:
+		raise ValueError(f"Unknown unit {unit!r}.") from None
+
+
+def _to_quantity_array(
+		values: Union[QuantityArray, numpy.ndarray, _to_quantity_types],
+		dtype: Type[QuantityType],
+		unit: Optional[str] = None,
+		errors: Literal["raise", "coerce"] = "raise",
+		) -> numpy.ndarray:
+	"""
+	Convert the values to a float64 array in the SI unit of ``dtype``.
+
+	:param values:
+	:param dtype: The dtype of the quantity.
+	:param unit: The unit of ``values``. Defaults to the SI unit.
+	:param errors: How to handle strings which cannot be parsed.
+	"""
+
+	if unit is None:
+		unit = dtype.type.symbol
+
+	unit_dtype, power = _lookup_unit(unit)
+
+	if unit_dtype is not dtype:
+		raise ValueError(f"{unit!r} is not a unit of {dtype.name}.")
+
+	if isinstance(values, QuantityArray):
+		values = values.data
+	elif isinstance(values, memoryview):
+		values = numpy.asarray(values)
+	elif not is_list_like(values):
+		values = [values]
+
+	if isinstance(values, numpy.ndarray) and values.ndim == 1 and numpy.issubdtype(values.dtype, numpy.number):
+		numeric = True
+	elif isinstance(values, numpy.ndarray) and values.dtype.kind in "SU":
+		numeric = False
+	else:
+		numeric = infer_dtype(values, skipna=True) in {"integer", "floating", "mixed-integer-float", "empty"}
+
+	if not numeric:
+		parsed, _ = parse_quantity_strings(numpy.asarray(values, dtype=object), unit=unit, errors=errors)
+		return parsed
+	elif power > 0:
+		return numpy.multiply(values, 10.0**power, dtype=numpy.float64)
+	elif power < 0:
+		return numpy.divide(values, 10.0**-power, dtype=numpy.float64)
+	else:
+		return numpy.asarray(values, dtype=numpy.float64)
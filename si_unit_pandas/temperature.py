@@ -39,19 +39,23 @@ Temperature-specific functionality.
 
 # stdlib
 import abc
+import functools
 import operator
 import re
-from typing import Any, Sequence, Type, TypeVar, Union
+from typing import Any, Optional, Sequence, Tuple, Type, TypeVar, Union
 
 # 3rd party
 import numpy  # type: ignore
 import pandas  # type: ignore
 from domdf_python_tools import doctools
 from pandas.api.extensions import ExtensionDtype  # type: ignore
+from pandas.api.types import infer_dtype  # type: ignore
 from pandas.core.dtypes.inference import is_list_like  # type: ignore
+from typing_extensions import Literal
 
 # this package
-from si_unit_pandas.base import BaseArray, UserFloat
+from si_unit_pandas.base import BaseArray, BaseArrayBuffer, UserFloat, _format_with_suffix, _parse_float_strings
+from si_unit_pandas.units import AffineTransform, registry
 
 __all__ = [
 		"Celsius",
@@ -59,12 +63,31 @@ __all__ = [
 		"Fahrenheit",
 		"TemperatureArray",
 		"TemperatureBase",
+		"TemperatureBuffer",
+		"TemperatureType",
 		"is_temperature_type",
+		"parse_temperature_strings",
 		"to_temperature"
 		]
 
 _to_temp_types = Union[float, str, Sequence[Union[float, str]]]
 
+_temperature_units = Literal["C", "F"]
+
+_precisions = Literal["float16", "float32", "float64"]
+
+#: The suffix used when displaying temperatures in each unit.
+_display_suffixes = {
+		'C': "\u205F\u2103",
+		'F': "\u205F\u2109",
+		}
+
+#: The suffixes which may follow a temperature in each unit, e.g. ``21.5 ℃``.
+_unit_suffixes = {
+		'C': " \u205F\u2103\u00B0C",
+		'F': " \u205F\u2109\u00B0F",
+		}
+
 # -----------------------------------------------------------------------------
 # Extension Type
 # -----------------------------------------------------------------------------
@@ -82,6 +105,8 @@ class Celsius(UserFloat):
 	:class:`float` subclass representing a temperature in Celsius.
 	"""
 
+	__slots__ = ()
+
 	def __init__(self, value):
 		if isinstance(value, str):
 			value = re.split("[ ℃°C]", value)[0]
@@ -109,6 +134,8 @@ class Fahrenheit(UserFloat):
 	:class:`float` subclass representing a temperature in Fahrenheit.
 	"""
 
+	__slots__ = ()
+
 	def __str__(self) -> str:
 		"""
 		Return the temperature as a string.
@@ -127,30 +154,84 @@ class Fahrenheit(UserFloat):
 TemperatureBase.register(Celsius)
 TemperatureBase.register(Fahrenheit)
 
+#: The scalar type for temperatures in each unit.
+_scalar_types = {'C': Celsius, 'F': Fahrenheit}
+
 
 @pandas.api.extensions.register_extension_dtype
 class CelsiusType(ExtensionDtype):
 	"""
 	Numpy dtype representing a temperature in degrees Celsius.
+
+	:param precision: The precision of the floats used to store the temperatures.
+		Lower precisions use less memory. Near room temperature ``'float32'`` resolves temperatures
+		to a few millionths of a degree, and ``'float16'`` to around 0.02 ℃.
+
+	The dtype is named ``'celsius'`` for the default precision of ``'float64'``,
+	and e.g. ``'celsius[float32]'`` otherwise.
 	"""
 
 	name: str = "celsius"
 	type: Type = TemperatureBase  # noqa: A003  # pylint: disable=redefined-builtin
 	kind: str = 'O'
 	_record_type: Type = numpy.float
+	_metadata: Tuple[str, ...] = ("precision", )
+
+	#: The unit the temperatures are displayed in. The values are always stored in Celsius.
+	unit: str = 'C'
+
+	def __init__(self, precision: _precisions = "float64"):
+		try:
+			precision = numpy.dtype(precision).name
+		except TypeError:
+			pass
+
+		if precision not in {"float16", "float32", "float64"}:
+			raise ValueError(f"Unsupported precision {precision!r}. Expected one of float16, float32, float64.")
+
+		self.precision: str = precision
+		self._record_type = numpy.dtype(precision)
+
+		if precision != "float64":
+			self.name = f"celsius[{precision}]"
+
+	def __repr__(self) -> str:
+		return f"{type(self).__name__}(precision={self.precision!r})"
+
+	def __eq__(self, other: Any) -> bool:
+		if isinstance(other, str):
+			try:
+				other = self.construct_from_string(other)
+			except TypeError:
+				return False
+
+		if isinstance(other, CelsiusType):
+			return self.precision == other.precision and self.unit == other.unit
+		else:
+			return False
+
+	def __hash__(self) -> int:
+		return hash((self.precision, self.unit))
 
 	@classmethod
 	def construct_from_string(cls, string):
 		"""
-		Construct a :class:`~.CelsiusType` from a string.
+		Construct a :class:`~.CelsiusType` or :class:`~.TemperatureType` from a string.
 
-		:param string:
+		:param string: Either ``'celsius'``, or the name of the dtype with a precision, e.g. ``'celsius[float32]'``.
+			Temperatures with a display unit are named e.g. ``'temperature[F]'`` or ``'temperature[F, float32]'``.
 		"""
 
-		if string == cls.name:
-			return cls()
-		else:
-			raise TypeError(f"Cannot construct a '{cls.__name__}' from '{string}'")
+		if isinstance(string, str):
+			match = re.fullmatch(r"celsius(?:\[(float16|float32|float64)\])?", string)
+			if match:
+				return CelsiusType(match.group(1) or "float64")
+
+			match = re.fullmatch(r"temperature(?:\[([CF])(?:,\s*(float16|float32|float64))?\])?", string)
+			if match:
+				return TemperatureType(match.group(1) or 'C', match.group(2) or "float64")
+
+		raise TypeError(f"Cannot construct a '{cls.__name__}' from '{string}'")
 
 	@classmethod
 	def construct_array_type(cls) -> Type["TemperatureArray"]:  # noqa: D102
@@ -183,6 +264,72 @@ class CelsiusType(ExtensionDtype):
 
 		return True
 
+	def __from_arrow__(self, array) -> "TemperatureArray":
+		"""
+		Construct a :class:`~.TemperatureArray` from a :class:`pyarrow.Array` or :class:`pyarrow.ChunkedArray`.
+
+		:param array:
+		"""
+
+		# this package
+		from si_unit_pandas._arrow_utils import array_from_arrow
+
+		return array_from_arrow(array, dtype=self)
+
+	def _get_common_dtype(self, dtypes):
+		"""
+		Returns the dtype to use when concatenating arrays with the given dtypes.
+
+		Temperatures with different precisions are combined using the highest precision.
+		If the temperatures are displayed in different units the result is displayed in Celsius.
+
+		:param dtypes:
+		"""
+
+		if not all(isinstance(dtype, CelsiusType) for dtype in dtypes):
+			return None
+
+		precision = numpy.result_type(*(dtype._record_type for dtype in dtypes)).name
+		units = {dtype.unit for dtype in dtypes}
+
+		if len(units) == 1:
+			return TemperatureType(units.pop(), precision)
+		else:
+			return CelsiusType(precision)
+
+
+class TemperatureType(CelsiusType):
+	"""
+	Numpy dtype representing a temperature which is displayed in ``unit``.
+
+	The values are always stored in degrees Celsius, so changing the display unit
+	with :meth:`TemperatureArray.astype` doesn't convert or copy the data.
+	Values are only converted when they are read, e.g. by indexing, :meth:`~.TemperatureArray.tolist` or printing.
+
+	:param unit: The unit to display the temperatures in, either ``'C'`` (Celsius) or ``'F'`` (Fahrenheit).
+	:param precision: The precision of the floats used to store the temperatures.
+
+	The dtype is named e.g. ``'temperature[F]'``, or ``'temperature[F, float32]'`` for lower precisions.
+	A display unit of ``'C'`` is equivalent to :class:`~.CelsiusType`.
+	"""
+
+	_metadata = ("precision", "unit")
+
+	def __init__(self, unit: _temperature_units = 'C', precision: _precisions = "float64"):
+		super().__init__(precision)
+
+		self.unit = _validate_unit(unit)
+
+		if unit == 'C':
+			pass
+		elif self.precision == "float64":
+			self.name = f"temperature[{unit}]"
+		else:
+			self.name = f"temperature[{unit}, {self.precision}]"
+
+	def __repr__(self) -> str:
+		return f"{type(self).__name__}(unit={self.unit!r}, precision={self.precision!r})"
+
 
 # -----------------------------------------------------------------------------
 # Extension Container
@@ -198,23 +345,81 @@ class TemperatureArray(BaseArray):
 	TemperatureArray is a container for Temperatures. It satisfies pandas'
 	extension array interface, and so can be stored inside
 	:class:`pandas.Series` and :class:`pandas.DataFrame`.
+
+	By default missing values are stored as NaN. If a boolean ``mask`` is given
+	the array keeps it alongside the values, so that only the masked values are missing
+	and NaN readings in the data are kept.
+
+	:param data: The temperatures.
+	:param dtype: The :class:`~.CelsiusType` of the array.
+	:param copy: Whether to copy the data.
+	:param mask: Optional boolean array marking the missing values.
 	"""
 
 	__array_priority__: int = 1000
 	_dtype = CelsiusType()
-	_itemsize: int = 16
+	_scalar_type = Celsius
 	can_hold_na: bool = True
 
-	def __init__(self, data, dtype=None, copy: bool = False):
+	def __init__(self, data, dtype=None, copy: bool = False, mask: Optional[numpy.ndarray] = None):
+
+		if isinstance(data, TemperatureArray):
+			if mask is None:
+				mask = data._mask
+			if dtype is None:
+				dtype = data._custom_dtype
+
+		if dtype is None:
+			data = _to_temperature_array(data)
+		else:
+			dtype = self._validate_dtype(dtype)
+
+			# Numbers are in the unit the temperatures are displayed in.
+			data = _to_temperature_array(data, unit=dtype.unit)
+			record_type = numpy.dtype(dtype._record_type)
+
+			if data.dtype != record_type:
+				data = data.astype(record_type)
+				copy = False
+
+		if mask is not None:
+			mask = numpy.asarray(mask, dtype=bool)
+
+			if mask.shape != data.shape:
+				raise ValueError(f"The mask must have the same shape as the data, got {mask.shape} and {data.shape}")
+
+			if copy:
+				mask = mask.copy()
 
-		# The dtype is always CelsiusType
-		data = _to_temperature_array(data)  # TODO: avoid potential copy
+			if not numpy.isnan(data[mask]).all():
+				# Masked values are stored as NaN.
+				data = data.copy()
+				data[mask] = numpy.nan
+				copy = False
 
 		if copy:
 			data = data.copy()
 
 		self.data = data
 
+		if mask is not None:
+			self._mask = mask
+
+		if dtype is not None and dtype is not self._dtype:
+			self._dtype = dtype
+
+	@classmethod
+	def from_fahrenheit(cls, values: Union[numpy.ndarray, Sequence[Union[str, float]]]) -> "TemperatureArray":
+		"""
+		Construct a :class:`~.TemperatureArray` from temperatures in Fahrenheit.
+
+		Numeric arrays are converted to Celsius in a single pass, writing into one new buffer.
+
+		:param values: A :class:`numpy.ndarray` or sequence of temperatures in Fahrenheit.
+		"""
+
+		return cls._from_ndarray(_to_temperature_array(values, unit='F'))
+
 	def __getitem__(self, item: Union[int, slice, numpy.ndarray]) -> Any:
 		"""
 		Select a subset of self.
@@ -242,24 +447,45 @@ class TemperatureArray(BaseArray):
 
 		result = operator.getitem(self.data, item)
 
+		if self._mask is None:
+			mask = None
+		else:
+			mask = self._mask[item]
+
 		if result.ndim == 0:
-			return Celsius(result.item())
+			if mask:
+				return self.na_value
+			return self._box_scalar(result.item())
 		else:
-			return type(self)(result)
+			return self._from_ndarray(result, mask=mask, dtype=self._custom_dtype)
 
-	def _format_values(self):
-		formatted = []
+	def _format_values(self) -> numpy.ndarray:
+		"""
+		Returns an array of strings representing the temperatures in the array.
+		"""
 
-		# TODO: perf
+		formatted = _format_with_suffix(self._to_display(self.data), _display_suffixes[self._dtype.unit])
 
-		for i in range(len(self)):
-			formatted.append(Celsius(self.data[i]))
+		if self._mask is not None:
+			formatted = formatted.astype(object)
+			formatted[self._mask] = "<NA>"
 
 		return formatted
 
 	@property
 	def _parser(self):
-		return to_temperature
+		if self._dtype.unit == 'C':
+			return to_temperature
+		else:
+			return functools.partial(to_temperature, unit=self._dtype.unit)
+
+	@property
+	def _display_type(self) -> Type[UserFloat]:
+		return _scalar_types[self._dtype.unit]
+
+	@property
+	def _display_transform(self) -> AffineTransform:
+		return registry.transform('C', self._dtype.unit)
 
 	def append(self, value: _to_temp_types) -> None:
 		"""
@@ -278,43 +504,145 @@ class TemperatureArray(BaseArray):
 		:param copy: If :py:obj:`True`, returns a copy of the array.
 		"""
 
+		if isinstance(dtype, str) and dtype.startswith(("celsius", "temperature")):
+			dtype = CelsiusType.construct_from_string(dtype)
+
 		if isinstance(dtype, CelsiusType):
-			if copy:
-				self = self.copy()
-			return self
+			if dtype == self.dtype and not copy:
+				return self
+
+			if self.data.dtype != dtype._record_type:
+				data = self.data.astype(dtype._record_type)
+			elif copy:
+				data = self.data.copy()
+			else:
+				# Only the display unit changes, so the buffer is shared.
+				data = self.data
+
+			if self._mask is None or data is self.data:
+				mask = self._mask
+			else:
+				mask = self._mask.copy()
+
+			return self._from_ndarray(data, mask=mask, dtype=dtype)
+
 		return super().astype(dtype)
 
-	def isin(self, other: _to_temp_types) -> numpy.ndarray:
+	def isin(self, values: _to_temp_types, tolerance: Optional[float] = None) -> numpy.ndarray:
 		"""
-		Check whether elements of `self` are in `other`.
-
-		Comparison is done elementwise.
+		Check whether elements of `self` are in ``values``.
 
-		:param other:
+		:param values: The temperatures to look for.
+		:param tolerance: If given, elements match any temperature within this many degrees of them.
 
 		:return: A 1-D boolean ndarray with the same length as self.
 		"""
 
-		if isinstance(other, (str, float)) or not isinstance(other, (self.__class__, Sequence)):
-			other = [other]  # type: ignore
+		return super().isin(values, tolerance=tolerance)
+
+	def __arrow_array__(self, type=None):  # noqa: A002  # pylint: disable=redefined-builtin
+		"""
+		Convert the array to a :class:`pyarrow.ExtensionArray`.
+
+		The buffer is shared with Arrow rather than copied, and missing values are marked as null.
+
+		:param type: The Arrow type requested by :func:`pyarrow.array`, if any.
+			Only the celsius extension type and its floating point storage type are supported.
+		"""
+
+		# 3rd party
+		import pyarrow  # type: ignore
+
+		# this package
+		from si_unit_pandas._arrow_utils import ArrowCelsiusType
+
+		if self._mask is None:
+			storage = pyarrow.array(self.data, from_pandas=True)
+		else:
+			storage = pyarrow.array(self.data, mask=self._mask)
+		arrow_type = ArrowCelsiusType(storage.type, unit=self._dtype.unit)
+
+		if type is not None and type == storage.type:
+			return storage
+		elif isinstance(type, ArrowCelsiusType) and type.storage_type == storage.type:
+			# The values are the same whatever the display unit.
+			arrow_type = type
+		elif type is not None and type != arrow_type:
+			raise TypeError(f"Not supported to convert TemperatureArray to '{type}' type")
+
+		return pyarrow.ExtensionArray.from_storage(arrow_type, storage)
+
+	def _is_quantity(self, value: Any) -> bool:
+		return isinstance(value, (TemperatureArray, TemperatureBase))
+
+	def _ufunc_result_in_units(self, ufunc: numpy.ufunc, quantities: Tuple[bool, ...]) -> bool:
+		"""
+		Returns whether the result of ``ufunc`` is a temperature.
+
+		A temperature may be shifted by a number of degrees, but two temperatures cannot be added,
+		and the difference between two temperatures is a plain number of degrees.
 
-		temperatures = []
+		:param ufunc:
+		:param quantities: For each input to the ufunc, whether it is a temperature.
 
-		if not isinstance(other, self.__class__):
-			for net in other:
-				net = Celsius(net)
-				temperatures.append(net)
+		:raises TypeError: If the operation is not meaningful for temperatures.
+		"""
+
+		if ufunc is numpy.add and all(quantities) and len(quantities) > 1:
+			raise TypeError("cannot add two temperatures")
+		elif ufunc is numpy.subtract:
+			if quantities == (True, True):
+				return False
+			elif quantities == (False, True):
+				raise TypeError("cannot subtract a temperature from a number")
+
+		return super()._ufunc_result_in_units(ufunc, quantities)
+
+
+class TemperatureBuffer(BaseArrayBuffer[TemperatureArray]):
+	"""
+	Growable buffer for building a :class:`~.TemperatureArray` one reading at a time.
+
+	.. code-block:: python
+
+		buffer = TemperatureBuffer()
+
+		for reading in readings:
+			buffer.append(reading)
+
+		series = pandas.Series(buffer.freeze())
+
+	:param capacity: The number of values the buffer can hold before it is first reallocated.
+	:param dtype: The dtype of the arrays built by the buffer, such as ``'temperature[F]'``.
+		Numbers are in the unit the temperatures are displayed in.
+	"""
+
+	_array_type = TemperatureArray
+
+	@property
+	def _parser(self):
+		if self._dtype.unit == 'C':
+			return to_temperature
 		else:
-			temperatures = other
+			return functools.partial(to_temperature, unit=self._dtype.unit)
 
-		temperatures = self.__class__(temperatures)
+	def append(self, value: Union[float, str, Celsius, Fahrenheit]) -> None:
+		"""
+		Append a temperature to the buffer.
 
-		mask = numpy.zeros(len(self), dtype="bool")
-		for network in temperatures:
-			mask |= self == network
+		:param value:
+		"""
 
-		mask |= self == temperatures
-		return mask
+		super().append(value)
+
+	def extend(self, values: _to_temp_types) -> None:
+		"""
+		Append several temperatures to the buffer.
+
+		:param values:
+		"""
+
+		super().extend(values)
 
 
 def is_temperature_type(obj) -> bool:
@@ -332,61 +660,177 @@ def is_temperature_type(obj) -> bool:
 		return False
 
 
-def to_temperature(values: _to_temp_types) -> TemperatureArray:
+def to_temperature(
+		values: _to_temp_types,
+		errors: Literal["raise", "coerce"] = "raise",
+		unit: _temperature_units = 'C',
+		) -> TemperatureArray:
 	"""
 	Convert values to a :class:`~.TemperatureArray`.
 
 	:param values:
+	:param errors: If ``'raise'``, a :exc:`ValueError` is raised if any string cannot be parsed.
+		If ``'coerce'``, such values are set to NaN.
+	:param unit: The unit of ``values``, either ``'C'`` (Celsius) or ``'F'`` (Fahrenheit).
+		:class:`~.Celsius` and :class:`~.Fahrenheit` objects are always interpreted in their own unit.
 	"""
 
 	if is_list_like(values):
-		return TemperatureArray(_to_temperature_array(values))
+		return TemperatureArray(_to_temperature_array(values, errors=errors, unit=unit))
 	else:
-		return TemperatureArray(_to_temperature_array([values]))
+		return TemperatureArray(_to_temperature_array([values], errors=errors, unit=unit))
+
+
+def parse_temperature_strings(
+		values: Union[numpy.ndarray, Sequence[str]],
+		errors: Literal["raise", "coerce"] = "raise",
+		unit: _temperature_units = 'C',
+		) -> Tuple[numpy.ndarray, numpy.ndarray]:
+	"""
+	Parse strings such as ``"21.5 ℃"`` into a float64 array of temperatures in Celsius.
+
+	The suffixes accepted by :class:`~.Celsius` (``℃``, ``°C`` and ``C``) are stripped,
+	and all the values are parsed in one pass without creating any :class:`~.Celsius` objects.
+
+	:param values: An object or unicode :class:`numpy.ndarray`, or a sequence of strings.
+	:param errors: If ``'raise'``, a :exc:`ValueError` is raised if any value cannot be parsed.
+		If ``'coerce'``, such values are set to NaN.
+	:param unit: The unit of ``values``, either ``'C'`` (Celsius) or ``'F'`` (Fahrenheit).
+		For Fahrenheit the suffixes ``℉``, ``°F`` and ``F`` are stripped instead.
+
+	:return: The parsed values, and a boolean mask of the values which could not be parsed.
+	"""
+
+	parsed, failed = _parse_float_strings(values, _unit_suffixes[_validate_unit(unit)], errors=errors)
+
+	if unit != 'C':
+		parsed = registry.convert(parsed, unit, 'C', out=parsed)
+
+	return parsed, failed
+
+
+def _validate_unit(unit: str) -> str:
+	if unit not in _unit_suffixes:
+		raise ValueError(f"Unknown temperature unit {unit!r}. Expected one of {', '.join(_unit_suffixes)}.")
+
+	return unit
 
 
 def _to_temperature_array(
-		values: Union[TemperatureArray, numpy.ndarray, Sequence[Union[str, float]]]
+		values: Union[TemperatureArray, numpy.ndarray, Sequence[Union[str, float]]],
+		errors: Literal["raise", "coerce"] = "raise",
+		unit: _temperature_units = 'C',
 		) -> numpy.ndarray:  # : Union[TemperatureArray, np.ndarray]
 	"""
 	Convert the values to a temperature array.
 
 	:param values:
+	:param errors: How to handle strings which cannot be parsed.
+	:param unit: The unit of ``values``.
 	"""
 
+	if isinstance(values, (pandas.Series, pandas.Index)):
+		values = values.array
+
 	if isinstance(values, TemperatureArray):
 		return values.data
 
-	if isinstance(values, numpy.ndarray) and values.ndim == 1 and numpy.issubdtype(values.dtype, numpy.integer):
-		values = values.astype(float)
-		values = numpy.asarray(values, dtype=CelsiusType._record_type)
+	_validate_unit(unit)
+
+	if isinstance(values, memoryview):
+		values = numpy.asarray(values)
+	elif isinstance(values, pandas.api.extensions.ExtensionArray):
+		# e.g. a column of strings from read_csv, which can then be parsed in a single pass.
+		values = values.to_numpy(na_value=numpy.nan)
 
-	elif not (isinstance(values, numpy.ndarray) and values.dtype == CelsiusType._record_type):
-		values = _to_int_pairs(values)
+	if isinstance(values, numpy.ndarray) and values.ndim == 1 and numpy.issubdtype(values.dtype, numpy.number):
+		if unit != 'C':
+			return registry.transform(unit, 'C')(values, dtype=CelsiusType._record_type)
+		elif values.dtype != CelsiusType._record_type:
+			values = values.astype(CelsiusType._record_type)
+
+	else:
+		inferred = _infer_sequence_type(values)
+
+		if inferred == "string":
+			values, _ = parse_temperature_strings(values, errors=errors, unit=unit)
+		elif inferred in {"integer", "floating", "mixed-integer-float", "empty"}:
+			values = numpy.asarray(values, dtype=CelsiusType._record_type)
+			if unit != 'C':
+				values = registry.convert(values, unit, 'C', out=values)
+		else:
+			values = _to_int_pairs(values, unit=unit, errors=errors)
 
 	return numpy.atleast_1d(numpy.asarray(values, dtype=CelsiusType._record_type))
 
 
-def _to_int_pairs(values: _to_temp_types):
+def _infer_sequence_type(values) -> str:
+	"""
+	Returns the type of the values in ``values``, as determined by :func:`pandas.api.types.infer_dtype`.
+
+	Values which are not lists, tuples or one-dimensional arrays are reported as ``'unknown'``.
+
+	:param values:
+	"""
+
+	if isinstance(values, numpy.ndarray):
+		if values.ndim != 1:
+			return "unknown"
+		elif values.dtype.kind in "SU":
+			return "string"
+	elif not isinstance(values, (list, tuple)):
+		return "unknown"
+
+	return infer_dtype(values, skipna=True)
+
+
+def _to_int_pairs(
+		values: _to_temp_types,
+		unit: _temperature_units = 'C',
+		errors: Literal["raise", "coerce"] = "raise",
+		):
 
-	if isinstance(values, (str, int, float, Celsius)):
-		if isinstance(values, Fahrenheit):
-			values = (values - 32) * (5 / 9)
+	if isinstance(values, str):
+		return parse_temperature_strings([values], errors=errors, unit=unit)[0][0]
 
-		return float(values)
+	elif isinstance(values, (int, float, Celsius, Fahrenheit)):
+		return _to_celsius(values, unit)
 
 	elif isinstance(values, numpy.ndarray) and values.dtype != object:
 		if values.ndim != 2:
 			raise ValueError("'values' should be a 2-D when passing a NumPy array.")
 
 	else:
-		new_values = []
-		for v in values:
-			if isinstance(v, Fahrenheit):
-				new_values.append((v - 32) * (5 / 9))
-			else:
-				new_values.append(float(v))
+		values = list(values)
+		strings = [idx for idx, value in enumerate(values) if value is None or isinstance(value, str)]
+		result = [numpy.nan if v is None or isinstance(v, str) else _to_celsius(v, unit) for v in values]
+
+		if strings:
+			# The strings are parsed together, in the same way as a sequence which only contains strings,
+			# and missing values become NaN.
+			parsed, _ = parse_temperature_strings([values[idx] for idx in strings], errors=errors, unit=unit)
+			for idx, value in zip(strings, parsed.tolist()):
+				result[idx] = value
 
-		values = [float(v) for v in new_values]
+		values = result
 
 	return values
+
+
+def _to_celsius(value: Union[str, float, Celsius, Fahrenheit], unit: _temperature_units = 'C') -> float:
+	"""
+	Convert a single value to a temperature in Celsius, without creating any intermediate objects.
+
+	:param value:
+	:param unit: The unit of ``value`` if it is not a :class:`~.Celsius` or :class:`~.Fahrenheit` object.
+	"""
+
+	if isinstance(value, Fahrenheit):
+		unit = 'F'
+	elif isinstance(value, Celsius):
+		unit = 'C'
+
+	if unit == 'C':
+		return float(value)
+	else:
+		return registry.convert(float(value), unit, 'C')
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+#
+#  units.py
+"""
+A registry of conversions between units, stored as affine transforms.
+"""
+#
+#  Copyright (c) 2020 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are met:
+#
+#  * Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+#  * Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+#  * Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#  AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+#  IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+#  DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+#  FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+#  DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+#  SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+#  CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+#  OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+#  OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+# stdlib
+from collections import deque
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+# 3rd party
+import numpy  # type: ignore
+
+__all__ = ["AffineTransform", "UnitRegistry", "registry"]
+
+
+class AffineTransform(NamedTuple):
+	"""
+	A conversion between two units, of the form ``value * scale + offset``.
+
+	:param scale: The factor the value is multiplied by.
+	:param offset: The amount added to the scaled value.
+	"""
+
+	scale: float
+	offset: float = 0.0
+
+	@property
+	def is_identity(self) -> bool:
+		"""
+		Whether the transform leaves values unchanged.
+		"""
+
+		return self.scale == 1 and self.offset == 0
+
+	def then(self, other: "AffineTransform") -> "AffineTransform":
+		"""
+		Returns a single transform which applies this transform followed by ``other``.
+
+		:param other:
+		"""
+
+		return AffineTransform(self.scale * other.scale, self.offset * other.scale + other.offset)
+
+	def inverse(self) -> "AffineTransform":
+		"""
+		Returns the transform which converts values back to the original unit.
+		"""
+
+		return AffineTransform(1 / self.scale, -self.offset / self.scale)
+
+	def __call__(self, values: Any, out: Optional[numpy.ndarray] = None, dtype: Any = None) -> Any:
+		"""
+		Apply the transform to a number, or to an array of numbers.
+
+		Arrays are converted with a multiply and an add into a single buffer,
+		without any intermediate arrays.
+
+		:param values:
+		:param out: The array to write the result to. If :py:obj:`None` a new array is allocated.
+		:param dtype: The dtype of a newly allocated array.
+			Defaults to that of ``values``, or float64 for integers.
+		"""
+
+		if not isinstance(values, numpy.ndarray) and out is None:
+			return values * self.scale + self.offset
+
+		out = numpy.multiply(values, self.scale, out=out, dtype=dtype)
+		return numpy.add(out, self.offset, out=out)
+
+
+class UnitRegistry:
+	"""
+	A graph of units, with the conversions between them.
+
+	Conversions between units which are not directly connected are composed from the conversions along
+	the shortest path between them, and the combined transform is cached.
+
+	.. code-block:: python
+
+		>>> registry = UnitRegistry()
+		>>> registry.add_conversion('C', 'F', scale=9 / 5, offset=32)
+		>>> registry.add_conversion('C', 'K', offset=273.15)
+		>>> registry.transform('K', 'F')
+		AffineTransform(scale=1.8, offset=-459.66999999999996)
+	"""
+
+	def __init__(self):
+		self._edges: Dict[str, Dict[str, AffineTransform]] = {}
+		self._cache: Dict[Tuple[str, str], AffineTransform] = {}
+
+	def add_conversion(self, source: str, target: str, scale: float = 1.0, offset: float = 0.0) -> None:
+		"""
+		Register the conversion ``target = source * scale + offset``, and its inverse.
+
+		Either unit may be new to the registry.
+
+		:param source: The symbol of the unit converted from.
+		:param target: The symbol of the unit converted to.
+		:param scale:
+		:param offset:
+
+		:raises ValueError: If ``scale`` is zero, or the units are the same.
+		"""
+
+		if scale == 0:
+			raise ValueError("The scale of a conversion cannot be zero.")
+		elif source == target:
+			raise ValueError(f"Cannot add a conversion from {source!r} to itself.")
+
+		transform = AffineTransform(float(scale), float(offset))
+		self._edges.setdefault(source, {})[target] = transform
+		self._edges.setdefault(target, {})[source] = transform.inverse()
+
+		# Previously composed conversions may now have a shorter path.
+		self._cache.clear()
+
+	@property
+	def units(self) -> List[str]:
+		"""
+		The symbols of the units in the registry.
+		"""
+
+		return list(self._edges)
+
+	def __contains__(self, unit: object) -> bool:
+		return unit in self._edges
+
+	def __iter__(self) -> Iterator[str]:
+		return iter(self._edges)
+
+	def __len__(self) -> int:
+		return len(self._edges)
+
+	def path(self, source: str, target: str) -> List[str]:
+		"""
+		Returns the units along the shortest chain of conversions from ``source`` to ``target``, inclusive.
+
+		:param source:
+		:param target:
+
+		:raises ValueError: If either unit is unknown, or there is no conversion between them.
+		"""
+
+		for unit in (source, target):
+			if unit not in self._edges:
+				raise ValueError(f"Unknown unit {unit!r}.")
+
+		previous: Dict[str, Optional[str]] = {source: None}
+		queue = deque([source])
+
+		while queue:
+			unit = queue.popleft()
+
+			if unit == target:
+				path = []
+				while unit is not None:
+					path.append(unit)
+					unit = previous[unit]
+				return path[::-1]
+
+			for neighbour in self._edges[unit]:
+				if neighbour not in previous:
+					previous[neighbour] = unit
+					queue.append(neighbour)
+
+		raise ValueError(f"Cannot convert from {source!r} to {target!r}.")
+
+	def transform(self, source: str, target: str) -> AffineTransform:
+		"""
+		Returns the transform which converts values in ``source`` to ``target``.
+
+		The result is cached, so repeated lookups don't search the graph again.
+
+		:param source:
+		:param target:
+
+		:raises ValueError: If either unit is unknown, or there is no conversion between them.
+		"""
+
+		try:
+			return self._cache[(source, target)]
+		except KeyError:
+			pass
+
+		path = self.path(source, target)
+		transform = AffineTransform(1.0)
+
+		for start, end in zip(path, path[1:]):
+			transform = transform.then(self._edges[start][end])
+
+		self._cache[(source, target)] = transform
+		return transform
+
+	def convert(self, values: Any, source: str, target: str, out: Optional[numpy.ndarray] = None) -> Any:
+		"""
+		Convert a number, or an array of numbers, from ``source`` to ``target``.
+
+		Arrays are converted into a single new buffer, or into ``out``, even if the units are the same.
+
+		:param values:
+		:param source:
+		:param target:
+		:param out: The array to write the result to. If :py:obj:`None` a new array is allocated.
+		"""
+
+		return self.transform(source, target)(values, out=out)
+
+
+#: The default registry, containing the temperature scales.
+registry = UnitRegistry()
+registry.add_conversion('C', 'F', scale=9 / 5, offset=32)
+registry.add_conversion('C', 'K', offset=273.15)
+registry.add_conversion('K', 'R', scale=9 / 5)
@@ -0,0 +1,177 @@
+# stdlib
+import pickle
+
+# 3rd party
+import numpy  # type: ignore
+import numpy.testing as npt  # type: ignore
+import pandas  # type: ignore
+import pandas.testing as tm  # type: ignore
+import pytest
+
+# this package
+from si_unit_pandas import (
+		KelvinArray,
+		KilogramArray,
+		KilogramType,
+		MetreArray,
+		PascalArray,
+		PascalType,
+		SecondArray,
+		TemperatureArray,
+		to_quantity
+		)
+from si_unit_pandas.quantities import Kelvin, Kilogram, Metre, Pascal, Second, _units, parse_quantity_strings
+
+_pandas_version = tuple(map(int, pandas.__version__.split('.')[:2]))
+
+
+def test_units():
+	# Every prefixed symbol is unique.
+	assert len(_units) == 5 * 23
+
+	assert _units["Pa"] == (PascalType, 0)
+	assert _units["kPa"] == (PascalType, 3)
+	assert _units["kg"] == (KilogramType, 0)
+	assert _units["mg"] == (KilogramType, -6)
+
+
+@pytest.mark.parametrize(
+		"values, unit, expected",
+		[
+				(["101.3 kPa", "950 hPa", "1e3mPa", "5"], "Pa", [101300, 95000, 1, 5]),
+				(["1 km", "2 m", "3mm", "4 µm", "5 μm", "6 um"], 'm', [1000, 2, 0.003, 4e-6, 5e-6, 6e-6]),
+				(["1 kg", "500 g", "2 Mg", "1"], 'g', [1, 0.5, 2000, 0.001]),
+				(["1 ms", "2 ns", "3 s", "4"], "ms", [0.001, 2e-9, 3, 0.004]),
+				(["300 K", "1 mK"], 'K', [300, 0.001]),
+				]
+		)
+def test_parse_quantity_strings(values, unit, expected):
+	parsed, failed = parse_quantity_strings(values, unit=unit)
+	npt.assert_allclose(parsed, expected, rtol=1e-15)
+	assert not failed.any()
+
+
+def test_parse_quantity_strings_missing():
+	values = numpy.array(["nan", None, "-inf Pa", "NaN kPa"], dtype=object)
+	parsed, failed = parse_quantity_strings(values, unit="Pa")
+	assert numpy.isnan(parsed[[0, 1, 3]]).all()
+	assert parsed[2] == -numpy.inf
+	assert not failed.any()
+
+
+def test_parse_quantity_strings_errors():
+	with pytest.raises(ValueError, match="could not convert string to pascal: '5 m'"):
+		parse_quantity_strings(["1 kPa", "5 m"], unit="Pa")
+
+	with pytest.raises(ValueError, match="could not convert string to pascal: 'high'"):
+		parse_quantity_strings(["1 kPa", "high"], unit="Pa")
+
+	parsed, failed = parse_quantity_strings(["1 kPa", "5 m", "high", "1 parsec"], unit="Pa", errors="coerce")
+	assert parsed[0] == 1000
+	assert numpy.isnan(parsed[1:]).all()
+	assert failed.tolist() == [False, True, True, True]
+
+	with pytest.raises(ValueError, match="Unknown unit 'parsec'"):
+		parse_quantity_strings(["1"], unit="parsec")
+
+
+def test_to_quantity():
+	arr = to_quantity([1, 2.5, 3], unit="kPa")
+	assert isinstance(arr, PascalArray)
+	assert arr.data.tolist() == [1000, 2500, 3000]
+
+	arr = to_quantity(numpy.array([1, 2, 3]), unit="mm")
+	assert isinstance(arr, MetreArray)
+	npt.assert_array_equal(arr.data, [0.001, 0.002, 0.003])
+
+	assert isinstance(to_quantity(["1 ms"], unit='s'), SecondArray)
+	assert isinstance(to_quantity(300, unit='K'), KelvinArray)
+	assert to_quantity(numpy.array(["1 kg", "1 g"]), unit="kg").data.tolist() == [1, 0.001]
+
+
+def test_array_constructor():
+	arr = PascalArray(["1 kPa", 2, Pascal(3)])
+	assert arr.data.tolist() == [1000, 2, 3]
+	assert arr.dtype == PascalType()
+
+	assert PascalArray([1, 2], unit="hPa").data.tolist() == [100, 200]
+	assert PascalArray(arr, unit="kPa").data.tolist() == [1000000, 2000, 3000]
+	assert PascalArray(arr).data is arr.data
+	assert PascalArray(arr, copy=True).data is not arr.data
+
+	values = numpy.array([1.0, 2.0])
+	assert numpy.shares_memory(PascalArray(values).data, values)
+	assert not numpy.shares_memory(PascalArray(values, copy=True).data, values)
+	assert not numpy.shares_memory(PascalArray(values, unit="kPa").data, values)
+	assert PascalArray([1, 2], dtype="pascal[float32]").dtype == PascalType("float32")
+
+	with pytest.raises(ValueError, match="'mm' is not a unit of pascal"):
+		PascalArray([1], unit="mm")
+
+
+def test_scalars():
+	assert Pascal("1.5 kPa") == 1500
+	assert Kilogram("250 g") == 0.25
+	assert str(Metre(2)) == "2.0 m"
+	assert type(MetreArray([1, 2])[0]) is Metre
+	assert type(Second(1) + 1) is Second
+	assert pickle.loads(pickle.dumps(Kilogram(3))) == Kilogram(3)
+
+
+def test_arithmetic():
+	arr = MetreArray([1, 2, 3])
+
+	assert isinstance(arr + arr, MetreArray)
+	assert (arr + arr).data.tolist() == [2, 4, 6]
+	assert (arr * 2).data.tolist() == [2, 4, 6]
+	assert (arr - Metre(1)).data.tolist() == [0, 1, 2]
+	assert (arr > 1.5).tolist() == [False, True, True]
+
+	with pytest.raises(TypeError):
+		arr + PascalArray([1, 2, 3])  # pylint: disable=expression-not-assigned
+
+	with pytest.raises(TypeError):
+		arr + Pascal(1)  # pylint: disable=expression-not-assigned
+
+
+def test_compare_other_quantities():
+	arr = PascalArray([1e5, 2e5])
+
+	assert (arr == Pascal(1e5)).tolist() == [True, False]
+	assert (arr == Metre(1e5)).tolist() == [False, False]
+	assert (arr != MetreArray([1e5, 2e5])).tolist() == [True, True]
+	assert (TemperatureArray([1.0]) == Kelvin(1.0)).tolist() == [False]
+
+	with pytest.raises(TypeError, match="'<' not supported between instances of 'PascalArray' and 'Metre'"):
+		arr < Metre(1)  # pylint: disable=expression-not-assigned
+
+	with pytest.raises(TypeError):
+		TemperatureArray([1.0]) + Kelvin(1.0)  # pylint: disable=expression-not-assigned
+
+
+def test_pandas():
+	ser = pandas.Series(["1 km", "250 m"], dtype="metre")
+	assert ser.dtype == MetreArray._dtype
+	assert ser.sum(numeric_only=False) == Metre(1250)
+	assert ser.max(numeric_only=False) == 1000
+
+	df = pandas.DataFrame({
+			"key": ['a', 'b', 'a'],
+			"mass": KilogramArray(["1 kg", "2 kg", "500 g"]),
+			})
+	grouped = df.groupby("key")["mass"]
+
+	if _pandas_version < (1, 3):
+		# pandas 1.2 doesn't fall back from its Cython routines for extension arrays other than booleans and integers.
+		result = grouped.agg(lambda group: group.sum(numeric_only=False))
+	else:
+		result = grouped.sum(numeric_only=False)
+
+	assert result.tolist() == [1.5, 2]
+
+	expected = pandas.Series(MetreArray([1000, 250, 1000, 250]))
+	tm.assert_series_equal(pandas.concat([ser, ser], ignore_index=True), expected)
+	assert pandas.Series([1, 2], dtype="pascal[float32]").dtype == PascalType("float32")
+	assert repr(ser) == "0    1000.0 m\n1     250.0 m\ndtype: metre"
+
+	assert not pandas.api.types.is_bool_dtype(PascalType())
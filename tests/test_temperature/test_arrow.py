@@ -0,0 +1,130 @@
+# 3rd party
+import numpy  # type: ignore
+import pandas  # type: ignore
+import pytest
+
+# this package
+from si_unit_pandas import CelsiusType, TemperatureArray
+
+pyarrow = pytest.importorskip("pyarrow")
+
+# this package
+from si_unit_pandas._arrow_utils import ArrowCelsiusType  # noqa: E402
+
+
+def test_arrow_array():
+	arr = TemperatureArray([1, numpy.nan, 3])
+
+	result = pyarrow.array(arr)
+	assert result.type == ArrowCelsiusType()
+	assert result.null_count == 1
+	assert result.storage.to_pylist() == [1.0, None, 3.0]
+
+	# The float64 buffer is shared with Arrow.
+	assert numpy.shares_memory(numpy.frombuffer(result.storage.buffers()[1], dtype=numpy.float64), arr.data)
+
+
+def test_arrow_array_type():
+	arr = TemperatureArray([1, 2, 3])
+
+	assert pyarrow.array(arr, type=pyarrow.float64()).type == pyarrow.float64()
+	assert pyarrow.array(arr, type=ArrowCelsiusType()).type == ArrowCelsiusType()
+
+	with pytest.raises(TypeError, match="Not supported to convert TemperatureArray"):
+		pyarrow.array(arr, type=pyarrow.int64())
+
+
+def test_from_arrow():
+	storage = pyarrow.array([1.0, 2.0, 3.0])
+	result = CelsiusType().__from_arrow__(pyarrow.ExtensionArray.from_storage(ArrowCelsiusType(), storage))
+
+	assert isinstance(result, TemperatureArray)
+	assert result.data.tolist() == [1, 2, 3]
+	assert numpy.shares_memory(result.data, numpy.frombuffer(storage.buffers()[1], dtype=numpy.float64))
+
+
+def test_from_arrow_chunked():
+	# Other numeric storage types are cast to float64.
+	chunked = pyarrow.chunked_array([pyarrow.array([1, None]), pyarrow.array([3, 4])])
+	result = CelsiusType().__from_arrow__(chunked)
+
+	numpy.testing.assert_array_equal(result.data, [1, numpy.nan, 3, 4])
+	assert CelsiusType().__from_arrow__(pyarrow.chunked_array([], type=pyarrow.float64())).data.tolist() == []
+
+
+def test_arrow_table_round_trip():
+	df = pandas.DataFrame({'A': TemperatureArray([1, numpy.nan, 3]), 'B': [1, 2, 3]})
+
+	table = pyarrow.table(df)
+	assert table.schema.field('A').type == ArrowCelsiusType()
+
+	result = table.to_pandas()
+	assert result.dtypes['A'] == CelsiusType()
+	pandas.testing.assert_frame_equal(result, df)
+
+
+def test_arrow_ipc_round_trip():
+	table = pyarrow.table({'A': TemperatureArray([1, 2, 3])})
+
+	sink = pyarrow.BufferOutputStream()
+	with pyarrow.ipc.new_stream(sink, table.schema) as writer:
+		writer.write_table(table)
+
+	result = pyarrow.ipc.open_stream(sink.getvalue()).read_all()
+	assert result.schema.field('A').type == ArrowCelsiusType()
+	assert result.to_pandas()['A'].values.equals(TemperatureArray([1, 2, 3]))
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "feather"])
+def test_file_round_trip(tmp_path, monkeypatch, fmt):
+	df = pandas.DataFrame({'A': TemperatureArray([1, numpy.nan, 3]), 'B': [1, 2, 3]})
+	path = tmp_path / f"temperatures.{fmt}"
+
+	getattr(df, f"to_{fmt}")(path)
+
+	# The values should be restored directly from the Arrow buffers, without being parsed again.
+	def _to_int_pairs(*args, **kwargs):
+		raise AssertionError("The values should not be parsed.")
+
+	monkeypatch.setattr("si_unit_pandas.temperature._to_int_pairs", _to_int_pairs)
+
+	result = getattr(pandas, f"read_{fmt}")(path)
+	assert result.dtypes['A'] == CelsiusType()
+	pandas.testing.assert_frame_equal(result, df)
+
+
+def test_parquet_schema(tmp_path):
+	# 3rd party
+	import pyarrow.parquet  # type: ignore
+
+	path = tmp_path / "temperatures.parquet"
+	pandas.DataFrame({'A': TemperatureArray([1, 2, 3])}).to_parquet(path)
+
+	schema = pyarrow.parquet.read_schema(path)
+	assert schema.field('A').type == ArrowCelsiusType()
+	assert schema.field('A').type.storage_type == pyarrow.float64()
+
+
+def test_arrow_precision():
+	df = pandas.DataFrame({'A': TemperatureArray([1, numpy.nan, 3], dtype="celsius[float32]")})
+
+	table = pyarrow.table(df)
+	assert table.schema.field('A').type == ArrowCelsiusType(pyarrow.float32())
+	assert table.schema.field('A').type != ArrowCelsiusType()
+
+	result = table.to_pandas()
+	assert result.dtypes['A'] == CelsiusType("float32")
+	pandas.testing.assert_frame_equal(result, df)
+
+
+def test_arrow_display_unit():
+	df = pandas.DataFrame({'A': TemperatureArray([0, numpy.nan, 100]).astype("temperature[F]")})
+
+	table = pyarrow.table(df)
+	assert table.schema.field('A').type == ArrowCelsiusType(unit='F')
+	assert table.schema.field('A').type != ArrowCelsiusType()
+	assert table.schema.field('A').type.storage_type == pyarrow.float64()
+
+	result = table.to_pandas()
+	assert result.dtypes['A'] == "temperature[F]"
+	pandas.testing.assert_frame_equal(result, df)
@@ -1,9 +1,10 @@
 # 3rd party
 import numpy  # type: ignore
+import pandas  # type: ignore
 import pytest
 
 # this package
-from si_unit_pandas import CelsiusType
+from si_unit_pandas import CelsiusType, TemperatureType
 from si_unit_pandas.temperature import TemperatureArray, TemperatureBase
 
 
@@ -41,3 +42,61 @@ def test_celsius_type():
 
 	assert obj._is_numeric
 	assert obj._is_boolean
+
+
+@pytest.mark.parametrize("precision", ["float16", "float32", "float64"])
+def test_celsius_type_precision(precision):
+	obj = CelsiusType(precision)
+	assert obj.precision == precision
+	assert obj._record_type == numpy.dtype(precision)
+	assert CelsiusType(numpy.dtype(precision)) == obj
+
+	name = "celsius" if precision == "float64" else f"celsius[{precision}]"
+	assert obj.name == name
+	assert CelsiusType.construct_from_string(name) == obj
+	assert pandas.api.types.pandas_dtype(name) == obj
+	assert hash(CelsiusType(precision)) == hash(obj)
+
+	assert CelsiusType.construct_from_string(f"celsius[{precision}]") == obj
+
+
+def test_celsius_type_precision_invalid():
+	assert CelsiusType("float32") != CelsiusType()
+	assert CelsiusType() == CelsiusType("float64")
+
+	with pytest.raises(ValueError, match="Unsupported precision 'int64'"):
+		CelsiusType("int64")
+
+	with pytest.raises(TypeError):
+		CelsiusType.construct_from_string("celsius[int64]")
+
+
+def test_temperature_type():
+	obj = TemperatureType('F')
+	assert obj.unit == 'F'
+	assert obj.precision == "float64"
+	assert obj.name == "temperature[F]"
+	assert obj.construct_array_type() is TemperatureArray
+	assert TemperatureType('F', "float32").name == "temperature[F, float32]"
+
+	assert CelsiusType.construct_from_string("temperature[F]") == obj
+	assert pandas.api.types.pandas_dtype("temperature[F, float32]") == TemperatureType('F', "float32")
+	assert obj == "temperature[F]"
+	assert hash(TemperatureType('F')) == hash(obj)
+
+	assert obj != CelsiusType()
+	assert TemperatureType('C') == CelsiusType()
+	assert TemperatureType() == "celsius"
+	assert hash(TemperatureType('C', "float32")) == hash(CelsiusType("float32"))
+
+	with pytest.raises(ValueError, match="Unknown temperature unit 'K'"):
+		TemperatureType('K')
+
+	with pytest.raises(TypeError):
+		CelsiusType.construct_from_string("temperature[K]")
+
+
+def test_temperature_type_common_dtype():
+	assert CelsiusType()._get_common_dtype([TemperatureType('F'), TemperatureType('F', "float32")]) == "temperature[F]"
+	assert CelsiusType()._get_common_dtype([TemperatureType('F'), CelsiusType("float32")]) == "celsius"
+	assert CelsiusType()._get_common_dtype([TemperatureType('F'), numpy.dtype(float)]) is None
@@ -1,9 +1,14 @@
+# stdlib
+import pickle
+
 # 3rd party
 import numpy  # type: ignore
+import pandas  # type: ignore
 import pytest
 
 # this package
 from si_unit_pandas import CelsiusType, TemperatureArray
+from si_unit_pandas.base import unique_nbytes
 
 _non_empty_sets = [
 		{1},
@@ -204,3 +209,326 @@ def test_isna():
 	assert not numpy.any(TemperatureArray([2, 3, 4, 5, 6]).isna())
 	assert numpy.any(TemperatureArray([2, 3, 4, 5, numpy.nan]).isna())
 	assert TemperatureArray([2, 3, 4, 5, numpy.nan]).isna()[4]
+
+
+def test_from_buffer_ndarray():
+	arr = numpy.array([1, 2, 3, 4, 5], dtype=numpy.float64)
+
+	assert TemperatureArray.from_buffer(arr).data is arr
+	assert TemperatureArray.from_buffer(arr, copy=False).data is arr
+	assert not numpy.shares_memory(TemperatureArray.from_buffer(arr, copy=True).data, arr)
+
+	strided = arr[::2]
+	assert TemperatureArray.from_buffer(strided, copy=False).data is strided
+
+	arr2d = arr[:4].reshape(2, 2)
+	result = TemperatureArray.from_buffer(arr2d, copy=False)
+	assert numpy.shares_memory(result.data, arr2d)
+	assert result.data.tolist() == [1, 2, 3, 4]
+
+
+@pytest.mark.parametrize("buffer", [
+		memoryview(numpy.array([1, 2, 3], dtype=numpy.float64)),
+		bytearray(numpy.array([1, 2, 3], dtype=numpy.float64).tobytes()),
+		numpy.array([1, 2, 3], dtype=numpy.float64).tobytes(),
+		])
+def test_from_buffer_buffer_protocol(buffer):
+	result = TemperatureArray.from_buffer(buffer, copy=False)
+	assert result.data.dtype == numpy.float64
+	assert result.data.tolist() == [1.0, 2.0, 3.0]
+	assert numpy.shares_memory(result.data, numpy.frombuffer(buffer, dtype=numpy.uint8))
+
+
+def test_from_buffer_writes_through():
+	buffer = bytearray(numpy.array([1, 2, 3], dtype=numpy.float64).tobytes())
+	arr = TemperatureArray.from_buffer(buffer)
+	arr[0] = 10
+	assert numpy.frombuffer(buffer, dtype=numpy.float64)[0] == 10
+
+
+@pytest.mark.parametrize("buffer", [
+		numpy.array([1, 2, 3]),
+		numpy.array([1, 2, 3], dtype=numpy.float32),
+		numpy.array([1, 2, 3], dtype=">f8"),
+		memoryview(numpy.array([1, 2, 3], dtype=numpy.int32)),
+		numpy.ones((3, 3))[:, 0:2],
+		])
+def test_from_buffer_copy_required(buffer):
+	with pytest.raises(ValueError, match="Unable to avoid copying data"):
+		TemperatureArray.from_buffer(buffer, copy=False)
+
+	result = TemperatureArray.from_buffer(buffer)
+	assert result.data.dtype == numpy.float64
+	assert result.data.tolist() == numpy.asarray(buffer).reshape(-1).tolist()
+
+
+def test_init_memoryview():
+	arr = numpy.array([1, 2, 3, 4, 5], dtype=numpy.float64)
+	assert numpy.shares_memory(TemperatureArray(memoryview(arr)).data, arr)
+
+
+def test_take():
+	arr = TemperatureArray([1, 2, 3, 4, 5])
+
+	assert arr.take([0, 4, 2]).data.tolist() == [1, 5, 3]
+	assert arr.take([-1, -5]).data.tolist() == [5, 1]
+	assert arr.take([]).data.tolist() == []
+
+	result = arr.take([0, -1, 3], allow_fill=True)
+	numpy.testing.assert_array_equal(result.data, [1, numpy.nan, 4])
+
+	result = arr.take([0, -1, 3], allow_fill=True, fill_value=2.5)
+	assert result.data.tolist() == [1, 2.5, 4]
+
+
+@pytest.mark.parametrize(
+		"indices, allow_fill, exception",
+		[
+				([0, 5], False, IndexError),
+				([0, -6], False, IndexError),
+				([0, 5], True, IndexError),
+				([0, -2], True, ValueError),
+				]
+		)
+def test_take_invalid(indices, allow_fill, exception):
+	with pytest.raises(exception):
+		TemperatureArray([1, 2, 3, 4, 5]).take(indices, allow_fill=allow_fill)
+
+
+def test_take_empty():
+	arr = TemperatureArray([])
+
+	assert arr.take([]).data.tolist() == []
+	numpy.testing.assert_array_equal(arr.take([-1, -1], allow_fill=True).data, [numpy.nan, numpy.nan])
+	assert arr.take([-1], allow_fill=True, fill_value=1).data.tolist() == [1]
+
+	with pytest.raises(IndexError):
+		arr.take([0])
+
+
+def test_take_out():
+	arr = TemperatureArray([1, 2, 3, 4, 5])
+	out = numpy.empty(3)
+
+	result = arr.take([4, -1, 0], allow_fill=True, out=out)
+	assert result.data is out
+	numpy.testing.assert_array_equal(out, [5, numpy.nan, 1])
+
+
+def test_memmap_round_trip(tmp_path):
+	path = tmp_path / "temperatures.bin"
+	TemperatureArray([1.5, 2, numpy.nan, 4, 5]).to_file(path)
+	assert path.stat().st_size == 5 * 8
+
+	arr = TemperatureArray.from_memmap(path)
+	assert type(arr.data) is numpy.ndarray
+	assert isinstance(arr.data.base, numpy.memmap)
+	assert not arr.data.flags.writeable
+	numpy.testing.assert_array_equal(arr.data, [1.5, 2, numpy.nan, 4, 5])
+
+	assert arr[1:3].data.base is not None
+	assert arr.isna().tolist() == [False, False, True, False, False]
+	assert arr.take([4, 0]).data.tolist() == [5, 1.5]
+
+
+def test_memmap_offset_length(tmp_path):
+	path = tmp_path / "temperatures.bin"
+	TemperatureArray([1, 2, 3, 4, 5]).to_file(path)
+
+	arr = TemperatureArray.from_memmap(path, offset=8, length=3)
+	assert arr.data.tolist() == [2, 3, 4]
+
+
+def test_memmap_write(tmp_path):
+	path = tmp_path / "temperatures.bin"
+	TemperatureArray([1, 2, 3]).to_file(path)
+
+	arr = TemperatureArray.from_memmap(path, mode='c')
+	arr[0] = 10
+	assert numpy.fromfile(path).tolist() == [1, 2, 3]
+
+	arr = TemperatureArray.from_memmap(path, mode="r+")
+	arr[0] = 10
+	del arr
+	assert numpy.fromfile(path).tolist() == [10, 2, 3]
+
+	with pytest.raises(ValueError, match="'mode' must be one of"):
+		TemperatureArray.from_memmap(path, mode='w+')
+
+
+@pytest.mark.parametrize("precision", ["float16", "float32", "float64"])
+def test_precision(precision):
+	dtype = CelsiusType(precision)
+	arr = TemperatureArray([1, 2, numpy.nan], dtype=dtype)
+
+	assert arr.data.dtype == numpy.dtype(precision)
+	assert arr.dtype == dtype
+	assert arr.nbytes == 3 * numpy.dtype(precision).itemsize
+
+	assert TemperatureArray(arr).dtype == dtype
+	assert TemperatureArray(arr, dtype=dtype.name).dtype == dtype
+	assert TemperatureArray._from_sequence([1, 2], dtype=dtype).dtype == dtype
+
+	for result in [arr[:2], arr.copy(), arr.take([0, -1], allow_fill=True), arr + 1, arr.unique()]:
+		assert result.dtype == dtype
+
+	assert TemperatureArray._concat_same_type([arr, arr]).dtype == dtype
+	assert arr.astype("celsius").data.dtype == numpy.float64
+	assert TemperatureArray([1, 2]).astype(dtype).dtype == dtype
+
+
+def test_precision_comparisons():
+	arr = TemperatureArray([0.1, 0.2], dtype="celsius[float32]")
+
+	assert arr.isin([0.1]).tolist() == [True, False]
+	assert (arr == 0.1).tolist() == [True, False]
+	assert (arr == [0.1, 0.2]).tolist() == [True, True]
+
+
+def test_precision_concat():
+	arr32 = pandas.Series(TemperatureArray([1, 2], dtype="celsius[float32]"))
+	arr64 = pandas.Series(TemperatureArray([3, 4]))
+
+	assert pandas.concat([arr32, arr32]).dtype == CelsiusType("float32")
+	assert pandas.concat([arr32, arr64]).dtype == CelsiusType("float64")
+
+
+def test_precision_buffer(tmp_path):
+	path = tmp_path / "temperatures.bin"
+	TemperatureArray([1, 2, 3], dtype="celsius[float32]").to_file(path)
+	assert path.stat().st_size == 3 * 4
+
+	arr = TemperatureArray.from_memmap(path, dtype="celsius[float32]")
+	assert arr.dtype == CelsiusType("float32")
+	assert arr.data.tolist() == [1, 2, 3]
+
+	arr = TemperatureArray.from_buffer(numpy.array([1, 2], dtype=numpy.float32), copy=False, dtype="celsius[float32]")
+	assert arr.dtype == CelsiusType("float32")
+
+
+def test_mask():
+	arr = TemperatureArray([1, numpy.nan, 3, 4], mask=[False, False, True, False])
+
+	assert arr.isna().tolist() == [False, False, True, False]
+	assert numpy.isnan(arr.data[2])
+	assert numpy.isnan(float(arr[1]))
+	assert arr[2] is arr.na_value
+	assert arr.nbytes == 4 * 8 + 4
+
+	assert arr[1:].isna().tolist() == [False, True, False]
+	assert arr.take([2, 0, -1], allow_fill=True).isna().tolist() == [True, False, True]
+	assert arr.copy().isna().tolist() == arr.isna().tolist()
+	assert (arr + 1).isna().tolist() == arr.isna().tolist()
+	assert numpy.fmax(arr, 0).isna().tolist() == arr.isna().tolist()
+
+	concat = TemperatureArray._concat_same_type([arr, TemperatureArray([numpy.nan])])
+	assert concat.isna().tolist() == [False, False, True, False, True]
+
+	assert "<NA>" in repr(arr)
+	assert pickle.loads(pickle.dumps(arr)).isna().tolist() == arr.isna().tolist()
+
+	with pytest.raises(ValueError, match="The mask must have the same shape as the data"):
+		TemperatureArray([1, 2], mask=[True])
+
+
+def test_mask_setitem():
+	arr = TemperatureArray([1, 2, 3], mask=[False, False, False])
+
+	arr[0] = None
+	arr[1] = numpy.nan
+	arr[2] = 5
+
+	assert arr.isna().tolist() == [True, True, False]
+
+	arr.append([6, numpy.nan])
+	assert arr.isna().tolist() == [True, True, False, False, True]
+
+
+def test_mask_pandas():
+	arr = TemperatureArray([1, numpy.nan, 3], mask=[False, False, True])
+	ser = pandas.Series(arr)
+
+	assert ser.isna().tolist() == [False, False, True]
+	assert ser.dropna().array.isna().tolist() == [False, False]
+	assert numpy.isnan(float(ser.max(numeric_only=False)))
+	assert ser.iloc[[0, 2]].max(numeric_only=False) == 1
+
+	missing = ser.isna()
+	missing[:] = True
+	arr.isna()[:] = True
+	assert arr.isna().tolist() == [False, False, True]
+	assert ser.notna().tolist() == [True, True, False]
+
+
+
+def test_mask_factorize():
+	arr = TemperatureArray([1, numpy.nan, 2, numpy.nan, 1], mask=[False, False, False, True, False])
+
+	codes, uniques = arr.factorize()
+	assert codes.tolist() == [0, 1, 2, -1, 0]
+	assert uniques.isna().tolist() == [False, False, False]
+	assert numpy.isnan(float(uniques[1]))
+
+	assert arr.factorize(na_sentinel=-2)[0].tolist() == [0, 1, 2, -2, 0]
+
+	result = arr.unique()
+	assert result.isna().tolist() == [False, False, False, True]
+	assert numpy.isnan(float(result[1]))
+
+	result = TemperatureArray([numpy.nan, 1, numpy.nan], mask=[True, False, False]).unique()
+	assert result.isna().tolist() == [True, False, False]
+	assert float(result[1]) == 1
+
+
+def test_mask_arrow():
+	pyarrow = pytest.importorskip("pyarrow")
+
+	arr = TemperatureArray([1, numpy.nan, numpy.nan], mask=[False, False, True])
+	result = pyarrow.table(pandas.DataFrame({'A': arr})).to_pandas()['A'].array
+	assert result.isna().tolist() == [False, False, True]
+	assert numpy.isnan(float(result[1]))
+
+	arr = TemperatureArray([1, numpy.nan], mask=[False, False])
+	assert pyarrow.array(arr).to_pandas().array.isna().tolist() == [False, False]
+
+	# Without a mask all NaN values are missing.
+	result = pyarrow.table(pandas.DataFrame({'A': TemperatureArray([1, numpy.nan])})).to_pandas()['A'].array
+	assert result.isna().tolist() == [False, True]
+	assert result._mask is None
+
+
+def test_nbytes():
+	arr = TemperatureArray(numpy.arange(10.0))
+
+	assert arr.nbytes == 80
+	assert arr[:5].nbytes == 40
+	assert TemperatureArray([1, 2], dtype="celsius[float32]").nbytes == 8
+	assert pandas.Series(arr).memory_usage(deep=True, index=False) == 80
+
+
+def test_owns_buffer(tmp_path):
+	arr = TemperatureArray(numpy.arange(10.0))
+
+	assert arr.owns_buffer()
+	assert arr.copy().owns_buffer()
+	assert not arr[2:].owns_buffer()
+	assert not TemperatureArray.from_buffer(numpy.arange(3.0).tobytes(), copy=False).owns_buffer()
+
+	path = tmp_path / "temperatures.bin"
+	arr.to_file(path)
+	assert not TemperatureArray.from_memmap(path).owns_buffer()
+
+
+def test_unique_nbytes():
+	arr = TemperatureArray(numpy.arange(10.0))
+
+	assert unique_nbytes([arr]) == 80
+	assert unique_nbytes([arr, arr[2:5], arr[::2]]) == 80
+	assert unique_nbytes([arr[:3], arr[5:7]]) == 40
+	assert unique_nbytes([arr, arr.copy()]) == 160
+	assert unique_nbytes([]) == 0
+
+	series = pandas.Series(arr)
+	df = pandas.DataFrame({'a': series, 'b': arr.copy(), 'c': series})
+	assert df.memory_usage(deep=True, index=False).sum() == 240
+	assert unique_nbytes(df[column] for column in df.columns) == 160
@@ -2,6 +2,7 @@
 import numpy  # type: ignore
 import pandas  # type: ignore
 import pandas.testing as tm  # type: ignore
+import pytest
 from domdf_python_tools.testing import not_windows
 from hypothesis import given
 from hypothesis.strategies import integers, lists
@@ -15,6 +16,8 @@ import si_unit_pandas
 # ----------------------------------------------------------------------------
 from si_unit_pandas import Celsius
 
+_pandas_version = tuple(map(int, pandas.__version__.split('.')[:2]))
+
 
 def test_concatenate_blocks():
 	v1 = si_unit_pandas.TemperatureArray([1, 2, 3])
@@ -96,6 +99,18 @@ def test_argsort(ints):
 	# tm.assert_series_equal(result.si_unit_pandas.to_pyints(), expected)
 
 
+def test_sort_values():
+	ser = pandas.Series(si_unit_pandas.TemperatureArray([3, numpy.nan, 1, 2]))
+
+	result = ser.sort_values()
+	expected = pandas.Series(si_unit_pandas.TemperatureArray([1, 2, 3, numpy.nan]), index=[2, 3, 0, 1])
+	tm.assert_series_equal(result, expected)
+
+	result = ser.sort_values(ascending=False, na_position="first")
+	expected = pandas.Series(si_unit_pandas.TemperatureArray([numpy.nan, 3, 2, 1]), index=[1, 0, 3, 2])
+	tm.assert_series_equal(result, expected)
+
+
 # ---------
 # Factorize
 # ---------
@@ -133,3 +148,102 @@ def test_groupby_make_grouper_groupings():
 	assert result.keys() == p1.groups.keys()
 	for k in result.keys():
 		assert result[k].equals(p1.groups[k])
+
+
+def test_groupby_aggregate():
+	values = numpy.array([1.0, 2.0, numpy.nan, 4.0, 5.0, 6.0])
+	df = pandas.DataFrame({'A': [1, 1, 1, 2, 2, 2], 'B': si_unit_pandas.TemperatureArray(values)})
+	gr = df.groupby('A')['B']
+
+	expected = {
+			"sum": [3.0, 15.0],
+			"min": [1.0, 4.0],
+			"max": [2.0, 6.0],
+			"first": [1.0, 4.0],
+			"last": [2.0, 6.0],
+			}
+
+	for how, expected_values in expected.items():
+		result = getattr(gr, how)()
+		assert result.dtype == df.B.dtype
+		assert result.values.equals(si_unit_pandas.TemperatureArray(expected_values))
+
+	# pandas 1.2 only counts dtypes with a numpy.number scalar type as numeric.
+	kwargs = {"numeric_only": False} if _pandas_version < (1, 3) else {}
+
+	for how in ["mean", "median"]:
+		result = getattr(gr, how)(**kwargs)
+		assert result.dtype == df.B.dtype
+		assert result.values.equals(si_unit_pandas.TemperatureArray([1.5, 5.0]))
+
+	assert gr.count().tolist() == [2, 3]
+	assert df.groupby('A').mean(**kwargs)['B'].dtype == df.B.dtype
+
+
+@pytest.mark.skipif(_pandas_version < (2, 1), reason="pandas < 2.1 doesn't call _groupby_op")
+def test_groupby_op(monkeypatch):
+	calls = []
+	groupby_op = si_unit_pandas.TemperatureArray._groupby_op
+
+	def wrapper(self, **kwargs):
+		calls.append(kwargs["how"])
+		return groupby_op(self, **kwargs)
+
+	monkeypatch.setattr(si_unit_pandas.TemperatureArray, "_groupby_op", wrapper)
+
+	values = si_unit_pandas.TemperatureArray([1.0, 2.0, numpy.nan, 4.0, 5.0, 6.0])
+	gr = pandas.Series(values).groupby([1, 1, 1, 2, 2, 2])
+
+	result = gr.mean()
+	assert result.dtype == values.dtype
+	assert result.values.equals(si_unit_pandas.TemperatureArray([1.5, 5.0]))
+
+	result = gr.cumsum()
+	assert result.dtype == values.dtype
+	assert result.values.equals(si_unit_pandas.TemperatureArray([1.0, 3.0, numpy.nan, 4.0, 9.0, 15.0]))
+
+	result = gr.std()
+	assert result.dtype == numpy.float64
+	numpy.testing.assert_array_almost_equal(result.values, [numpy.sqrt(0.5), 1.0])
+
+	assert gr.rank().dtype == numpy.float64
+
+	with pytest.raises(TypeError, match="cannot perform prod"):
+		gr.prod()
+
+	assert calls[:4] == ["mean", "cumsum", "std", "rank"]
+
+
+
+def test_groupby_display_unit():
+	values = si_unit_pandas.to_temperature([0.0, 10.0, 20.0]).astype("temperature[F]")
+	gr = pandas.Series(values).groupby([1, 1, 2])
+
+	result = gr.sum()
+	assert result.dtype == values.dtype
+	numpy.testing.assert_array_almost_equal(result.values.data, [(82 - 32) / 1.8, (68 - 32) / 1.8])
+
+	result = gr.mean(**({"numeric_only": False} if _pandas_version < (1, 3) else {}))
+	assert result.dtype == values.dtype
+	numpy.testing.assert_array_almost_equal(result.values.data, [5.0, 20.0])
+
+	if _pandas_version >= (2, 1):
+		numpy.testing.assert_array_almost_equal(gr.std().values, [numpy.sqrt(162), numpy.nan])
+		numpy.testing.assert_array_almost_equal(gr.var().values, [162, numpy.nan])
+
+
+def test_to_numpy():
+	arr = si_unit_pandas.TemperatureArray([1, 2, numpy.nan])
+
+	result = arr.to_numpy(dtype="float64")
+	assert result.dtype == numpy.float64
+	assert numpy.shares_memory(result, arr.data)
+	assert not numpy.shares_memory(arr.to_numpy(dtype="float64", copy=True), arr.data)
+	assert_numpy_array_equal(arr.to_numpy(dtype="float32", na_value=0), numpy.array([1, 2, 0], dtype="float32"))
+	assert_numpy_array_equal(arr.to_numpy(dtype="int64", na_value=-1), numpy.array([1, 2, -1], dtype="int64"))
+	assert numpy.isnan(arr.data[2])
+
+	with pytest.raises(ValueError, match="missing values"):
+		arr.to_numpy(dtype="int64")
+
+	assert arr.to_numpy().dtype == object
@@ -1,5 +1,6 @@
 # stdlib
 import operator
+import warnings
 
 # 3rd party
 import numpy  # type: ignore
@@ -9,6 +10,7 @@ import pytest
 
 # this package
 import si_unit_pandas
+from si_unit_pandas import Celsius
 
 
 @pytest.fixture()
@@ -148,3 +150,69 @@ def test_dropna():
 	result = missing.to_frame().dropna()
 	expected = expected.to_frame()
 	tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+		"name, expected",
+		[
+				("sum", Celsius(6)),
+				("mean", Celsius(1.5)),
+				("median", Celsius(1.5)),
+				("min", Celsius(0)),
+				("max", Celsius(3)),
+				("std", float(numpy.std([0, 1, 2, 3], ddof=1))),
+				("var", float(numpy.var([0, 1, 2, 3], ddof=1))),
+				("sem", float(numpy.std([0, 1, 2, 3], ddof=1) / 2)),
+				]
+		)
+def test_reductions(name, expected):
+	ser = pandas.Series(si_unit_pandas.TemperatureArray([0, 1, numpy.nan, 2, 3]))
+	result = getattr(ser, name)()
+	assert type(result) is type(expected)
+	assert result == pytest.approx(expected)
+
+	assert numpy.isnan(getattr(ser, name)(skipna=False))
+
+
+def test_reductions_empty():
+	ser = pandas.Series(si_unit_pandas.TemperatureArray([numpy.nan, numpy.nan]))
+	assert ser.sum() == Celsius(0)
+	assert numpy.isnan(ser.sum(min_count=1))
+	assert numpy.isnan(ser.mean())
+	assert numpy.isnan(ser.min())
+	assert numpy.isnan(ser.max())
+	assert numpy.isnan(ser.median())
+
+	ser = pandas.Series(si_unit_pandas.TemperatureArray([1]))
+	assert numpy.isnan(ser.std())
+	assert ser.std(ddof=0) == 0
+
+
+def test_reductions_ddof():
+	ser = pandas.Series(si_unit_pandas.TemperatureArray([0, 1, 2, 3]))
+	assert ser.std(ddof=0) == pytest.approx(numpy.std([0, 1, 2, 3]))
+	assert ser.var(ddof=0) == pytest.approx(numpy.var([0, 1, 2, 3]))
+
+
+def test_reductions_float16():
+	ser = pandas.Series(si_unit_pandas.TemperatureArray(numpy.full(100_000, 100.0), dtype="celsius[float16]"))
+
+	with warnings.catch_warnings():
+		warnings.simplefilter("error")
+		assert ser.sum() == Celsius(10_000_000)
+		assert ser.mean() == Celsius(100)
+		assert ser.std() == 0
+		assert ser.var() == 0
+
+
+def test_reductions_unsupported():
+	ser = pandas.Series(si_unit_pandas.TemperatureArray([0, 1, 2, 3]))
+
+	with pytest.raises(TypeError, match="cannot perform prod with type celsius"):
+		ser.prod()
+
+
+def test_reductions_frame(frame):
+	result = frame[['A', 'C']].max()
+	assert result['A'] == Celsius(2)
+	assert result['C'] == Celsius(2)
@@ -1,5 +1,7 @@
 # stdlib
 import operator
+import pickle
+import sys
 
 # 3rd party
 import numpy  # type: ignore
@@ -12,8 +14,8 @@ from pandas._testing import assert_numpy_array_equal  # type: ignore
 
 # this package
 import si_unit_pandas
-from si_unit_pandas import TemperatureArray, to_temperature
-from si_unit_pandas.temperature import Celsius
+from si_unit_pandas import TemperatureArray, TemperatureBuffer, to_temperature
+from si_unit_pandas.temperature import Celsius, Fahrenheit, parse_temperature_strings
 
 
 @pytest.mark.parametrize("values", [62, "62", "62.0"])
@@ -51,6 +53,28 @@ def test_repr_works():
 	assert result == expected
 
 
+def test_repr_truncated():
+	values = si_unit_pandas.TemperatureArray(numpy.arange(1000))
+	result = repr(values)
+	assert result.startswith("TemperatureArray([0.0\u205f℃, 1.0\u205f℃, ")
+	assert result.endswith(", 998.0\u205f℃, 999.0\u205f℃])")
+	assert result.count('℃') == 100
+	assert ", ..., " in result
+
+	with pandas.option_context("display.max_seq_items", 4):
+		expected = "TemperatureArray([0.0\u205f℃, 1.0\u205f℃, ..., 998.0\u205f℃, 999.0\u205f℃])"
+		assert repr(values) == expected
+
+
+def test_format_values():
+	values = [0, -0.0, 0.1, 1e16, 1234567890123456.0, -273.15, 2**64 + 1, numpy.nan, numpy.inf, -numpy.inf]
+	result = si_unit_pandas.TemperatureArray(values)._format_values()
+	assert isinstance(result, numpy.ndarray)
+	assert result.tolist() == [str(Celsius(value)) for value in values]
+
+	assert si_unit_pandas.TemperatureArray([])._format_values().tolist() == []
+
+
 def test_isna():
 	v = si_unit_pandas.TemperatureArray([0, 2, 2**64, 2**64 + 1, 2**64 + 2])
 	r1 = v.isna()
@@ -131,6 +155,119 @@ def test_ops(tup):
 	assert_numpy_array_equal(r1, r2)
 
 
+def test_comparison_scalars():
+	arr = si_unit_pandas.TemperatureArray([0, 10, numpy.nan])
+
+	assert_numpy_array_equal(arr == 10, numpy.array([False, True, False]))
+	assert_numpy_array_equal(arr != 10, numpy.array([True, False, True]))
+	assert_numpy_array_equal(arr < Celsius(5), numpy.array([True, False, False]))
+	assert_numpy_array_equal(arr >= Fahrenheit(50), numpy.array([False, True, False]))
+	assert_numpy_array_equal(Celsius(5) > arr, numpy.array([True, False, False]))
+
+
+def test_comparison_arrays():
+	arr = si_unit_pandas.TemperatureArray([0, 10, 20])
+	other = si_unit_pandas.TemperatureArray([5, 10, 15])
+
+	assert_numpy_array_equal(arr <= other, numpy.array([True, True, False]))
+	assert_numpy_array_equal(arr == numpy.array([0, 1, 20]), numpy.array([True, False, True]))
+	assert_numpy_array_equal(arr > [Celsius(5), Fahrenheit(50), 15], numpy.array([False, False, True]))
+
+	with pytest.raises(ValueError, match="Lengths must match"):
+		arr == [1, 2]  # pylint: disable=pointless-statement
+
+
+def test_comparison_invalid():
+	arr = si_unit_pandas.TemperatureArray([0, 1, 2])
+
+	assert_numpy_array_equal(arr == 'a', numpy.array([False, False, False]))
+	assert_numpy_array_equal(arr != 'a', numpy.array([True, True, True]))
+	assert_numpy_array_equal(arr == None, numpy.array([False, False, False]))  # noqa: E711
+
+
+def test_arithmetic():
+	arr = si_unit_pandas.TemperatureArray([0, 10, numpy.nan])
+
+	result = arr + 5
+	assert isinstance(result, TemperatureArray)
+	npt.assert_array_equal(result.data, [5, 15, numpy.nan])
+	npt.assert_array_equal((5 + arr).data, [5, 15, numpy.nan])
+	npt.assert_array_equal((arr - 5).data, [-5, 5, numpy.nan])
+	npt.assert_array_equal((arr * 2).data, [0, 20, numpy.nan])
+	npt.assert_array_equal((arr / 2).data, [0, 5, numpy.nan])
+	npt.assert_array_equal((-arr).data, [0, -10, numpy.nan])
+
+	# The result wraps the output of the ufunc without copying it.
+	out = numpy.empty(3)
+	assert numpy.add(arr, 5, out=out) is out
+	npt.assert_array_equal(out, [5, 15, numpy.nan])
+
+	assert numpy.add.reduce(arr[:2]) == Celsius(10)
+	assert isinstance(numpy.maximum.accumulate(arr), TemperatureArray)
+
+
+def test_arithmetic_difference():
+	arr = si_unit_pandas.TemperatureArray([0, 10, 20])
+
+	result = arr - si_unit_pandas.TemperatureArray([5, 5, 5])
+	assert type(result) is numpy.ndarray
+	npt.assert_array_equal(result, [-5, 5, 15])
+
+	npt.assert_array_equal(arr - Celsius(10), [-10, 0, 10])
+	npt.assert_array_equal(arr - Fahrenheit(32), [0, 10, 20])
+
+	result = pandas.Series(arr) - pandas.Series(arr)
+	assert result.dtype == numpy.float64
+
+
+@pytest.mark.parametrize(
+		"func",
+		[
+				lambda arr: arr + arr,
+				lambda arr: arr + Celsius(1),
+				lambda arr: 1 - arr,
+				lambda arr: arr * arr,
+				lambda arr: 1 / arr,
+				numpy.sqrt,
+				]
+		)
+def test_arithmetic_raises(func):
+	arr = si_unit_pandas.TemperatureArray([0, 1, 2])
+
+	with pytest.raises(TypeError):
+		func(arr)
+
+
+def test_arithmetic_inplace():
+	arr = si_unit_pandas.TemperatureArray([0, 1, 2])
+	data = arr.data
+
+	arr += 1
+	assert arr.data is data
+	npt.assert_array_equal(data, [1, 2, 3])
+
+	numpy.multiply(arr, 2, out=arr)
+	npt.assert_array_equal(data, [2, 4, 6])
+
+	with pytest.raises(TypeError, match="cannot store"):
+		arr -= arr
+
+
+def test_clip():
+	arr = si_unit_pandas.TemperatureArray([-10, 0, 10, 20, numpy.nan])
+
+	result = arr.clip(0, Fahrenheit(50))
+	assert isinstance(result, TemperatureArray)
+	npt.assert_array_equal(result.data, [0, 0, 10, 10, numpy.nan])
+
+	npt.assert_array_equal(numpy.clip(arr, Celsius(5), None).data, [5, 5, 10, 20, numpy.nan])
+
+	data = arr.data
+	assert arr.clip(upper=15, out=arr) is arr
+	assert arr.data is data
+	npt.assert_array_equal(data, [-10, 0, 10, 15, numpy.nan])
+
+
 def test_iter_works():
 	x = si_unit_pandas.TemperatureArray([0, 1, 2])
 	result = list(x)
@@ -142,6 +279,40 @@ def test_iter_works():
 	assert result == expected
 
 
+def test_iter_chunks(monkeypatch):
+	monkeypatch.setattr(si_unit_pandas.base, "_iter_chunk_size", 2)
+	arr = TemperatureArray([0, 1, 2, 3, 4])
+
+	result = list(arr)
+	assert result == [Celsius(0), Celsius(1), Celsius(2), Celsius(3), Celsius(4)]
+	assert all(type(value) is Celsius for value in result)
+	assert list(arr.iter_values(raw=True)) == [0.0, 1.0, 2.0, 3.0, 4.0]
+	assert list(arr[:0]) == []
+
+
+def test_iter_missing():
+	arr = TemperatureArray([1, numpy.nan, 3], mask=[False, True, False])
+	assert list(arr) == [Celsius(1), arr.na_value, Celsius(3)]
+	assert list(arr)[1] is arr.na_value
+
+	raw = list(arr.iter_values(raw=True))
+	assert raw[0] == 1.0 and numpy.isnan(raw[1]) and type(raw[2]) is float
+
+
+def test_array_dtype():
+	arr = TemperatureArray([1, 2])
+	npt.assert_array_equal(numpy.array(arr, dtype=numpy.float32), numpy.array([1, 2], dtype=numpy.float32))
+	assert numpy.array(arr, dtype=int).tolist() == [1, 2]
+	assert numpy.array(arr[:0]).dtype == object
+
+	ser = pandas.Series(arr)
+	assert ser.to_dict() == {0: Celsius(1), 1: Celsius(2)}
+	assert ser.apply(float).tolist() == [1.0, 2.0]
+
+	with pytest.raises(ValueError, match="missing values"):
+		numpy.array(TemperatureArray([1, numpy.nan]), dtype=int)
+
+
 def test_topyints():
 	values = [0, 1, 2**32]
 	arr = si_unit_pandas.TemperatureArray(values)
@@ -209,3 +380,513 @@ def test_from_ndarray(values):
 	result = si_unit_pandas.TemperatureArray(numpy.asarray(values))
 	expected = si_unit_pandas.TemperatureArray(values)
 	assert result.equals(expected)
+
+
+@pytest.mark.parametrize("values", [
+		["21.5", "-3", "1e3"],
+		["21.5 ℃", "-3℃", "1e3 ℃"],
+		["21.5°C", "-3 °C", "1e3°C"],
+		["21.5 C", "-3 C", "1e3 C"],
+		["21.5 ℃", "-3 ℃", "1e3 ℃"],
+		numpy.array(["21.5 ℃", "-3 ℃", "1e3 ℃"]),
+		numpy.array(["21.5 ℃", "-3 ℃", "1e3 ℃"], dtype=object),
+		])
+def test_parse_temperature_strings(values):
+	result, failed = parse_temperature_strings(values)
+	npt.assert_array_equal(result, numpy.array([21.5, -3.0, 1000.0]))
+	assert result.dtype == numpy.float64
+	assert not failed.any()
+
+	assert to_temperature(values).equals(TemperatureArray([21.5, -3.0, 1000.0]))
+
+
+def test_parse_temperature_strings_nan():
+	result, failed = parse_temperature_strings(numpy.array(["nan", "NaN ℃", None, numpy.nan, "4"], dtype=object))
+	npt.assert_array_equal(result, numpy.array([numpy.nan, numpy.nan, numpy.nan, numpy.nan, 4.0]))
+	assert not failed.any()
+
+
+def test_parse_temperature_strings_errors():
+	with pytest.raises(ValueError, match="could not convert string to float: 'abc'"):
+		parse_temperature_strings(["21.5 ℃", "abc", "20"])
+
+	with pytest.raises(ValueError, match="could not convert string to float"):
+		to_temperature(["21.5 ℃", "abc", "20"])
+
+	with pytest.raises(ValueError, match="'errors' must be either 'raise' or 'coerce', not 'ignore'"):
+		parse_temperature_strings(["21.5 ℃"], errors="ignore")  # type: ignore
+
+	result, failed = parse_temperature_strings(["21.5 ℃", "abc", "", "20"], errors="coerce")
+	npt.assert_array_equal(result, numpy.array([21.5, numpy.nan, numpy.nan, 20.0]))
+	npt.assert_array_equal(failed, numpy.array([False, True, True, False]))
+
+	result = to_temperature(["21.5 ℃", "abc", "20"], errors="coerce")
+	npt.assert_array_equal(result.isna(), numpy.array([False, True, False]))
+
+
+def test_parse_temperature_strings_empty():
+	result, failed = parse_temperature_strings(numpy.array([], dtype=str))
+	assert result.dtype == numpy.float64
+	assert len(result) == len(failed) == 0
+
+
+@pytest.mark.parametrize(
+		"values",
+		[
+				pandas.Series(["1 ℃", "2°C", None]),
+				pandas.Index(["1 ℃", "2°C", None]),
+				pandas.Series(["1", "2", None], dtype="string"),
+				pandas.Series([1, 2, None], dtype="Int64"),
+				pandas.Series(TemperatureArray([1, 2, numpy.nan])),
+				]
+		)
+def test_to_temperature_series(values):
+	result = to_temperature(values)
+	npt.assert_array_equal(result.data, [1, 2, numpy.nan])
+
+
+def test_to_temperature_series_vectorised(monkeypatch):
+	calls = []
+	monkeypatch.setattr(si_unit_pandas.temperature, "_to_int_pairs", calls.append)
+
+	result = to_temperature(pandas.Series(["1 C", "unknown"]), errors="coerce")
+	npt.assert_array_equal(result.data, [1, numpy.nan])
+	assert not calls
+
+
+def test_to_temperature_mixed_strings():
+	npt.assert_array_equal(to_temperature(["5 ℃", 3.0, None]).data, [5, 3, numpy.nan])
+	npt.assert_array_equal(to_temperature(["abc", 3.0], errors="coerce").data, [numpy.nan, 3])
+	npt.assert_allclose(to_temperature(["50 ℉", 50, Fahrenheit(50)], unit='F').data, [10, 10, 10])
+	npt.assert_array_equal(to_temperature("5 ℃").data, [5])
+
+	with pytest.raises(ValueError, match="could not convert string to float: 'abc'"):
+		to_temperature(["abc", 3.0])
+
+
+def test_parse_temperature_strings_long_value():
+	values = numpy.array(["1 ℃", "x" * 100_000, "nan", None], dtype=object)
+	result, failed = parse_temperature_strings(values, errors="coerce")
+	npt.assert_array_equal(result, [1, numpy.nan, numpy.nan, numpy.nan])
+	assert failed.tolist() == [False, True, False, False]
+
+
+@pytest.mark.parametrize("values", [
+		numpy.array([32.0, 212.0, -40.0]),
+		numpy.array([32, 212, -40]),
+		numpy.array([32, 212, -40], dtype=numpy.float32),
+		[32, 212, -40],
+		[32.0, 212, -40.0],
+		["32", "212 ℉", "-40°F"],
+		[Fahrenheit(32), Fahrenheit(212), Fahrenheit(-40)],
+		])
+def test_from_fahrenheit(values):
+	expected = TemperatureArray([0.0, 100.0, -40.0])
+
+	result = TemperatureArray.from_fahrenheit(values)
+	assert isinstance(result, TemperatureArray)
+	npt.assert_allclose(result.data, expected.data)
+
+	result = to_temperature(values, unit='F')
+	npt.assert_allclose(result.data, expected.data)
+
+
+def test_from_fahrenheit_does_not_modify_input():
+	values = numpy.array([32.0, 212.0])
+	TemperatureArray.from_fahrenheit(values)
+	npt.assert_array_equal(values, numpy.array([32.0, 212.0]))
+
+
+def test_to_temperature_unit_mixed():
+	result = to_temperature([Celsius(10), Fahrenheit(50), 50], unit='F')
+	npt.assert_allclose(result.data, numpy.array([10.0, 10.0, 10.0]))
+
+	result = to_temperature([Celsius(10), Fahrenheit(50), 10])
+	npt.assert_allclose(result.data, numpy.array([10.0, 10.0, 10.0]))
+
+	npt.assert_allclose(to_temperature(Fahrenheit(50)).data, numpy.array([10.0]))
+
+
+def test_to_temperature_unit_invalid():
+	with pytest.raises(ValueError, match="Unknown temperature unit 'K'"):
+		to_temperature([1, 2, 3], unit='K')  # type: ignore
+
+
+@pytest.mark.parametrize("values", [
+		[1, 3],
+		(1, 3),
+		{1, 3},
+		numpy.array([3, 1, 3]),
+		["1", "3 ℃"],
+		[Celsius(1), Celsius(3)],
+		TemperatureArray([1, 3]),
+		])
+def test_isin(values):
+	arr = TemperatureArray([0, 1, 2, 3, numpy.nan])
+	result = arr.isin(values)
+	assert_numpy_array_equal(result, numpy.array([False, True, False, True, False]))
+
+
+def test_isin_scalar():
+	arr = TemperatureArray([0, 1, 2, 3])
+	assert_numpy_array_equal(arr.isin(2), numpy.array([False, False, True, False]))
+	assert_numpy_array_equal(arr.isin("2 ℃"), numpy.array([False, False, True, False]))
+	assert_numpy_array_equal(arr.isin([]), numpy.array([False, False, False, False]))
+	assert_numpy_array_equal(arr.isin(Fahrenheit(32)), numpy.array([True, False, False, False]))
+
+
+def test_isin_nan():
+	arr = TemperatureArray([0, numpy.nan, 2])
+	assert_numpy_array_equal(arr.isin([numpy.nan]), numpy.array([False, True, False]))
+	assert_numpy_array_equal(arr.isin([0, numpy.nan]), numpy.array([True, True, False]))
+	assert_numpy_array_equal(arr.isin([0]), numpy.array([True, False, False]))
+
+
+def test_isin_tolerance():
+	arr = TemperatureArray([0, 0.95, 2.2, 5, 10.5, numpy.nan])
+	result = arr.isin([1, 10], tolerance=0.1)
+	assert_numpy_array_equal(result, numpy.array([False, True, False, False, False, False]))
+
+	result = arr.isin([1, 10], tolerance=1)
+	assert_numpy_array_equal(result, numpy.array([True, True, False, False, True, False]))
+
+	with pytest.raises(ValueError, match="'tolerance' must be a non-negative number"):
+		arr.isin([1], tolerance=-1)
+
+
+def test_isin_series():
+	ser = pandas.Series(TemperatureArray([0, 1, 2, 3]))
+	result = ser.isin([1, 2])
+	expected = pandas.Series([False, True, True, False])
+	pandas.testing.assert_series_equal(result, expected)
+
+
+def test_buffer_append():
+	buffer = TemperatureBuffer(capacity=2)
+	assert len(buffer) == 0
+	assert buffer.capacity == 2
+
+	for value in [1, 2.5, numpy.float64(3), "4 ℃", Celsius(5), Fahrenheit(212)]:
+		buffer.append(value)
+
+	assert len(buffer) == 6
+	assert buffer.capacity == 8
+	npt.assert_array_equal(buffer.view().data, numpy.array([1, 2.5, 3, 4, 5, 100]))
+
+
+def test_buffer_extend():
+	buffer = TemperatureBuffer(capacity=4)
+	buffer.extend([1, 2, 3])
+	buffer.extend(TemperatureArray([4, 5]))
+	buffer.extend(["6 ℃", "7 ℃"])
+	buffer.extend([])
+
+	assert len(buffer) == 7
+	assert buffer.capacity == 8
+	assert buffer.view().equals(TemperatureArray([1, 2, 3, 4, 5, 6, 7]))
+
+	buffer.extend(numpy.arange(100))
+	assert len(buffer) == 107
+	assert buffer.capacity == 107
+
+
+def test_buffer_view():
+	buffer = TemperatureBuffer()
+	buffer.extend([1, 2, 3])
+
+	view = buffer.view()
+	assert isinstance(view, TemperatureArray)
+	assert numpy.shares_memory(view.data, buffer._data)
+
+	buffer.append(4)
+	assert len(view) == 3
+
+
+def test_buffer_freeze():
+	buffer = TemperatureBuffer(capacity=4)
+	buffer.extend([1, 2, 3])
+	data = buffer._data
+
+	result = buffer.freeze()
+	assert isinstance(result, TemperatureArray)
+	assert result.equals(TemperatureArray([1, 2, 3]))
+	assert numpy.shares_memory(result.data, data)
+
+	assert len(buffer) == 0
+	assert buffer.capacity == 4
+	buffer.extend([10, 20, 30])
+	assert result.equals(TemperatureArray([1, 2, 3]))
+
+	series = pandas.Series(result)
+	assert numpy.shares_memory(series.values.data, data)
+
+
+def test_buffer_invalid_capacity():
+	with pytest.raises(ValueError, match="'capacity' must be at least 1."):
+		TemperatureBuffer(capacity=0)
+
+
+def test_argsort():
+	arr = TemperatureArray([3, 1, numpy.nan, 2, 1])
+
+	assert_numpy_array_equal(arr.argsort(kind="stable"), numpy.array([1, 4, 3, 0, 2]))
+	assert_numpy_array_equal(arr.argsort(ascending=False, kind="stable"), numpy.array([0, 3, 1, 4, 2]))
+	assert_numpy_array_equal(arr.argsort(kind="stable", na_position="first"), numpy.array([2, 1, 4, 3, 0]))
+	assert_numpy_array_equal(
+			arr.argsort(ascending=False, kind="mergesort", na_position="first"),
+			numpy.array([2, 0, 3, 1, 4]),
+			)
+
+	with pytest.raises(ValueError, match="'na_position' must be either 'first' or 'last', not 'middle'"):
+		arr.argsort(na_position="middle")  # type: ignore
+
+
+@given(lists(integers(min_value=-100, max_value=100)))
+def test_argsort_matches_float(ints):
+	arr = TemperatureArray(ints)
+	expected = numpy.asarray(ints, dtype=float)
+
+	for ascending in (True, False):
+		result = arr.argsort(ascending=ascending, kind="stable")
+		expected_order = pandas.Series(expected).sort_values(ascending=ascending, kind="mergesort").index
+		assert_numpy_array_equal(result, numpy.asarray(expected_order, dtype=result.dtype))
+
+
+def test_values_for_argsort():
+	arr = TemperatureArray([3, 1, 2])
+	assert arr._values_for_argsort() is arr.data
+
+	values, na_value = arr._values_for_factorize()
+	assert values is arr.data
+	assert numpy.isnan(na_value)
+
+
+def test_factorize_nan():
+	arr = si_unit_pandas.TemperatureArray([3, numpy.nan, 1, 3, numpy.nan, 2])
+	codes, uniques = arr.factorize()
+
+	assert_numpy_array_equal(codes, numpy.array([0, -1, 1, 0, -1, 2]))
+	assert isinstance(uniques, si_unit_pandas.TemperatureArray)
+	assert uniques.equals(si_unit_pandas.TemperatureArray([3, 1, 2]))
+
+	codes, uniques = arr.factorize(na_sentinel=-2)
+	assert_numpy_array_equal(codes, numpy.array([0, -2, 1, 0, -2, 2]))
+
+	codes, uniques = pandas.factorize(arr)
+	assert_numpy_array_equal(codes, numpy.array([0, -1, 1, 0, -1, 2]))
+	assert uniques.equals(si_unit_pandas.TemperatureArray([3, 1, 2]))
+
+
+def test_factorize_keep_na():
+	arr = si_unit_pandas.TemperatureArray([1, numpy.nan, 1, 2])
+
+	for kwargs in [{"use_na_sentinel": False}, {"na_sentinel": None}]:
+		codes, uniques = arr.factorize(**kwargs)
+		assert_numpy_array_equal(codes, numpy.array([0, 1, 0, 2]))
+		assert uniques.isna().tolist() == [False, True, False]
+
+	if tuple(map(int, pandas.__version__.split('.')[:2])) >= (1, 5):
+		codes, uniques = pandas.factorize(pandas.Series(arr), use_na_sentinel=False)
+		assert_numpy_array_equal(codes, numpy.array([0, 1, 0, 2]))
+		npt.assert_array_equal(uniques.array.data, [1, numpy.nan, 2])
+
+
+def test_unique_nan():
+	arr = si_unit_pandas.TemperatureArray([3, numpy.nan, 1, 3, numpy.nan, 2])
+	result = arr.unique()
+	assert isinstance(result, si_unit_pandas.TemperatureArray)
+	npt.assert_array_equal(result.data, numpy.array([3, numpy.nan, 1, 2]))
+
+
+def test_scalar_slots():
+	value = Celsius(21.5)
+	assert not hasattr(value, "__dict__")
+	assert not hasattr(Fahrenheit(70), "__dict__")
+
+	with pytest.raises(AttributeError):
+		value.unit = 'C'  # type: ignore
+
+
+def test_scalar_from_float():
+	value = Celsius._from_float(21.5)
+	assert type(value) is Celsius
+	assert value == Celsius("21.5 ℃")
+	assert type(TemperatureArray([1, 2])[0]) is Celsius
+
+
+def test_scalar_arithmetic():
+	value = Celsius(20)
+
+	assert type(value + 1) is Celsius and value + 1 == 21
+	assert type(1 - value) is Celsius and 1 - value == -19
+	assert divmod(value, 3) == (Celsius(6), Celsius(2))
+	assert -value == -20 and abs(-value) == 20
+	assert value < Celsius(21) and value == 20.0 and value != Celsius(19)
+
+	with pytest.raises(TypeError, match="unsupported operand"):
+		value + Celsius(1)  # pylint: disable=expression-not-assigned
+
+	assert type(value**2) is Celsius and value**2 == 400
+	assert type(2**Celsius(3)) is Celsius and 2**Celsius(3) == 8
+
+	with pytest.raises(TypeError, match="unsupported operand"):
+		Celsius(2)**Celsius(2)  # pylint: disable=expression-not-assigned
+
+
+@pytest.mark.parametrize("value", [Celsius(1.5), Fahrenheit(-40), Celsius(numpy.nan)])
+def test_pickle_scalar(value):
+	result = pickle.loads(pickle.dumps(value))
+	assert type(result) is type(value)
+	assert float(result) == float(value) or numpy.isnan(float(result))
+
+
+def test_pickle_array():
+	arr = TemperatureArray([1, numpy.nan, 3])
+
+	result = pickle.loads(pickle.dumps(arr))
+	assert isinstance(result, TemperatureArray)
+	npt.assert_array_equal(result.data, arr.data)
+
+	result = pickle.loads(pickle.dumps(pandas.Series(arr)))
+	assert result.values.equals(arr)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="Pickle protocol 5 requires Python 3.8")
+def test_pickle_array_out_of_band():
+	arr = TemperatureArray(numpy.arange(1000.0))
+
+	buffers = []
+	data = pickle.dumps(arr, protocol=5, buffer_callback=buffers.append)
+	assert len(buffers) == 1
+	assert len(data) < arr.data.nbytes
+
+	result = pickle.loads(data, buffers=buffers)
+	assert numpy.shares_memory(result.data, arr.data)
+
+
+def test_buffer_precision():
+	buffer = TemperatureBuffer(dtype="celsius[float32]")
+	buffer.append(1)
+	buffer.extend([2, Fahrenheit(50)])
+
+	result = buffer.freeze()
+	assert result.dtype == si_unit_pandas.CelsiusType("float32")
+	assert result.data.tolist() == [1, 2, 10]
+
+
+def test_display_unit():
+	arr = TemperatureArray([0, 100, numpy.nan])
+	result = arr.astype("temperature[F]", copy=False)
+
+	assert result.dtype == si_unit_pandas.TemperatureType('F')
+	assert result.data is arr.data
+	assert result.astype("temperature[F]", copy=False) is result
+	assert not numpy.shares_memory(arr.astype("temperature[F]").data, arr.data)
+
+	assert type(result[1]) is Fahrenheit and result[1] == 212
+	assert result[:2].dtype == "temperature[F]"
+	assert result.tolist()[:2] == [32, 212]
+	assert list(result)[:2] == [Fahrenheit(32), Fahrenheit(212)]
+	assert repr(result) == "TemperatureArray([32.0\u205f℉, 212.0\u205f℉, nan\u205f℉])"
+	assert result.astype(float)[:2].tolist() == [32, 212]
+
+	celsius = result.astype("celsius", copy=False)
+	assert celsius.dtype == "celsius"
+	assert celsius.data is arr.data
+
+
+def test_display_unit_values():
+	arr = TemperatureArray([32, 212, numpy.nan], dtype="temperature[F]")
+	npt.assert_array_equal(arr.data, [0, 100, numpy.nan])
+
+	assert_numpy_array_equal(arr > 100, numpy.array([False, True, False]))
+	assert_numpy_array_equal(arr.isin([212]), numpy.array([False, True, False]))
+	npt.assert_array_almost_equal(arr.clip(50, 100).data, [10, 37.777778, numpy.nan])
+
+	arr[0] = 50
+	assert arr.data[0] == 10
+
+	result = pickle.loads(pickle.dumps(arr))
+	assert result.dtype == "temperature[F]"
+	npt.assert_array_equal(result.data, arr.data)
+
+	ser = pandas.Series(arr)
+	assert ser.dtype == "temperature[F]"
+	assert ser.max() == Fahrenheit(212)
+	assert pandas.concat([ser, ser]).dtype == "temperature[F]"
+	assert pandas.concat([ser, pandas.Series(TemperatureArray([1]))]).dtype == "celsius"
+
+
+def test_display_unit_reductions():
+	ser = pandas.Series(to_temperature([0, 10, 20]).astype("temperature[F]"))
+
+	assert ser.sum() == Fahrenheit(150)
+	assert ser.mean() == Fahrenheit(50)
+	assert ser.median() == Fahrenheit(50)
+	assert ser.std() == pytest.approx(18)
+	assert ser.var() == pytest.approx(324)
+	assert ser.iloc[:0].sum() == Fahrenheit(0)
+
+
+def test_display_unit_arithmetic():
+	arr = to_temperature([0, 10, 20]).astype("temperature[F]")
+
+	result = arr + 1
+	assert result.dtype == "temperature[F]"
+	npt.assert_array_almost_equal(result.to_numpy(), [33, 51, 69])
+
+	npt.assert_array_almost_equal((-arr).to_numpy(), [-32, -50, -68])
+	npt.assert_array_almost_equal((arr * 2).to_numpy(), [64, 100, 136])
+	npt.assert_array_almost_equal(arr - arr, [0, 0, 0])
+	npt.assert_array_almost_equal(arr - to_temperature([0, 0, 0]), [0, 18, 36])
+
+	arr += 1
+	npt.assert_array_almost_equal(arr.to_numpy(), [33, 51, 69])
+
+
+def test_display_unit_take():
+	ser = pandas.Series(TemperatureArray([32, 212], dtype="temperature[F]"))
+
+	result = ser.reindex([0, 5], fill_value=50)
+	assert result.dtype == "temperature[F]"
+	npt.assert_array_almost_equal(result.array.data, [0, 10])
+	assert result[5] == Fahrenheit(50)
+
+	result = ser.array.take([-1, 1], allow_fill=True, fill_value=Celsius(10))
+	npt.assert_array_almost_equal(result.data, [10, 100])
+
+
+def test_display_unit_isin_tolerance():
+	arr = TemperatureArray([32, 33.5, 35, numpy.nan], dtype="temperature[F]")
+
+	result = arr.isin([32], tolerance=2)
+	assert_numpy_array_equal(result, numpy.array([True, True, False, False]))
+
+
+def test_display_unit_from_buffer(tmp_path):
+	data = numpy.array([0.0, 100.0])
+
+	result = TemperatureArray.from_buffer(data, dtype="temperature[F]")
+	assert result.dtype == "temperature[F]"
+	assert result.data is data
+	assert result.tolist() == [32, 212]
+
+	result.to_file(tmp_path / "values.bin")
+	result = TemperatureArray.from_memmap(tmp_path / "values.bin", dtype="temperature[F]")
+	assert result.dtype == "temperature[F]"
+	assert result.tolist() == [32, 212]
+
+
+def test_display_unit_buffer():
+	buffer = TemperatureBuffer(dtype="temperature[F]")
+	buffer.append(212)
+	buffer.append("50")
+	buffer.extend([32, Celsius(20)])
+
+	result = buffer.view()
+	assert result.dtype == "temperature[F]"
+	npt.assert_array_almost_equal(result.data, [100, 10, 0, 20])
+
+	result = buffer.freeze()
+	assert result.dtype == "temperature[F]"
+	npt.assert_array_almost_equal(result.to_numpy(), [212, 50, 32, 68])
@@ -0,0 +1,83 @@
+# 3rd party
+import numpy  # type: ignore
+import numpy.testing as npt  # type: ignore
+import pytest
+
+# this package
+from si_unit_pandas.units import AffineTransform, UnitRegistry, registry
+
+
+def test_affine_transform():
+	transform = AffineTransform(9 / 5, 32)
+	assert transform(100) == 212
+	assert transform.then(transform.inverse()) == (1, 0)
+	assert transform.then(AffineTransform(2)) == AffineTransform(3.6, 64)
+	assert AffineTransform(1.0).is_identity
+	assert not transform.is_identity
+
+
+def test_affine_transform_array():
+	values = numpy.array([0, 100, numpy.nan], dtype=numpy.float32)
+	transform = AffineTransform(9 / 5, 32)
+
+	result = transform(values)
+	assert result.dtype == numpy.float32
+	npt.assert_array_equal(result, [32, 212, numpy.nan])
+	npt.assert_array_equal(values, [0, 100, numpy.nan])
+
+	assert transform(numpy.array([0, 100])).dtype == numpy.float64
+	assert transform(values, dtype=numpy.float64).dtype == numpy.float64
+
+	assert transform(values, out=values) is values
+	npt.assert_array_equal(values, [32, 212, numpy.nan])
+
+
+def test_registry():
+	assert {'C', 'F', 'K', 'R'} <= set(registry.units)
+	assert 'F' in registry
+	assert registry.path('F', 'R') == ['F', 'C', 'K', 'R']
+	assert registry.path('C', 'C') == ['C']
+	assert registry.transform('C', 'C').is_identity
+
+	assert registry.convert(212, 'F', 'C') == 100
+	assert registry.convert(0, 'C', 'F') == 32
+	assert registry.convert(-40, 'F', 'C') == -40
+	assert registry.convert(0, 'K', 'C') == -273.15
+	assert registry.convert(491.67, 'R', 'F') == pytest.approx(32)
+	npt.assert_array_almost_equal(registry.convert(numpy.array([32, 212]), 'F', 'K'), [273.15, 373.15])
+
+	# The composed transform is cached.
+	assert registry.transform('F', 'R') is registry.transform('F', 'R')
+
+
+def test_registry_extend():
+	units = UnitRegistry()
+	units.add_conversion('C', 'K', offset=273.15)
+	assert units.transform('C', 'K') == (1, 273.15)
+	assert len(units) == 2
+
+	with pytest.raises(ValueError, match="Unknown unit 'R'"):
+		units.transform('C', 'R')
+
+	units.add_conversion('K', 'R', scale=9 / 5)
+	assert units.transform('C', 'R') == pytest.approx((1.8, 491.67))
+	assert units.transform('R', 'C').then(units.transform('C', 'R')) == pytest.approx((1, 0))
+
+	units.add_conversion('m', "km", scale=1e-3)
+	with pytest.raises(ValueError, match="Cannot convert from 'C' to 'm'"):
+		units.transform('C', 'm')
+
+	with pytest.raises(ValueError, match="cannot be zero"):
+		units.add_conversion('C', 'X', scale=0)
+	with pytest.raises(ValueError, match="to itself"):
+		units.add_conversion('C', 'C')
+
+
+def test_registry_cache_cleared():
+	units = UnitRegistry()
+	units.add_conversion('a', 'b', scale=2)
+	units.add_conversion('b', 'c', scale=3)
+	assert units.transform('a', 'c') == (6, 0)
+
+	units.add_conversion('a', 'c', scale=5)
+	assert units.transform('a', 'c') == (5, 0)